@@ -1,41 +1,53 @@
 from flask import Flask
 from flask_login import LoginManager
-from flask_migrate import Migrate
 
+from .application.analytics import analytics_cli
+from .application.blobs import blobs_cli
+from .application.imports import imports_cli
+from .application.letters import letters_cli
+from .application.uploads import UploadRequest
 from .application.views import *
+from .authentication.principal import load_principal
+from .authentication.tokens import load_principal_from_request
 from .authentication.urls import register_auth_blueprint
 from .authentication.views import *  # pyright: ignore
-from .config import dev_config
-from .extensions import api, db
+from .config import config_from_env
+from .database import configure_engine, engine_options
+from .extensions import api, bootstrap_command, db, migrate_cli
+from .metrics import Metrics
 
 
 def create_app(config=None):
     """Application factory function."""
     app = Flask(__name__)
-    config = config or dev_config
-    app.config.from_object(config)
+    app.request_class = UploadRequest
+    app.config.from_object(config or config_from_env())
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config))
 
     # Initialize extensions
     db.init_app(app)
+    with app.app_context():
+        configure_engine(db.engine, app.config)
     api.init_app(app)
-    Migrate(app, db)
     login_manager = LoginManager(app)
 
-    @login_manager.user_loader
-    def load_user(user_id):
-        from .authentication.models import User
-
-        return db.session.get(User, int(user_id))
-
-    with app.app_context():
-        if config:
-            db.create_all()
-        from .extensions import create_admin
+    # Loads a cached id/role principal rather than the full User row.
+    login_manager.user_loader(load_principal)
+    # Bearer access tokens are verified locally, also without a query.
+    login_manager.request_loader(load_principal_from_request)
 
-        create_admin()
+    if app.config["METRICS_ENABLED"]:
+        Metrics(app.config["METRICS_N_PLUS_ONE_THRESHOLD"]).init_app(app)
 
     # Register blueprints (authentication routes, etc.)
     register_auth_blueprint(app, api)
+    app.cli.add_command(letters_cli)
+    app.cli.add_command(blobs_cli)
+    app.cli.add_command(analytics_cli)
+    app.cli.add_command(imports_cli)
+    # Schema and admin seeding are a one-shot step, not part of every boot.
+    app.cli.add_command(bootstrap_command)
+    app.cli.add_command(migrate_cli)
 
     # A simple home route
     @app.route("/hello")
@@ -0,0 +1,141 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.application.models import ApplicationAcceptanceSettings
+from app.extensions import db
+from app.validation import today as current_date
+
+_STALE_FLAG = "acceptance_settings_stale"
+
+
+@dataclass(frozen=True)
+class AcceptanceWindow:
+    """Immutable snapshot of the acceptance settings row."""
+
+    is_enabled: bool = True
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    # Row version the snapshot was read at; None when there is no row.
+    version: Optional[int] = None
+
+    def is_open(self, today: date) -> bool:
+        """Whether submissions are accepted on ``today``; both ends inclusive."""
+        if not self.is_enabled:
+            return False
+        if self.start_date is not None and today < self.start_date:
+            return False
+        if self.end_date is not None and today > self.end_date:
+            return False
+        return True
+
+
+def load_acceptance_window() -> AcceptanceWindow:
+    settings = ApplicationAcceptanceSettings
+    row = db.session.execute(
+        select(
+            settings.is_enabled,
+            settings.start_date,
+            settings.end_date,
+            settings.version,
+        )
+        .order_by(settings.id)
+        .limit(1)
+    ).first()
+    if row is None:
+        # Nothing configured yet: accept submissions, as before.
+        return AcceptanceWindow()
+    return AcceptanceWindow(
+        is_enabled=row.is_enabled is not False,
+        start_date=row.start_date,
+        end_date=row.end_date,
+        version=row.version,
+    )
+
+
+class AcceptanceSettingsCache:
+    """
+    Process-local :class:`AcceptanceWindow`, so request handlers check the
+    window without a query.
+
+    A commit in this process that changes the settings makes the next read
+    reload at once. Changes made by other processes are noticed by
+    re-reading the row at most every ``check_interval`` seconds; the
+    snapshot object is only replaced when the row's version changed.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._checked_at < self.check_interval
+        )
+
+    def get(self) -> AcceptanceWindow:
+        if self._fresh():
+            return self._snapshot
+        with self._lock:
+            # Another thread may have refreshed while this one waited.
+            if self._fresh():
+                return self._snapshot
+            generation = self._generation
+            window = load_acceptance_window()
+            if self._snapshot is None or self._snapshot.version != window.version:
+                self._snapshot = window
+            # Do not trust a row read before a concurrent invalidation.
+            if generation == self._generation:
+                self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._checked_at = 0.0
+
+
+def get_acceptance_cache() -> AcceptanceSettingsCache:
+    if "acceptance_settings" not in current_app.extensions:
+        current_app.extensions["acceptance_settings"] = AcceptanceSettingsCache(
+            current_app.config["ACCEPTANCE_CHECK_INTERVAL"]
+        )
+    return current_app.extensions["acceptance_settings"]
+
+
+def acceptance_window() -> AcceptanceWindow:
+    """The current acceptance settings, from the process-local snapshot."""
+    return get_acceptance_cache().get()
+
+
+def is_accepting(today: Optional[date] = None) -> bool:
+    return acceptance_window().is_open(today or current_date())
+
+
+@event.listens_for(ApplicationAcceptanceSettings, "after_insert")
+@event.listens_for(ApplicationAcceptanceSettings, "after_update")
+@event.listens_for(ApplicationAcceptanceSettings, "after_delete")
+def _settings_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info[_STALE_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop(_STALE_FLAG, False) and has_app_context():
+        get_acceptance_cache().invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_STALE_FLAG, None)
@@ -1,9 +1,90 @@
 from datetime import date
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+FOOTER_NOTE = (
+    "This is an auto-generated admission letter. "
+    "For any queries, please contact the admissions office."
+)
 
-from app.config import FileConfig
+
+class LetterTemplate:
+    """
+    Fixed layout of the admission letter.
+
+    Everything that does not depend on the student (page geometry, font
+    lookups, section labels) is resolved once here, so a process rendering
+    many letters only pays for the per-student text and the PDF write.
+
+    reportlab is imported here rather than at module level, so web workers
+    that never render a letter do not load it.
+    """
+
+    def __init__(self, pagesize=None):
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfbase.pdfmetrics import getFont
+        from reportlab.pdfgen import canvas
+
+        self._canvas = canvas.Canvas
+        self.pagesize = pagesize or letter
+        self.width, self.height = self.pagesize
+        # Resolve the fonts up front so a missing font fails the batch early.
+        for name in ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique"):
+            getFont(name)
+        self.header_x = self.width / 2.0
+        self.header_y = self.height - 80
+        self.rule = (50, self.height - 90, self.width - 50, self.height - 90)
+        self.body_origin = (50, self.height - 130)
+
+    def render(self, pdf_file, student_info, admission_details):
+        # pdf_file may be a path or a writable binary file object.
+        c = self._canvas(pdf_file, pagesize=self.pagesize)
+
+        # Draw header
+        c.setFont("Helvetica-Bold", 22)
+        c.drawCentredString(self.header_x, self.header_y, "Admission Letter")
+
+        # Draw a line under the header for separation
+        c.setLineWidth(2)
+        c.line(*self.rule)
+
+        # Student Information Section
+        c.setFont("Helvetica", 12)
+        text = c.beginText(*self.body_origin)
+        text.setLeading(18)  # set the line spacing
+
+        text.textLine("Student Information:")
+        text.textLine("-------------------------")
+        text.textLine(f"Name: {student_info.get('name', 'N/A')}")
+        text.textLine(f"Email: {student_info.get('email', 'N/A')}")
+        text.textLine(f"Phone: {student_info.get('phone', 'N/A')}")
+        text.textLine("")  # Add a blank line
+
+        # Admission Details Section
+        text.textLine("Admission Details:")
+        text.textLine("-------------------------")
+        text.textLine(f"Course: {admission_details.get('course', 'N/A')}")
+        text.textLine(
+            f"Admission Date: {admission_details.get('admission_date', 'N/A')}"
+        )
+
+        c.drawText(text)
+
+        # Footer with a note
+        c.setFont("Helvetica-Oblique", 10)
+        c.drawString(50, 50, FOOTER_NOTE)
+
+        # Save the PDF file
+        c.save()
+
+
+_template = None
+
+
+def get_template() -> LetterTemplate:
+    """Return the process-wide letter template, building it on first use."""
+    global _template
+    if _template is None:
+        _template = LetterTemplate()
+    return _template
 
 
 def generate_admission_letter(pdf_path, student_info, admission_details):
@@ -26,63 +107,49 @@ def generate_admission_letter(pdf_path, student_info, admission_details):
                                   "admission_date": "2025-03-01",
                               }
     """
-    # Create a canvas object with letter size
-    c = canvas.Canvas(pdf_path, pagesize=letter)
-    width, height = letter
-
-    # Draw header
-    c.setFont("Helvetica-Bold", 22)
-    c.drawCentredString(width / 2.0, height - 80, "Admission Letter")
-
-    # Draw a line under the header for separation
-    c.setLineWidth(2)
-    c.line(50, height - 90, width - 50, height - 90)
-
-    # Student Information Section
-    c.setFont("Helvetica", 12)
-    text = c.beginText(50, height - 130)
-    text.setLeading(18)  # set the line spacing
-
-    text.textLine("Student Information:")
-    text.textLine("-------------------------")
-    text.textLine(f"Name: {student_info.get('name', 'N/A')}")
-    text.textLine(f"Email: {student_info.get('email', 'N/A')}")
-    text.textLine(f"Phone: {student_info.get('phone', 'N/A')}")
-    text.textLine("")  # Add a blank line
-
-    # Admission Details Section
-    text.textLine("Admission Details:")
-    text.textLine("-------------------------")
-    text.textLine(f"Course: {admission_details.get('course', 'N/A')}")
-    text.textLine(f"Admission Date: {admission_details.get('admission_date', 'N/A')}")
-
-    c.drawText(text)
-
-    # Footer with a note
-    c.setFont("Helvetica-Oblique", 10)
-    c.drawString(
-        50,
-        50,
-        "This is an auto-generated admission letter. For any queries, please contact the admissions office.",
-    )
-
-    # Save the PDF file
-    c.save()
-
-
-def generate_letter(app_obj):
-    admission_details = {
-        "course": app_obj.preferred_course,
-        "admission_date": date.today().strftime("%Y-%m-%d"),
-    }
-    pdf_path = f"{app_obj.id}_admission_letter.pdf"
-    file_path = FileConfig.ADMISSION_LETTER / pdf_path
-    # Generate the PDF
-    student_info = {
-        "name": app_obj.full_name,
-        "email": app_obj.email,
-        "phone": app_obj.phone_number,
+    get_template().render(pdf_path, student_info, admission_details)
+
+
+def letter_payload(app_obj, course_name=None):
+    """
+    Collect everything needed to render a letter as plain data, so the
+    render can run in another process without touching the database.
+    """
+    if course_name is None:
+        course_name = app_obj.preferred_course.course_name
+    return {
+        "key": f"{app_obj.id}_admission_letter.pdf",
+        "student_info": {
+            "name": app_obj.full_name,
+            "email": app_obj.email,
+            "phone": app_obj.phone_number,
+        },
+        "admission_details": {
+            "course": course_name,
+            "admission_date": date.today().strftime("%Y-%m-%d"),
+        },
     }
 
-    generate_admission_letter(str(file_path), student_info, admission_details)
-    return str(file_path)
+
+def render_letters(payloads, storage):
+    """
+    Render a batch of payloads with the shared template into ``storage``.
+
+    A failing letter does not abort the rest of the batch.
+
+    :return: One ``(key, error)`` tuple per payload, in order; exactly one
+             of the two is None.
+    """
+    template = get_template()
+    results = []
+    for payload in payloads:
+        try:
+            with storage.open_write(payload["key"]) as f:
+                template.render(
+                    f, payload["student_info"], payload["admission_details"]
+                )
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}"))
+        else:
+            results.append((payload["key"], None))
+    return results
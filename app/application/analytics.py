@@ -0,0 +1,215 @@
+import enum
+from collections import Counter
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.application.models import (Application, ApplicationCount,
+                                    ApplicationStatus, PreferredCourse)
+from app.extensions import db
+
+# Dashboard dimension -> Application attribute it counts by.
+DIMENSIONS = {
+    "status": "status",
+    "course": "preferred_course_id",
+    "nationality": "nationality",
+    "qualification": "highest_qualification",
+}
+
+_UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def bucket_key(value) -> str:
+    """Counter bucket for an attribute value; enums by name, as stored."""
+    if isinstance(value, enum.Enum):
+        return value.name
+    return str(value)
+
+
+def adjust_counts(connection, deltas) -> None:
+    """
+    Add ``deltas`` (a mapping of ``(dimension, bucket)`` to an amount) to
+    the counters, creating missing buckets, with one statement where the
+    database supports upserts.
+    """
+    rows = [
+        {"dimension": dimension, "bucket": bucket, "count": amount}
+        for (dimension, bucket), amount in sorted(deltas.items())
+        if amount
+    ]
+    if not rows:
+        return
+    dialect_insert = _UPSERT_DIALECTS.get(connection.dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(ApplicationCount).values(rows)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ApplicationCount.dimension, ApplicationCount.bucket],
+                set_={"count": ApplicationCount.count + stmt.excluded["count"]},
+            )
+        )
+        return
+    for row in rows:
+        result = connection.execute(
+            update(ApplicationCount)
+            .where(
+                ApplicationCount.dimension == row["dimension"],
+                ApplicationCount.bucket == row["bucket"],
+            )
+            .values(count=ApplicationCount.count + row["count"])
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(ApplicationCount).values(**row))
+
+
+def record_status_change(old_status, new_status, count: int = 1) -> None:
+    """
+    Move ``count`` applications between status buckets in the session's
+    transaction. For status changes made with Core UPDATEs, which bypass
+    the mapper events below.
+    """
+    adjust_counts(
+        db.session.connection(),
+        {
+            ("status", bucket_key(old_status)): -count,
+            ("status", bucket_key(new_status)): count,
+        },
+    )
+
+
+def record_new_applications(rows) -> None:
+    """
+    Count applications inserted with a Core INSERT, given the inserted
+    ``rows`` as dicts, in the session's transaction.
+    """
+    adjust_counts(
+        db.session.connection(),
+        Counter(
+            (dimension, bucket_key(row[attr]))
+            for row in rows
+            for dimension, attr in DIMENSIONS.items()
+        ),
+    )
+
+
+def _buckets(target, amount) -> Counter:
+    return Counter(
+        {
+            (dimension, bucket_key(getattr(target, attr))): amount
+            for dimension, attr in DIMENSIONS.items()
+        }
+    )
+
+
+@event.listens_for(Application, "after_insert")
+def _application_added(mapper, connection, target):
+    adjust_counts(connection, _buckets(target, 1))
+
+
+@event.listens_for(Application, "after_delete")
+def _application_removed(mapper, connection, target):
+    adjust_counts(connection, _buckets(target, -1))
+
+
+@event.listens_for(Application, "after_update")
+def _application_changed(mapper, connection, target):
+    state = inspect(target)
+    deltas = Counter()
+    for dimension, attr in DIMENSIONS.items():
+        history = state.attrs[attr].history
+        if not history.has_changes():
+            continue
+        for old in history.deleted:
+            deltas[(dimension, bucket_key(old))] -= 1
+        for new in history.added:
+            deltas[(dimension, bucket_key(new))] += 1
+    adjust_counts(connection, deltas)
+
+
+def _keep_old_value(target, value, oldvalue, initiator):
+    return value
+
+
+# Load the previous value when a tracked attribute is assigned, even if it
+# was expired, so the flush-time history always names the bucket it left.
+for _attr in DIMENSIONS.values():
+    event.listen(
+        getattr(Application, _attr), "set", _keep_old_value, active_history=True
+    )
+
+
+def dashboard() -> dict:
+    """
+    Application counts per status, course, nationality and qualification,
+    read from the counters; the cost grows with the number of buckets, not
+    of applications.
+    """
+    counter = ApplicationCount
+    rows = db.session.execute(
+        select(counter.dimension, counter.bucket, counter.count).where(
+            counter.count != 0
+        )
+    ).all()
+    counts = {dimension: {} for dimension in DIMENSIONS}
+    for row in rows:
+        counts[row.dimension][row.bucket] = row.count
+
+    course_names = dict(
+        db.session.execute(
+            select(PreferredCourse.id, PreferredCourse.course_name)
+        ).all()
+    )
+    courses = sorted((int(bucket), n) for bucket, n in counts["course"].items())
+    return {
+        "total": sum(counts["status"].values()),
+        "status": {
+            status.value: counts["status"].get(status.name, 0)
+            for status in ApplicationStatus
+        },
+        "course": [
+            {
+                "course_id": course_id,
+                "course_name": course_names.get(course_id),
+                "count": count,
+            }
+            for course_id, count in courses
+        ],
+        "nationality": dict(sorted(counts["nationality"].items())),
+        "qualification": dict(sorted(counts["qualification"].items())),
+    }
+
+
+def rebuild_counts() -> int:
+    """
+    Recompute every counter from the applications table with GROUP BY
+    queries, in one transaction.
+
+    The counters are deleted first: on databases with row locks that makes
+    concurrent writers wait for this transaction rather than adding to rows
+    about to be replaced.
+
+    :return: Number of buckets written.
+    """
+    db.session.execute(delete(ApplicationCount))
+    deltas = Counter()
+    for dimension, attr in DIMENSIONS.items():
+        column = getattr(Application, attr)
+        for value, count in db.session.execute(
+            select(column, func.count()).group_by(column)
+        ).all():
+            deltas[(dimension, bucket_key(value))] = count
+    adjust_counts(db.session.connection(), deltas)
+    db.session.commit()
+    return len(deltas)
+
+
+analytics_cli = AppGroup("analytics", help="Admin analytics commands.")
+
+
+@analytics_cli.command("rebuild")
+def rebuild():
+    """Recompute the application counters from scratch."""
+    buckets = rebuild_counts()
+    click.echo(f"Rebuilt {buckets} counter bucket(s).")
@@ -0,0 +1,167 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.application.models import Blob, Document
+from app.application.storage import get_storage
+from app.application.uploads import expire_upload_sessions
+from app.config import FileConfig
+from app.extensions import db
+
+# Orphaned blobs and abandoned temp files younger than this are kept, so an
+# upload that is still in flight is never collected underneath it.
+DEFAULT_GC_GRACE = 3600
+GC_BATCH_SIZE = 500
+
+_UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def blob_key(sha256: str) -> str:
+    """
+    Storage key of a blob. Two levels of two-hex-digit shards keep every
+    directory small (~15 entries per directory at a million blobs) when the
+    documents storage is a local directory.
+    """
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def store_upload(upload) -> str:
+    """
+    Place a finished :class:`HashingUpload` at its content address in the
+    documents storage.
+
+    If the same content is already stored the upload is discarded. Call
+    this after the referencing ``Document`` has been flushed: the blob row
+    is then locked by this transaction, so the garbage collector cannot
+    remove the object between the existence check and the commit.
+    """
+    storage = get_storage("documents")
+    key = blob_key(upload.sha256)
+    try:
+        if not storage.exists(key):
+            storage.put_file(key, upload.finish())
+    finally:
+        upload.close()
+    return key
+
+
+def _acquire(connection, sha256, size) -> None:
+    dialect_insert = _UPSERT_DIALECTS.get(connection.dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(Blob).values(sha256=sha256, size=size or 0, ref_count=1)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Blob.sha256],
+                set_={"ref_count": Blob.ref_count + 1, "updated_at": func.now()},
+            )
+        )
+        return
+    result = connection.execute(
+        update(Blob)
+        .where(Blob.sha256 == sha256)
+        .values(ref_count=Blob.ref_count + 1, updated_at=func.now())
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            insert(Blob).values(sha256=sha256, size=size or 0, ref_count=1)
+        )
+
+
+def _release(connection, sha256) -> None:
+    connection.execute(
+        update(Blob)
+        .where(Blob.sha256 == sha256)
+        .values(ref_count=Blob.ref_count - 1, updated_at=func.now())
+    )
+
+
+@event.listens_for(Document, "after_insert")
+def _acquire_blob(mapper, connection, target):
+    if target.sha256:
+        _acquire(connection, target.sha256, target.size)
+
+
+@event.listens_for(Document, "after_update")
+def _replace_blob(mapper, connection, target):
+    # A document replaced in place moves its reference to the new content.
+    history = inspect(target).attrs.sha256.history
+    if not history.has_changes():
+        return
+    for sha256 in history.deleted:
+        if sha256:
+            _release(connection, sha256)
+    if target.sha256:
+        _acquire(connection, target.sha256, target.size)
+
+
+@event.listens_for(Document, "after_delete")
+def _release_blob(mapper, connection, target):
+    if target.sha256:
+        _release(connection, target.sha256)
+
+
+def collect_garbage(grace_seconds: int = DEFAULT_GC_GRACE) -> int:
+    """
+    Delete blobs no document references any more, plus abandoned temp files.
+
+    Each blob row is deleted (re-checking ``ref_count``) and its object
+    removed from storage before the transaction commits, so a concurrent
+    upload of the same content either sees the row gone and stores the
+    object again, or wins the row and keeps it.
+
+    :return: Number of blobs removed.
+    """
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        seconds=grace_seconds
+    )
+    storage = get_storage("documents")
+    removed = 0
+    while True:
+        candidates = db.session.scalars(
+            select(Blob.sha256)
+            .where(Blob.ref_count <= 0, Blob.updated_at < cutoff)
+            .limit(GC_BATCH_SIZE)
+        ).all()
+        db.session.commit()
+        if not candidates:
+            break
+        for sha256 in candidates:
+            result = db.session.execute(
+                delete(Blob).where(Blob.sha256 == sha256, Blob.ref_count <= 0)
+            )
+            if result.rowcount:
+                storage.delete(blob_key(sha256))
+                removed += 1
+            db.session.commit()
+
+    stale = time.time() - grace_seconds
+    # Interrupted writes leave their temp files next to the destination:
+    # the upload root, a blob's shard directory or a resumable upload's
+    # parts directory.
+    for part in FileConfig.UPLOAD_FILE.rglob("*.part"):
+        if part.stat().st_mtime < stale:
+            part.unlink(missing_ok=True)
+    return removed
+
+
+blobs_cli = AppGroup("blobs", help="Document blob store commands.")
+
+
+@blobs_cli.command("gc")
+@click.option(
+    "--grace-seconds",
+    type=int,
+    default=DEFAULT_GC_GRACE,
+    help="Keep orphans younger than this.",
+)
+def gc(grace_seconds):
+    """Remove unreferenced files and expired resumable upload sessions."""
+    expired = expire_upload_sessions(current_app.config["UPLOAD_SESSION_TTL"])
+    removed = collect_garbage(grace_seconds)
+    click.echo(f"Expired {expired} upload session(s).")
+    click.echo(f"Removed {removed} orphaned blob(s).")
@@ -0,0 +1,99 @@
+from collections import Counter
+
+from sqlalchemy import select, update
+
+from app.application.analytics import record_status_change
+from app.application.letters import get_letter_queue
+from app.application.models import Application, ApplicationStatus, LetterStatus
+from app.application.queries import filter_applications
+from app.extensions import db
+
+# Application ids per UPDATE statement; keeps IN lists under SQLite's
+# bound-parameter limit and each write transaction short.
+BULK_CHUNK_SIZE = 500
+
+
+def _id_chunks(application_ids):
+    ids = sorted(set(application_ids))
+    for i in range(0, len(ids), BULK_CHUNK_SIZE):
+        yield ids[i : i + BULK_CHUNK_SIZE]
+
+
+def _filtered_id_chunks(filters):
+    # Walk the matching ids by keyset so rows that stop matching once their
+    # status changes do not shift later chunks.
+    last_id = 0
+    while True:
+        ids = db.session.scalars(
+            filter_applications(select(Application.id), filters)
+            .where(Application.id > last_id)
+            .order_by(Application.id)
+            .limit(BULK_CHUNK_SIZE)
+        ).all()
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def _update_chunk(ids, status) -> list:
+    """
+    Apply ``status`` to ``ids`` in one UPDATE and return the ids changed,
+    moving them between the analytics status counters as well.
+    """
+    changeable = (
+        Application.id.in_(ids),
+        # APPROVED is terminal, and rows already in the target status are
+        # left alone so they are not re-queued for a letter.
+        Application.status != ApplicationStatus.APPROVED,
+        Application.status != status,
+    )
+    values = {"status": status}
+    if status == ApplicationStatus.APPROVED:
+        values["letter_status"] = LetterStatus.PENDING
+
+    # The counters need each row's previous status; locking the rows keeps
+    # it accurate until the UPDATE on databases with row locks.
+    rows = db.session.execute(
+        select(Application.id, Application.status)
+        .where(*changeable)
+        .with_for_update()
+    ).all()
+    if not rows:
+        return []
+    ids = [row.id for row in rows]
+    db.session.execute(
+        update(Application)
+        .where(*changeable[1:], Application.id.in_(ids))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    for old_status, count in Counter(row.status for row in rows).items():
+        record_status_change(old_status, status, count)
+    return ids
+
+
+def bulk_change_status(status, application_ids=None, filters=None) -> int:
+    """
+    Move many applications to ``status``, one UPDATE and commit per chunk.
+
+    Pass either explicit ``application_ids`` or ``filters`` (as accepted by
+    :func:`filter_applications`). Newly approved applications get their
+    letters queued in the same transaction as their status change.
+
+    :return: Number of applications whose status changed.
+    """
+    chunks = (
+        _id_chunks(application_ids)
+        if application_ids is not None
+        else _filtered_id_chunks(filters)
+    )
+    queue = get_letter_queue() if status == ApplicationStatus.APPROVED else None
+    updated = 0
+    for ids in chunks:
+        changed = _update_chunk(ids, status)
+        if queue is not None and changed:
+            queue.enqueue(changed)
+        db.session.commit()
+        updated += len(changed)
+    return updated
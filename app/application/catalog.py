@@ -0,0 +1,68 @@
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.application.models import PreferredCourse
+from app.cache import VersionedCache, get_shared_cache
+from app.extensions import db
+
+_STALE_FLAG = "course_catalog_stale"
+
+
+def load_available_courses() -> list:
+    """Courses that still have free seats, filtered in SQL."""
+    rows = db.session.execute(
+        select(PreferredCourse.id, PreferredCourse.course_name)
+        .where(PreferredCourse.applied_count < PreferredCourse.max_applications_count)
+        .order_by(PreferredCourse.id)
+    ).all()
+    return [{"id": row.id, "course_name": row.course_name} for row in rows]
+
+
+def get_course_catalog() -> VersionedCache:
+    """The app's cache of available courses."""
+    if "course_catalog" not in current_app.extensions:
+        current_app.extensions["course_catalog"] = VersionedCache(
+            "course_catalog",
+            load_available_courses,
+            ttl=current_app.config["COURSE_CATALOG_TTL"],
+            shared=get_shared_cache(),
+        )
+    return current_app.extensions["course_catalog"]
+
+
+def available_courses() -> list:
+    """
+    Available courses as ``{"id", "course_name"}`` dicts, served from the
+    catalog cache. The list is shared between callers; do not modify it.
+    """
+    return get_course_catalog().get()
+
+
+def mark_catalog_stale(session) -> None:
+    """
+    Invalidate the course catalog once ``session`` commits.
+
+    Invalidating after the commit, rather than when the change is made,
+    keeps a concurrent reader from caching the pre-commit state again.
+    """
+    if session is not None:
+        session.info[_STALE_FLAG] = True
+
+
+@event.listens_for(PreferredCourse, "after_insert")
+@event.listens_for(PreferredCourse, "after_update")
+@event.listens_for(PreferredCourse, "after_delete")
+def _course_changed(mapper, connection, target):
+    mark_catalog_stale(object_session(target))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop(_STALE_FLAG, False) and has_app_context():
+        get_course_catalog().invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_STALE_FLAG, None)
@@ -0,0 +1,94 @@
+from flask import current_app, has_app_context
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session, object_session
+
+from app.application.analytics import record_status_change
+from app.application.models import (Application, ApplicationStatus, Document,
+                                    DocumentType)
+from app.cache import VersionedCache, get_shared_cache
+from app.extensions import db
+
+_STALE_FLAG = "document_types_stale"
+
+
+def count_document_types() -> int:
+    return db.session.scalar(select(func.count()).select_from(DocumentType))
+
+
+def get_document_type_count_cache() -> VersionedCache:
+    if "document_type_count" not in current_app.extensions:
+        current_app.extensions["document_type_count"] = VersionedCache(
+            "document_type_count",
+            count_document_types,
+            ttl=current_app.config["DOCUMENT_TYPE_CACHE_TTL"],
+            shared=get_shared_cache(),
+        )
+    return current_app.extensions["document_type_count"]
+
+
+def required_document_types() -> int:
+    """Number of document types an application needs, from the cache."""
+    return get_document_type_count_cache().get()
+
+
+def promote_if_complete(application_id: int) -> bool:
+    """
+    Move an INCOMPLETE application to PENDING once it has a document of
+    every type, with one conditional UPDATE in the caller's transaction.
+
+    :return: True if the application was promoted.
+    """
+    required = required_document_types()
+    result = db.session.execute(
+        update(Application)
+        .where(
+            Application.id == application_id,
+            Application.status == ApplicationStatus.INCOMPLETE,
+            Application.satisfied_document_types >= required,
+        )
+        .values(status=ApplicationStatus.PENDING)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        return False
+    record_status_change(ApplicationStatus.INCOMPLETE, ApplicationStatus.PENDING)
+    return True
+
+
+def _adjust_satisfied(connection, application_id, delta) -> None:
+    connection.execute(
+        update(Application)
+        .where(Application.id == application_id)
+        .values(satisfied_document_types=Application.satisfied_document_types + delta)
+    )
+
+
+# Documents are unique per (application, document type), so every inserted
+# or deleted row adds or removes exactly one satisfied type.
+@event.listens_for(Document, "after_insert")
+def _document_added(mapper, connection, target):
+    _adjust_satisfied(connection, target.application_id, 1)
+
+
+@event.listens_for(Document, "after_delete")
+def _document_removed(mapper, connection, target):
+    _adjust_satisfied(connection, target.application_id, -1)
+
+
+@event.listens_for(DocumentType, "after_insert")
+@event.listens_for(DocumentType, "after_delete")
+def _document_types_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info[_STALE_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop(_STALE_FLAG, False) and has_app_context():
+        get_document_type_count_cache().invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_STALE_FLAG, None)
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+
+from sqlalchemy import func, select
+
+from app.application.models import Application, Document, PreferredCourse
+from app.application.queries import filter_applications
+
+# Rows fetched from the database per round trip while streaming.
+EXPORT_BATCH_SIZE = 1000
+
+_APPLICATION_COLUMNS = (
+    "id",
+    "user",
+    "full_name",
+    "date_of_birth",
+    "gender",
+    "email",
+    "phone_number",
+    "address",
+    "nationality",
+    "highest_qualification",
+    "institution_name",
+    "graduation_year",
+    "preferred_course_id",
+)
+EXPORT_COLUMNS = _APPLICATION_COLUMNS + (
+    "course_name",
+    "status",
+    "created_at",
+    "document_count",
+)
+
+
+def export_statement(filters):
+    """
+    Build the export SELECT: every application with its course name and
+    document count, ordered by id.
+
+    The document count is a correlated subquery rather than a GROUP BY so
+    the database can hand back the first rows without aggregating the
+    whole table first.
+    """
+    document_count = (
+        select(func.count(Document.id))
+        .where(Document.application_id == Application.id)
+        .correlate(Application)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            *(getattr(Application, c) for c in _APPLICATION_COLUMNS),
+            PreferredCourse.course_name,
+            Application.status,
+            Application.created_at,
+            document_count.label("document_count"),
+        )
+        .join(PreferredCourse, PreferredCourse.id == Application.preferred_course_id)
+        .order_by(Application.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    return filter_applications(stmt, filters)
+
+
+def _serialize(row) -> dict:
+    record = dict(zip(EXPORT_COLUMNS, row))
+    record["status"] = record["status"].value
+    record["date_of_birth"] = record["date_of_birth"].isoformat()
+    record["created_at"] = record["created_at"].isoformat()
+    return record
+
+
+def iter_ndjson(rows):
+    """Yield one JSON document per line, one chunk per fetched batch."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(_serialize(row)))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(rows):
+    """Yield a CSV header followed by rows, one chunk per fetched batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    count = 0
+    for row in rows:
+        writer.writerow(_serialize(row).values())
+        count += 1
+        if count >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    if count:
+        yield buffer.getvalue()
@@ -0,0 +1,351 @@
+import csv
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import click
+from flask.cli import AppGroup
+from pydantic import ValidationError
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.application.analytics import record_new_applications
+from app.application.catalog import mark_catalog_stale
+from app.application.models import (Application, ApplicationStatus,
+                                    PreferredCourse)
+from app.application.schemas import ApplicationCreateSchema, CourseCreateSchema
+from app.application.seats import run_with_lock_retry
+from app.authentication.models import RoleEnum, User
+from app.extensions import db
+
+# Rows validated and inserted per transaction.
+IMPORT_BATCH_SIZE = 1000
+# Rejected rows described in a report; the rest are only counted.
+IMPORT_ERROR_LIMIT = 100
+IMPORT_FORMATS = ("ndjson", "csv")
+# Password hash for accounts created by an import: it matches no password,
+# so the account cannot log in until a password is set.
+UNUSABLE_PASSWORD = "!"
+
+COURSE_UNAVAILABLE = "Selected course is not available."
+APPLICATION_EXISTS = "Application already exists for this email."
+NOT_AN_APPLICANT = "This email belongs to an account that cannot apply."
+# Times a course's free seats are re-read when a concurrent reservation
+# got in between the read and the UPDATE.
+SEAT_RETRIES = 5
+# Times a batch is checked again after a concurrent writer took one of its
+# emails between the checks and the INSERT.
+CONFLICT_RETRIES = 3
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    failed: int = 0
+    errors: list = field(default_factory=list)
+
+    def reject(self, line: int, messages) -> None:
+        self.failed += 1
+        if len(self.errors) < IMPORT_ERROR_LIMIT:
+            self.errors.append({"line": line, "errors": messages})
+
+    def to_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+
+def iter_records(lines, fmt: str):
+    """
+    Yield ``(line_number, record)`` for each row of a CSV or NDJSON text
+    stream, reading it line by line.
+
+    CSV records are dicts keyed by the header row; NDJSON records are the
+    raw JSON strings, validated straight from JSON. Blank lines are
+    skipped.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+    for number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield number, line
+
+
+def _validate(schema, record):
+    if isinstance(record, str):
+        return schema.model_validate_json(record)
+    return schema.model_validate(record)
+
+
+def _messages(error: ValidationError) -> list:
+    return [
+        {"field": ".".join(map(str, e["loc"])), "message": e["msg"]}
+        for e in error.errors(include_url=False)
+    ]
+
+
+def _insert_courses(batch) -> list:
+    db.session.execute(
+        insert(PreferredCourse),
+        [
+            {
+                "course_name": data.course_name,
+                "max_applications_count": data.max_applications_count,
+                "applied_count": 0,
+            }
+            for _, data in batch
+        ],
+    )
+    mark_catalog_stale(db.session())
+    db.session.commit()
+    return []
+
+
+def _free_seats(course_ids) -> dict:
+    return dict(
+        db.session.execute(
+            select(
+                PreferredCourse.id,
+                PreferredCourse.max_applications_count
+                - PreferredCourse.applied_count,
+            )
+            .where(PreferredCourse.id.in_(course_ids))
+            .with_for_update()
+        ).all()
+    )
+
+
+def _reserve_seats(course_id: int, wanted: int, free: int) -> int:
+    """
+    Take up to ``wanted`` seats on a course believed to have ``free`` left,
+    with one guarded UPDATE.
+
+    The read does not lock on every database (SQLite ignores FOR UPDATE), so
+    a request may take a seat in between; the guard then matches no row and
+    the free seats are read again.
+
+    :return: Number of seats taken.
+    """
+    for _ in range(SEAT_RETRIES):
+        count = min(wanted, free)
+        if count <= 0:
+            return 0
+        result = db.session.execute(
+            update(PreferredCourse)
+            .where(
+                PreferredCourse.id == course_id,
+                PreferredCourse.applied_count + count
+                <= PreferredCourse.max_applications_count,
+            )
+            .values(applied_count=PreferredCourse.applied_count + count)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            return count
+        free = _free_seats([course_id]).get(course_id, 0)
+    return 0
+
+
+def _take_seats(candidates) -> tuple:
+    """
+    Reserve seats for ``candidates`` with one UPDATE per course.
+
+    :return: ``(accepted, rejected)``; rows past a course's free seats, or
+             for an unknown course, are rejected in file order.
+    """
+    wanted = Counter(data.preferred_course_id for _, data in candidates)
+    free = _free_seats(wanted)
+    granted = {
+        course_id: _reserve_seats(course_id, count, free.get(course_id, 0))
+        for course_id, count in wanted.items()
+    }
+    if any(granted.values()):
+        mark_catalog_stale(db.session())
+
+    accepted, rejected = [], []
+    for line, data in candidates:
+        course_id = data.preferred_course_id
+        if granted[course_id] > 0:
+            granted[course_id] -= 1
+            accepted.append((line, data))
+        else:
+            rejected.append((line, COURSE_UNAVAILABLE))
+    return accepted, rejected
+
+
+def _create_owners(batch, owners: dict) -> None:
+    """
+    Add an account to ``owners`` (email to user id) for each applicant in
+    ``batch`` that has none yet, created without a usable password.
+    """
+    missing = [
+        {
+            "name": data.full_name[:80],
+            "email": data.email,
+            "password": UNUSABLE_PASSWORD,
+            "role": RoleEnum.USER,
+        }
+        for _, data in batch
+        if data.email not in owners
+    ]
+    if missing:
+        created = db.session.execute(
+            insert(User).returning(User.email, User.id, sort_by_parameter_order=True),
+            missing,
+        )
+        owners.update(created.tuples().all())
+
+
+def _insert_applications(batch) -> list:
+    emails = [data.email for _, data in batch]
+    taken = set(
+        db.session.scalars(
+            select(Application.email).where(Application.email.in_(emails))
+        )
+    )
+    # An existing account that already owns an application under another
+    # email cannot take a second one.
+    taken.update(
+        db.session.scalars(
+            select(User.email)
+            .join(Application, Application.user == User.id)
+            .where(User.email.in_(emails))
+        )
+    )
+    accounts = db.session.execute(
+        select(User.email, User.id, User.role).where(User.email.in_(emails))
+    ).all()
+    owners = {row.email: row.id for row in accounts if row.role == RoleEnum.USER}
+    # Applications are never attached to admin accounts.
+    staff = {row.email for row in accounts if row.role != RoleEnum.USER}
+
+    candidates, rejected = [], []
+    for line, data in batch:
+        if data.email in taken:
+            rejected.append((line, APPLICATION_EXISTS))
+        elif data.email in staff:
+            rejected.append((line, NOT_AN_APPLICANT))
+        else:
+            taken.add(data.email)
+            candidates.append((line, data))
+
+    accepted, unavailable = _take_seats(candidates)
+    rejected.extend(unavailable)
+    if accepted:
+        _create_owners(accepted, owners)
+        rows = [
+            dict(
+                data.model_dump(),
+                user=owners[data.email],
+                status=ApplicationStatus.INCOMPLETE,
+            )
+            for _, data in accepted
+        ]
+        db.session.execute(insert(Application), rows)
+        # Core INSERTs skip the mapper events that keep the counters.
+        record_new_applications(rows)
+    db.session.commit()
+    # Report rejections in file order.
+    return sorted(rejected)
+
+
+def _run_batch(insert_batch, batch, report: ImportReport) -> None:
+    for attempt in range(CONFLICT_RETRIES):
+        try:
+            rejected = run_with_lock_retry(lambda: insert_batch(batch))
+            break
+        except IntegrityError:
+            # The checks run again on the retry and reject the rows whose
+            # email was taken in the meantime.
+            db.session.rollback()
+            if attempt == CONFLICT_RETRIES - 1:
+                raise
+    for line, message in rejected:
+        report.reject(line, [{"field": None, "message": message}])
+    report.imported += len(batch) - len(rejected)
+
+
+def _import(records, schema, insert_batch) -> ImportReport:
+    report = ImportReport()
+    batch = []
+    for line, record in records:
+        try:
+            batch.append((line, _validate(schema, record)))
+        except ValidationError as e:
+            report.reject(line, _messages(e))
+            continue
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            _run_batch(insert_batch, batch, report)
+            batch = []
+    if batch:
+        _run_batch(insert_batch, batch, report)
+    return report
+
+
+def import_courses(lines, fmt: str) -> ImportReport:
+    """Create a course for each valid row of a CSV or NDJSON stream."""
+    return _import(iter_records(lines, fmt), CourseCreateSchema, _insert_courses)
+
+
+def import_applications(lines, fmt: str) -> ImportReport:
+    """
+    Create an application for each valid row of a CSV or NDJSON stream.
+
+    Rows are validated like ``POST /user/applications`` and inserted
+    ``IMPORT_BATCH_SIZE`` at a time, one transaction per batch, taking the
+    seats for each course with a single UPDATE. A row is rejected when its
+    email already has an application or belongs to an admin account, or
+    when its course has no free seat left. Each application is owned by the
+    user account with the applicant's email; missing accounts are created
+    without a usable password. The acceptance window does not apply to
+    imports.
+    """
+    return _import(
+        iter_records(lines, fmt), ApplicationCreateSchema, _insert_applications
+    )
+
+
+imports_cli = AppGroup("import", help="Bulk import commands.")
+
+_format_option = click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(IMPORT_FORMATS),
+    default=None,
+    help="File format; defaults to csv for .csv files, otherwise ndjson.",
+)
+
+
+def _run_import(importer, path, fmt):
+    if fmt is None:
+        fmt = "csv" if Path(path).suffix.lower() == ".csv" else "ndjson"
+    with open(path, encoding="utf-8", newline="") as lines:
+        report = importer(lines, fmt)
+    for error in report.errors:
+        messages = "; ".join(
+            f"{e['field']}: {e['message']}" if e["field"] else e["message"]
+            for e in error["errors"]
+        )
+        click.echo(f"line {error['line']}: {messages}", err=True)
+    click.echo(f"Imported {report.imported} row(s), {report.failed} failed.")
+
+
+@imports_cli.command("applications")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@_format_option
+def applications_command(path, fmt):
+    """Import applications from a CSV or NDJSON file."""
+    _run_import(import_applications, path, fmt)
+
+
+@imports_cli.command("courses")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@_format_option
+def courses_command(path, fmt):
+    """Import courses from a CSV or NDJSON file."""
+    _run_import(import_courses, path, fmt)
@@ -0,0 +1,276 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import and_, or_, select, update
+
+from app.application.admission_letter import letter_payload, render_letters
+from app.application.models import (Application, LetterJob, LetterStatus,
+                                    PreferredCourse)
+from app.application.storage import get_storage
+from app.extensions import db
+
+# Letters rendered per executor call.
+RENDER_CHUNK_SIZE = 25
+ABANDONED_ERROR = "The worker stopped before finishing the render."
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ClaimedJob(NamedTuple):
+    id: int
+    application_id: int
+    attempts: int
+
+
+class LetterQueue(ABC):
+    """Backend interface for queued admission letter renders."""
+
+    @abstractmethod
+    def enqueue(self, application_ids) -> None:
+        """Queue one render per application, inside the caller's transaction."""
+
+    @abstractmethod
+    def claim(self, limit: int) -> list:
+        """Atomically take up to ``limit`` runnable jobs as ``ClaimedJob``s."""
+
+    @abstractmethod
+    def complete(self, job_id: int) -> None:
+        """Mark a claimed job as finished."""
+
+    @abstractmethod
+    def fail(self, job_id: int, error: str) -> bool:
+        """Record a failed attempt. Returns True if the job will be retried."""
+
+
+class DatabaseLetterQueue(LetterQueue):
+    """
+    Letter queue stored in the ``letter_jobs`` table of the application
+    database (SQLite by default), so no extra service is needed.
+    """
+
+    def __init__(self, max_attempts=3, retry_delay=30, claim_timeout=600):
+        self.max_attempts = max_attempts
+        self.retry_delay = timedelta(seconds=retry_delay)
+        self.claim_timeout = timedelta(seconds=claim_timeout)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            max_attempts=config["LETTER_MAX_ATTEMPTS"],
+            retry_delay=config["LETTER_RETRY_DELAY"],
+            claim_timeout=config["LETTER_CLAIM_TIMEOUT"],
+        )
+
+    def enqueue(self, application_ids) -> None:
+        now = utcnow()
+        db.session.add_all(
+            LetterJob(
+                application_id=application_id,
+                status=LetterStatus.PENDING,
+                attempts=0,
+                available_at=now,
+            )
+            for application_id in application_ids
+        )
+
+    def claim(self, limit: int) -> list:
+        token = str(uuid.uuid4())
+        now = utcnow()
+        stale = and_(
+            LetterJob.status == LetterStatus.RENDERING,
+            LetterJob.claimed_at < now - self.claim_timeout,
+        )
+        # A job that kills its worker never reaches fail(), so its attempts
+        # are checked here; otherwise it would be reclaimed forever.
+        abandoned = db.session.scalars(
+            update(LetterJob)
+            .where(stale, LetterJob.attempts >= self.max_attempts)
+            .values(status=LetterStatus.FAILED, last_error=ABANDONED_ERROR)
+            .returning(LetterJob.application_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        if abandoned:
+            db.session.execute(
+                update(Application)
+                .where(Application.id.in_(abandoned))
+                .values(letter_status=LetterStatus.FAILED)
+            )
+        # Pending jobs whose retry delay has passed, plus jobs left behind by
+        # a worker that died mid-render.
+        claimable = or_(
+            and_(
+                LetterJob.status == LetterStatus.PENDING,
+                LetterJob.available_at <= now,
+            ),
+            and_(stale, LetterJob.attempts < self.max_attempts),
+        )
+        candidates = (
+            select(LetterJob.id)
+            .where(claimable)
+            .order_by(LetterJob.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        # Re-checking ``claimable`` in the outer WHERE keeps two workers from
+        # claiming the same row on databases that run the subquery first.
+        db.session.execute(
+            update(LetterJob)
+            .where(LetterJob.id.in_(candidates), claimable)
+            .values(
+                status=LetterStatus.RENDERING,
+                claimed_by=token,
+                claimed_at=now,
+                attempts=LetterJob.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = db.session.execute(
+            select(LetterJob.id, LetterJob.application_id, LetterJob.attempts)
+            .where(LetterJob.claimed_by == token)
+            .order_by(LetterJob.id)
+        ).all()
+        db.session.commit()
+        return [ClaimedJob(*row) for row in rows]
+
+    def complete(self, job_id: int) -> None:
+        db.session.execute(
+            update(LetterJob)
+            .where(LetterJob.id == job_id)
+            .values(status=LetterStatus.READY, last_error=None)
+        )
+
+    def fail(self, job_id: int, error: str) -> bool:
+        job = db.session.get(LetterJob, job_id)
+        job.last_error = error[:500]
+        if job.attempts >= self.max_attempts:
+            job.status = LetterStatus.FAILED
+            return False
+        job.status = LetterStatus.PENDING
+        job.available_at = utcnow() + self.retry_delay * 2 ** (job.attempts - 1)
+        return True
+
+
+LETTER_QUEUE_BACKENDS = {"database": DatabaseLetterQueue}
+
+
+def get_letter_queue() -> LetterQueue:
+    """Build the queue backend named by ``LETTER_QUEUE_BACKEND``."""
+    backend = LETTER_QUEUE_BACKENDS[current_app.config["LETTER_QUEUE_BACKEND"]]
+    return backend.from_config(current_app.config)
+
+
+class InlineExecutor(Executor):
+    """Runs submitted calls immediately; used when no pool is configured."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def process_letter_jobs(queue=None, executor=None, batch_size=50) -> int:
+    """
+    Claim a batch of jobs, render their letters and record the outcome.
+
+    Rendering happens on ``executor`` (e.g. a ``ProcessPoolExecutor``) when
+    given, otherwise inline. Every render is submitted before any result is
+    written back, so no database transaction is held open while letters
+    render.
+
+    :return: Number of jobs claimed.
+    """
+    queue = queue or get_letter_queue()
+    jobs = queue.claim(batch_size)
+    if not jobs:
+        return 0
+
+    application_ids = [job.application_id for job in jobs]
+    rows = db.session.execute(
+        select(Application, PreferredCourse.course_name)
+        .join(PreferredCourse, PreferredCourse.id == Application.preferred_course_id)
+        .where(Application.id.in_(application_ids))
+    ).all()
+    payloads = {app.id: letter_payload(app, course_name) for app, course_name in rows}
+    db.session.execute(
+        update(Application)
+        .where(Application.id.in_(application_ids))
+        .values(letter_status=LetterStatus.RENDERING)
+    )
+    db.session.commit()
+
+    executor = executor or InlineExecutor()
+    storage = get_storage("letters")
+    renderable = [job for job in jobs if job.application_id in payloads]
+    # One submit per chunk: the worker process renders the whole chunk with
+    # its shared template instead of paying a round trip per letter.
+    chunks = [
+        renderable[i : i + RENDER_CHUNK_SIZE]
+        for i in range(0, len(renderable), RENDER_CHUNK_SIZE)
+    ]
+    futures = []
+    for chunk in chunks:
+        batch = [payloads[job.application_id] for job in chunk]
+        futures.append((chunk, executor.submit(render_letters, batch, storage)))
+    results = {}
+    for chunk, future in futures:
+        try:
+            outcomes = future.result()
+        except Exception as e:
+            outcomes = [(None, f"{type(e).__name__}: {e}")] * len(chunk)
+        results.update((job.id, outcome) for job, outcome in zip(chunk, outcomes))
+
+    for job in jobs:
+        if job.id not in results:
+            # The application was deleted after the job was queued.
+            queue.complete(job.id)
+            continue
+        key, error = results[job.id]
+        if error is not None:
+            retrying = queue.fail(job.id, error)
+            values = {
+                "letter_status": LetterStatus.PENDING if retrying else LetterStatus.FAILED
+            }
+        else:
+            queue.complete(job.id)
+            values = {"letter_status": LetterStatus.READY, "admission_letter_path": key}
+        db.session.execute(
+            update(Application)
+            .where(Application.id == job.application_id)
+            .values(**values)
+        )
+    db.session.commit()
+    return len(jobs)
+
+
+letters_cli = AppGroup("letters", help="Admission letter worker commands.")
+
+
+@letters_cli.command("work")
+@click.option("--processes", type=int, default=None, help="Render processes.")
+@click.option("--batch-size", type=int, default=50, help="Jobs claimed per batch.")
+@click.option("--poll-interval", type=float, default=2.0, help="Idle sleep (s).")
+@click.option("--once", is_flag=True, help="Exit once the queue is empty.")
+def work(processes, batch_size, poll_interval, once):
+    """Render queued admission letters on a process pool."""
+    processes = processes or current_app.config["LETTER_WORKER_PROCESSES"]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        while True:
+            handled = process_letter_jobs(executor=executor, batch_size=batch_size)
+            if handled:
+                click.echo(f"Processed {handled} letter job(s).")
+            elif once:
+                break
+            else:
+                time.sleep(poll_interval)
@@ -1,6 +1,7 @@
 import enum
 
-from sqlalchemy import Boolean, Column, Date, Enum, ForeignKey, Integer, String
+from sqlalchemy import (Boolean, Column, Date, DateTime, Enum, ForeignKey,
+                        Integer, String, UniqueConstraint, func)
 from sqlalchemy.orm import relationship
 
 from app.extensions import db
@@ -16,6 +17,16 @@ class ApplicationStatus(enum.Enum):
         return self.value
 
 
+class LetterStatus(enum.Enum):
+    PENDING = "Pending"
+    RENDERING = "Rendering"
+    READY = "Ready"
+    FAILED = "Failed"
+
+    def __str__(self):
+        return self.value
+
+
 class PreferredCourse(db.Model):
     __tablename__ = "preferred_course"
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -31,7 +42,10 @@ class PreferredCourse(db.Model):
 class Application(db.Model):
     __tablename__ = "applications"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user = Column(Integer, ForeignKey("user.id"), nullable=False)
+    # Unique: one application per user.
+    user = Column(
+        Integer, ForeignKey("user.id"), nullable=False, unique=True, index=True
+    )
     full_name = Column(String(255), nullable=False)
     date_of_birth = Column(Date, nullable=False)
     gender = Column(String(10), nullable=False)
@@ -43,12 +57,21 @@ class Application(db.Model):
     institution_name = Column(String(255), nullable=False)
     graduation_year = Column(Integer, nullable=False)
     preferred_course_id = Column(
-        Integer, ForeignKey("preferred_course.id"), nullable=False
+        Integer, ForeignKey("preferred_course.id"), nullable=False, index=True
     )
     status = Column(
-        Enum(ApplicationStatus), default=ApplicationStatus.INCOMPLETE, nullable=False
+        Enum(ApplicationStatus),
+        default=ApplicationStatus.INCOMPLETE,
+        nullable=False,
+        index=True,
     )
     admission_letter_path = Column(String(500), nullable=True)
+    letter_status = Column(Enum(LetterStatus), nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    # Distinct document types uploaded, kept up to date by Document events.
+    satisfied_document_types = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     documents = relationship(
         "Document", back_populates="application", cascade="all, delete-orphan"
     )
@@ -57,6 +80,13 @@ class Application(db.Model):
 
 class Document(db.Model):
     __tablename__ = "documents"
+    __table_args__ = (
+        # One document per type; uploading a type again replaces it. The
+        # constraint's index also serves lookups by application alone.
+        UniqueConstraint(
+            "application_id", "document_type_id", name="uq_documents_application_type"
+        ),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     application_id = Column(
         Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False
@@ -65,14 +95,57 @@ class Document(db.Model):
         Integer, ForeignKey("document_type_names.id"), nullable=False
     )
     file_path = Column(String(500), nullable=False)
+    filename = Column(String(255), nullable=True)
+    sha256 = Column(String(64), nullable=True)
+    size = Column(Integer, nullable=True)
     application = relationship("Application", back_populates="documents")
     document_type = relationship("DocumentType", back_populates="documents")
 
 
+class Blob(db.Model):
+    """A stored file, addressed by its SHA-256 and shared between documents."""
+
+    __tablename__ = "blobs"
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
+
+class ApplicationCount(db.Model):
+    """
+    Number of applications in one bucket of an analytics dimension, e.g.
+    ("status", "PENDING"). Kept up to date by app.application.analytics.
+    """
+
+    __tablename__ = "application_counts"
+    dimension = Column(String(32), primary_key=True)
+    bucket = Column(String(255), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class UploadSession(db.Model):
+    """A resumable document upload whose parts are still arriving."""
+
+    __tablename__ = "upload_sessions"
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    application_id = Column(
+        Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False
+    )
+    document_type_id = Column(
+        Integer, ForeignKey("document_type_names.id"), nullable=False
+    )
+    filename = Column(String(255), nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+
 class DocumentType(db.Model):
     __tablename__ = "document_type_names"
     id = Column(Integer, primary_key=True, autoincrement=True)
     document_type_name = Column(String(100), nullable=False, unique=True)
+    # Maximum upload size in bytes; None falls back to UPLOAD_MAX_SIZE.
+    max_size = Column(Integer, nullable=True)
     documents = relationship("Document", back_populates="document_type")
 
 
@@ -82,3 +155,23 @@ class ApplicationAcceptanceSettings(db.Model):
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
     is_enabled = Column(Boolean, default=True)
+    # Bumped by SQLAlchemy on every update; processes compare it to decide
+    # whether their cached snapshot is stale.
+    version = Column(Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version}
+
+
+class LetterJob(db.Model):
+    """A queued admission letter render, used by the database letter queue."""
+
+    __tablename__ = "letter_jobs"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    application_id = Column(
+        Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False
+    )
+    status = Column(Enum(LetterStatus), default=LetterStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(String(500), nullable=True)
+    available_at = Column(DateTime, nullable=False, server_default=func.now())
+    claimed_by = Column(String(36), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,58 @@
+import base64
+import binascii
+from datetime import datetime, time, timedelta
+
+from app.application.models import Application
+
+
+def encode_cursor(last_id: int, kind: str = "a") -> str:
+    """
+    Encode the last seen application id as an opaque cursor token.
+
+    :param kind: What the value is; ``"a"`` for an application id. Search
+                 results use ``"s"`` with an offset into the ranking.
+    """
+    return base64.urlsafe_b64encode(f"{kind}:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, kind: str = "a") -> int:
+    """
+    Decode a cursor produced by :func:`encode_cursor` with the same ``kind``.
+
+    :raises ValueError: if the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor.") from e
+    prefix, _, value = raw.partition(":")
+    if prefix != kind or not value.isdigit():
+        raise ValueError("Invalid cursor.")
+    return int(value)
+
+
+def filter_applications(query, filters):
+    """
+    Apply the admin listing filters to a query over ``Application``.
+
+    :param query: A SQLAlchemy query selecting from ``Application``.
+    :param filters: Object exposing ``status``, ``preferred_course_id``,
+                    ``created_from`` and ``created_to`` (any may be None).
+                    ``created_to`` is inclusive.
+    """
+    if filters.status is not None:
+        query = query.filter(Application.status == filters.status)
+    if filters.preferred_course_id is not None:
+        query = query.filter(
+            Application.preferred_course_id == filters.preferred_course_id
+        )
+    if filters.created_from is not None:
+        query = query.filter(
+            Application.created_at >= datetime.combine(filters.created_from, time.min)
+        )
+    if filters.created_to is not None:
+        query = query.filter(
+            Application.created_at
+            < datetime.combine(filters.created_to + timedelta(days=1), time.min)
+        )
+    return query
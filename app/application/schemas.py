@@ -0,0 +1,55 @@
+from datetime import date
+
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+from app.validation import today
+
+GENDERS = ("Male", "Female", "Other")
+_GENDER_SET = frozenset(GENDERS)
+_GENDER_ERROR = f"Gender must be one of {list(GENDERS)}"
+
+
+class ApplicationCreateSchema(BaseModel):
+    full_name: str = Field(..., min_length=1, max_length=255)
+    date_of_birth: date
+    gender: str = Field(..., min_length=1, max_length=10)
+    email: EmailStr
+    phone_number: str = Field(..., min_length=1, max_length=20)
+    address: str = Field(..., min_length=1, max_length=500)
+    nationality: str = Field(..., min_length=1, max_length=100)
+    highest_qualification: str = Field(..., min_length=1, max_length=255)
+    institution_name: str = Field(..., min_length=1, max_length=255)
+    graduation_year: int = Field(..., gt=1900, lt=2100)
+    preferred_course_id: int
+
+    @field_validator("gender")
+    def validate_gender(cls, value: str) -> str:
+        value = value.title()
+        if value not in _GENDER_SET:
+            raise ValueError(_GENDER_ERROR)
+        return value
+
+    @field_validator("phone_number")
+    def validate_phone_number(cls, value):
+        if not value.startswith("+") or not value[1:].isdigit():
+            raise ValueError("Phone number must start with '+' and contain only digits")
+        return value
+
+    @field_validator("graduation_year")
+    def validate_graduation_year(cls, value):
+        if value > today().year:
+            raise ValueError("Graduation year cannot be greater than the current year")
+        return value
+
+    @field_validator("date_of_birth")
+    def validate_date_of_birth(cls, value):
+        now = today()
+        age = now.year - value.year - ((now.month, now.day) < (value.month, value.day))
+        if age < 18:
+            raise ValueError("Applicant must be at least 18 years old")
+        return value
+
+
+class CourseCreateSchema(BaseModel):
+    course_name: str = Field(..., min_length=1, max_length=255)
+    max_applications_count: int = Field(..., gt=0)
@@ -0,0 +1,143 @@
+from sqlalchemy import DDL, column, event, func, literal_column, or_, table
+
+from app.application.models import Application
+
+# Text columns an admin can search applicants by.
+SEARCH_COLUMNS = ("full_name", "email", "phone_number", "institution_name")
+# Trigram indexes cannot match anything shorter.
+MIN_TERM_LENGTH = 3
+
+# SQLite: an external-content FTS5 table with the trigram tokenizer, so any
+# substring of three or more characters is an index lookup. Triggers keep
+# it in step with every write to applications, Core statements included.
+_columns = ", ".join(SEARCH_COLUMNS)
+_new = ", ".join(f"new.{name}" for name in SEARCH_COLUMNS)
+_old = ", ".join(f"old.{name}" for name in SEARCH_COLUMNS)
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5("
+    f"{_columns}, content='applications', content_rowid='id', "
+    f"tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS applications_fts_insert "
+    f"AFTER INSERT ON applications BEGIN "
+    f"INSERT INTO applications_fts(rowid, {_columns}) VALUES (new.id, {_new}); "
+    f"END",
+    f"CREATE TRIGGER IF NOT EXISTS applications_fts_delete "
+    f"AFTER DELETE ON applications BEGIN "
+    f"INSERT INTO applications_fts(applications_fts, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old}); "
+    f"END",
+    f"CREATE TRIGGER IF NOT EXISTS applications_fts_update "
+    f"AFTER UPDATE OF {_columns} ON applications BEGIN "
+    f"INSERT INTO applications_fts(applications_fts, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old}); "
+    f"INSERT INTO applications_fts(rowid, {_columns}) VALUES (new.id, {_new}); "
+    f"END",
+]
+# PostgreSQL: pg_trgm GIN indexes serve ILIKE '%term%' and the fuzzy
+# word-similarity operator on each column.
+POSTGRESQL_SEARCH_DDL = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+    f"CREATE INDEX IF NOT EXISTS ix_applications_{name}_trgm "
+    f"ON applications USING gin ({name} gin_trgm_ops)"
+    for name in SEARCH_COLUMNS
+]
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Application.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+for _statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(
+        Application.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+event.listen(
+    Application.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS applications_fts").execute_if(dialect="sqlite"),
+)
+
+_fts = table("applications_fts", column("rowid"), *map(column, SEARCH_COLUMNS))
+# bm25 weight per column, in SEARCH_COLUMNS order: names and emails are
+# what reviewers usually type.
+_FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+
+def search_terms(text: str) -> list:
+    """
+    Split a search string into terms long enough to look up.
+
+    :raises ValueError: if no term has at least ``MIN_TERM_LENGTH``
+                        characters.
+    """
+    terms = [term for term in text.split() if len(term) >= MIN_TERM_LENGTH]
+    if not terms:
+        raise ValueError(f"Search terms need at least {MIN_TERM_LENGTH} characters.")
+    return terms
+
+
+def _fts_search(query, terms):
+    # Each term is a quoted phrase, so punctuation in emails and phone
+    # numbers is matched literally; terms are ANDed.
+    match = " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+    fts_table = literal_column("applications_fts")
+    return (
+        query.join(_fts, _fts.c.rowid == Application.id)
+        .where(fts_table.op("MATCH")(match))
+        .order_by(func.bm25(fts_table, *_FTS_WEIGHTS), Application.id)
+    )
+
+
+def _column_matches(term):
+    pattern = "%{}%".format(
+        term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    )
+    return [
+        getattr(Application, name).ilike(pattern, escape="/")
+        for name in SEARCH_COLUMNS
+    ]
+
+
+def _trigram_search(query, terms):
+    # A term matches a column containing it, or one with a similar word
+    # (pg_trgm's <% operator), which tolerates typos.
+    scores = []
+    for term in terms:
+        similar = [
+            getattr(Application, name).op("%>")(term)
+            for name in SEARCH_COLUMNS
+        ]
+        query = query.where(or_(*_column_matches(term), *similar))
+        scores.append(
+            func.greatest(
+                *(
+                    func.word_similarity(term, getattr(Application, name))
+                    for name in SEARCH_COLUMNS
+                )
+            )
+        )
+    score = sum(scores[1:], scores[0])
+    return query.order_by(score.desc(), Application.id)
+
+
+def _like_search(query, terms):
+    for term in terms:
+        query = query.where(or_(*_column_matches(term)))
+    return query.order_by(Application.id)
+
+
+_SEARCH_BACKENDS = {"sqlite": _fts_search, "postgresql": _trigram_search}
+
+
+def search_applications(query, terms, dialect: str):
+    """
+    Restrict ``query`` (a select over ``Application``) to applications
+    matching every term in any of ``SEARCH_COLUMNS``, best matches first.
+
+    SQLite uses the FTS5 index, ranked by bm25; PostgreSQL the trigram
+    indexes, ranked by word similarity. Other databases fall back to an
+    unranked ILIKE scan.
+    """
+    return _SEARCH_BACKENDS.get(dialect, _like_search)(query, terms)
@@ -0,0 +1,65 @@
+import random
+import time
+
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+
+from app.application.catalog import mark_catalog_stale
+from app.application.models import PreferredCourse
+from app.extensions import db
+
+# SQLSTATEs PostgreSQL uses for serialization failures and deadlocks.
+_RETRYABLE_PGCODES = {"40001", "40P01"}
+
+
+def reserve_seat(course_id: int) -> bool:
+    """
+    Take one seat on a course with a single conditional UPDATE.
+
+    The check and the increment happen in the database, so concurrent
+    submissions can never push ``applied_count`` past
+    ``max_applications_count``. The caller owns the transaction and must
+    commit (or roll back) afterwards; the course catalog cache is
+    invalidated when a reservation is committed.
+
+    :return: True if a seat was reserved, False if the course is full or
+             does not exist.
+    """
+    result = db.session.execute(
+        update(PreferredCourse)
+        .where(
+            PreferredCourse.id == course_id,
+            PreferredCourse.applied_count < PreferredCourse.max_applications_count,
+        )
+        .values(applied_count=PreferredCourse.applied_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        return False
+    mark_catalog_stale(db.session())
+    return True
+
+
+def is_lock_error(error: OperationalError) -> bool:
+    """Whether ``error`` is a transient lock/serialization failure."""
+    if getattr(error.orig, "pgcode", None) in _RETRYABLE_PGCODES:
+        return True
+    return "database is locked" in str(error.orig).lower()
+
+
+def run_with_lock_retry(fn, attempts: int = 5, base_delay: float = 0.01):
+    """
+    Run ``fn`` (which should end by committing) and retry it when the
+    database reports a lock conflict.
+
+    The session is rolled back between attempts and the wait grows
+    exponentially with random jitter so that colliding writers spread out.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except OperationalError as e:
+            db.session.rollback()
+            if attempt == attempts - 1 or not is_lock_error(e):
+                raise
+            time.sleep(base_delay * (2**attempt) * (1 + random.random()))
@@ -0,0 +1,327 @@
+import io
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from flask import current_app, request, send_file
+from werkzeug.wsgi import wrap_file
+
+from app.config import FileConfig
+
+
+class StoredObject(NamedTuple):
+    size: int
+    modified: datetime
+    etag: str
+
+
+class Storage(ABC):
+    """
+    Backend interface for stored files (document blobs and letters).
+
+    Keys are relative, ``/``-separated names such as ``ab/cd/<sha256>``.
+    """
+
+    @abstractmethod
+    def open_write(self, key: str):
+        """
+        Context manager yielding a writable binary file. The object only
+        becomes visible under ``key`` when the block exits without error.
+        """
+
+    @abstractmethod
+    def put_file(self, key: str, path) -> None:
+        """Store a finished local file. The source file may be moved."""
+
+    @abstractmethod
+    def open_read(self, key: str, start: int = 0, end: Optional[int] = None):
+        """Readable binary stream of bytes ``start`` to ``end`` (inclusive)."""
+
+    @abstractmethod
+    def stat(self, key: str) -> Optional[StoredObject]:
+        """Size, modification time and ETag of an object, or None if missing."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an object; missing objects are ignored."""
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """Filesystem path of an object, if the backend has one."""
+        return None
+
+
+class _RangeReader(io.RawIOBase):
+    def __init__(self, f, length):
+        self._f = f
+        self._remaining = length
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._f.read(min(len(buffer), self._remaining))
+        buffer[: len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+class LocalStorage(Storage):
+    """Files under a directory on the local filesystem."""
+
+    ROOTS = {"documents": "UPLOAD_FILE", "letters": "ADMISSION_LETTER"}
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    @classmethod
+    def from_config(cls, config, area):
+        return cls(getattr(FileConfig, cls.ROOTS[area]))
+
+    def _path(self, key: str) -> Path:
+        path = Path(key)
+        # Rows written before storage keys existed hold absolute paths.
+        return path if path.is_absolute() else self.root / key
+
+    @contextmanager
+    def open_write(self, key: str):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def put_file(self, key: str, path) -> None:
+        destination = self._path(key)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, destination)
+
+    def open_read(self, key: str, start: int = 0, end: Optional[int] = None):
+        f = open(self._path(key), "rb")
+        if start:
+            f.seek(start)
+        if end is None:
+            return f
+        return io.BufferedReader(_RangeReader(f, end - start + 1))
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        try:
+            st = self._path(key).stat()
+        except FileNotFoundError:
+            return None
+        return StoredObject(
+            size=st.st_size,
+            modified=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+            etag=f"{st.st_mtime_ns:x}-{st.st_size:x}",
+        )
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def local_path(self, key: str) -> Optional[Path]:
+        return self._path(key)
+
+
+class S3Storage(Storage):
+    """
+    Objects in an S3-compatible bucket (AWS S3, MinIO, ...).
+
+    Requires ``boto3``; the client is created lazily and dropped when the
+    storage is pickled, so instances can be handed to worker processes.
+    """
+
+    # Writes larger than this spill from memory to a temp file before upload.
+    SPOOL_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, bucket, prefix="", endpoint_url=None, region=None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self._client = None
+
+    @classmethod
+    def from_config(cls, config, area):
+        return cls(
+            bucket=config["S3_BUCKET"],
+            prefix=f"{config['S3_PREFIX']}{area}/",
+            endpoint_url=config["S3_ENDPOINT_URL"],
+            region=config["S3_REGION"],
+        )
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise RuntimeError(
+                    "The s3 storage backend requires boto3 (pip install boto3)."
+                ) from e
+            self._client = boto3.client(
+                "s3", endpoint_url=self.endpoint_url, region_name=self.region
+            )
+        return self._client
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_client"] = None
+        return state
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    @contextmanager
+    def open_write(self, key: str):
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE) as f:
+            yield f
+            f.seek(0)
+            self.client.upload_fileobj(f, self.bucket, self._key(key))
+
+    def put_file(self, key: str, path) -> None:
+        self.client.upload_file(str(path), self.bucket, self._key(key))
+
+    def open_read(self, key: str, start: int = 0, end: Optional[int] = None):
+        kwargs = {}
+        if start or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(key), **kwargs)[
+            "Body"
+        ]
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return StoredObject(
+            size=head["ContentLength"],
+            modified=head["LastModified"],
+            etag=head["ETag"].strip('"'),
+        )
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+
+STORAGE_BACKENDS = {"local": LocalStorage, "s3": S3Storage}
+
+
+def get_storage(area: str) -> Storage:
+    """
+    Storage for ``area`` (``"documents"`` or ``"letters"``) using the
+    backend named by ``STORAGE_BACKEND``; one instance per app and area.
+    """
+    cache = current_app.extensions.setdefault("storage", {})
+    if area not in cache:
+        backend = STORAGE_BACKENDS[current_app.config["STORAGE_BACKEND"]]
+        cache[area] = backend.from_config(current_app.config, area)
+    return cache[area]
+
+
+class _ObjectReader(io.RawIOBase):
+    """
+    Seekable reader that opens the backend stream on first read, starting
+    at the current position, so Range responses only fetch what they send
+    and 304 responses fetch nothing.
+    """
+
+    def __init__(self, storage, key):
+        self._storage = storage
+        self._key = key
+        self._pos = 0
+        self._stream = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        if whence != io.SEEK_SET or self._stream is not None:
+            raise io.UnsupportedOperation("Only an initial absolute seek is supported.")
+        self._pos = pos
+        return pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, buffer):
+        if self._stream is None:
+            self._stream = self._storage.open_read(self._key, self._pos)
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+        super().close()
+
+
+def send_stored_file(storage, key, download_name, mimetype, max_age):
+    """
+    Send a stored object as a private, cacheable attachment with ETag,
+    Last-Modified and Range support.
+
+    Local files go through ``send_file`` so Werkzeug can use
+    ``wsgi.file_wrapper``/X-Sendfile; other backends are streamed.
+
+    :return: The response, or None if the object does not exist.
+    """
+    path = storage.local_path(key)
+    if path is not None:
+        if not path.is_file():
+            return None
+        response = send_file(
+            path,
+            as_attachment=True,
+            download_name=download_name,
+            mimetype=mimetype,
+            conditional=True,
+            max_age=max_age,
+        )
+    else:
+        stat = storage.stat(key)
+        if stat is None:
+            return None
+        response = current_app.response_class(
+            wrap_file(request.environ, _ObjectReader(storage, key)),
+            mimetype=mimetype,
+            direct_passthrough=True,
+        )
+        response.headers.set("Content-Disposition", "attachment", filename=download_name)
+        response.content_length = stat.size
+        response.last_modified = stat.modified
+        response.set_etag(stat.etag)
+        response.cache_control.max_age = max_age
+        response = response.make_conditional(
+            request.environ, accept_ranges=True, complete_length=stat.size
+        )
+    # Stored files are per user: browsers may cache them, shared caches may not.
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
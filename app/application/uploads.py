@@ -0,0 +1,174 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from flask import Request, current_app
+from sqlalchemy import select
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from app.application.models import UploadSession
+from app.config import FileConfig
+from app.extensions import db
+
+# Allowance for multipart boundaries, part headers and small form fields on
+# top of the file itself when checking the declared request size.
+MULTIPART_OVERHEAD = 64 * 1024
+# Read size when copying request bodies and stored parts.
+COPY_CHUNK_SIZE = 64 * 1024
+# Highest part number accepted by a resumable upload.
+MAX_PARTS = 10000
+
+
+class HashingUpload:
+    """
+    Writable temp file that hashes and counts bytes as Werkzeug streams an
+    uploaded file part into it.
+
+    Werkzeug's multipart parser writes one buffer (64 KiB) at a time, so an
+    upload never has to fit in memory. Exceeding ``max_size`` aborts the
+    request with 413 as soon as the limit is crossed. Unless :meth:`commit`
+    moves it into place, the temp file is deleted when the request closes
+    its files.
+    """
+
+    def __init__(self, directory, max_size):
+        # Created on first use rather than when the app is imported.
+        os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(dir=directory, suffix=".part")
+        self._file = os.fdopen(fd, "w+b")
+        self._hash = hashlib.sha256()
+        self.max_size = max_size
+        self.size = 0
+        self._committed = False
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        if self.size > self.max_size:
+            # The parser drops this part without handing it to
+            # request.files, so nothing else will ever close it.
+            self.close()
+            raise RequestEntityTooLarge()
+        self._hash.update(data)
+        return self._file.write(data)
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def finish(self) -> str:
+        """Flush the upload to disk and return the temp file's path."""
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+        return self.path
+
+    def commit(self, destination) -> None:
+        """Atomically move the finished upload to ``destination``."""
+        os.replace(self.finish(), destination)
+        self._committed = True
+
+    def close(self) -> None:
+        self._file.close()
+        if not self._committed:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class UploadRequest(Request):
+    """Request class that streams file parts into :class:`HashingUpload`."""
+
+    def _get_file_stream(
+        self, total_content_length, content_type, filename=None, content_length=None
+    ):
+        max_size = current_app.config["UPLOAD_MAX_SIZE"]
+        # Reject before reading any file data when the declared body is
+        # already too large for the biggest allowed upload.
+        if (
+            total_content_length is not None
+            and total_content_length > max_size + MULTIPART_OVERHEAD
+        ):
+            raise RequestEntityTooLarge()
+        return HashingUpload(FileConfig.UPLOAD_FILE, max_size)
+
+
+def parts_dir(upload_id: str) -> Path:
+    """Directory holding the received parts of a resumable upload."""
+    return FileConfig.UPLOAD_FILE / "parts" / upload_id
+
+
+def _part_path(upload_id: str, part_number: int) -> Path:
+    return parts_dir(upload_id) / f"{part_number:05d}"
+
+
+def write_part(upload_id: str, part_number: int, stream, max_size: int):
+    """
+    Stream one part to disk. The part only becomes visible once it has been
+    fully received, so an interrupted PUT can simply be retried.
+
+    :return: ``(size, sha256)`` of the part.
+    """
+    directory = parts_dir(upload_id)
+    directory.mkdir(parents=True, exist_ok=True)
+    part = HashingUpload(directory, max_size)
+    try:
+        while chunk := stream.read(COPY_CHUNK_SIZE):
+            part.write(chunk)
+        part.commit(_part_path(upload_id, part_number))
+    finally:
+        part.close()
+    return part.size, part.sha256
+
+
+def received_parts(upload_id: str) -> dict:
+    """Map of part number to size for every part received so far."""
+    directory = parts_dir(upload_id)
+    if not directory.is_dir():
+        return {}
+    return {
+        int(path.name): path.stat().st_size
+        for path in directory.iterdir()
+        if path.name.isdigit()
+    }
+
+
+def assemble_parts(upload_id: str, part_numbers, max_size: int) -> HashingUpload:
+    """Concatenate parts, in order, into a new :class:`HashingUpload`."""
+    upload = HashingUpload(FileConfig.UPLOAD_FILE, max_size)
+    try:
+        for part_number in part_numbers:
+            with open(_part_path(upload_id, part_number), "rb") as f:
+                while chunk := f.read(COPY_CHUNK_SIZE):
+                    upload.write(chunk)
+    except BaseException:
+        upload.close()
+        raise
+    return upload
+
+
+def discard_parts(upload_id: str) -> None:
+    shutil.rmtree(parts_dir(upload_id), ignore_errors=True)
+
+
+def expire_upload_sessions(ttl_seconds: int) -> int:
+    """Delete upload sessions older than ``ttl_seconds`` and their parts."""
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        seconds=ttl_seconds
+    )
+    expired = db.session.scalars(
+        select(UploadSession).where(UploadSession.created_at < cutoff)
+    ).all()
+    for session in expired:
+        db.session.delete(session)
+    db.session.commit()
+    for session in expired:
+        discard_parts(session.id)
+    return len(expired)
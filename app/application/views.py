@@ -1,75 +1,43 @@
-import json
-from datetime import date, datetime
+import io
+import uuid
+from datetime import date
 from functools import wraps
-from io import BytesIO
-from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
-from flask import request, send_file
+from flask import Response, current_app, request, stream_with_context
 from flask_login import current_user, login_required
 from flask_restx import Namespace, Resource, abort, fields, reqparse
-from pydantic import (BaseModel, EmailStr, Field, ValidationError,
-                      field_validator)
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from werkzeug.datastructures import FileStorage
-
-from app.application.admission_letter import generate_letter
+from werkzeug.utils import secure_filename
+
+from app.application.acceptance import is_accepting
+from app.application.analytics import dashboard
+from app.application.blobs import blob_key, store_upload
+from app.application.bulk import bulk_change_status
+from app.application.catalog import available_courses
+from app.application.completeness import promote_if_complete
+from app.application.export import export_statement, iter_csv, iter_ndjson
+from app.application.imports import (IMPORT_FORMATS, import_applications,
+                                     import_courses)
+from app.application.letters import get_letter_queue
 from app.application.models import (Application, ApplicationAcceptanceSettings,
                                     ApplicationStatus, Document, DocumentType,
-                                    PreferredCourse)
-from app.config import FileConfig
+                                    LetterStatus, PreferredCourse,
+                                    UploadSession)
+from app.application.queries import (decode_cursor, encode_cursor,
+                                      filter_applications)
+from app.application.schemas import ApplicationCreateSchema, CourseCreateSchema
+from app.application.search import search_applications, search_terms
+from app.application.seats import reserve_seat, run_with_lock_retry
+from app.application.storage import get_storage, send_stored_file
+from app.application.uploads import (MAX_PARTS, assemble_parts, discard_parts,
+                                     received_parts, write_part)
 from app.extensions import api, db
-
-
-class ApplicationCreateSchema(BaseModel):
-    full_name: str = Field(..., min_length=1, max_length=255)
-    date_of_birth: date
-    gender: str = Field(..., min_length=1, max_length=10)
-    email: EmailStr
-    phone_number: str = Field(..., min_length=1, max_length=20)
-    address: str = Field(..., min_length=1, max_length=500)
-    nationality: str = Field(..., min_length=1, max_length=100)
-    highest_qualification: str = Field(..., min_length=1, max_length=255)
-    institution_name: str = Field(..., min_length=1, max_length=255)
-    graduation_year: int = Field(..., gt=1900, lt=2100)
-    preferred_course_id: int
-
-    @field_validator("gender")
-    def validate_gender(cls, value: str) -> str:
-        allowed_genders = ["Male", "Female", "Other"]
-        if value.title() not in allowed_genders:
-            raise ValueError(f"Gender must be one of {allowed_genders}")
-        return value.title()
-
-    @field_validator("phone_number")
-    def validate_phone_number(cls, value):
-        if not value.startswith("+") or not value[1:].isdigit():
-            raise ValueError("Phone number must start with '+' and contain only digits")
-        return value
-
-    @field_validator("graduation_year")
-    def validate_graduation_year(cls, value):
-        current_year = datetime.now().year
-        if value > current_year:
-            raise ValueError("Graduation year cannot be greater than the current year")
-        return value
-
-    @field_validator("date_of_birth")
-    def validate_date_of_birth(cls, value):
-        today = date.today()
-        age = (
-            today.year
-            - value.year
-            - ((today.month, today.day) < (value.month, value.day))
-        )
-        if age < 18:
-            raise ValueError("Applicant must be at least 18 years old")
-        return value
-
-
-class CourseCreateSchema(BaseModel):
-    course_name: str = Field(..., min_length=1, max_length=255)
-    max_applications_count: int = Field(..., gt=0)
+from app.validation import error_list, parse_json
 
 
 class StatusChangeSchema(BaseModel):
@@ -82,6 +50,50 @@ class ApplicationAcceptanceSchema(BaseModel):
     end_date: Optional[date] = None
 
 
+class UploadSessionCreateSchema(BaseModel):
+    document_type_id: int
+    filename: str = Field(..., min_length=1, max_length=255)
+
+
+class UploadSessionCompleteSchema(BaseModel):
+    sha256: Optional[str] = Field(None, pattern="^[0-9a-f]{64}$")
+
+
+class ApplicationFilterSchema(BaseModel):
+    status: Optional[ApplicationStatus] = None
+    preferred_course_id: Optional[int] = None
+    created_from: Optional[date] = None
+    created_to: Optional[date] = None
+
+
+class ApplicationListSchema(ApplicationFilterSchema):
+    cursor: Optional[str] = None
+    limit: int = Field(50, gt=0, le=500)
+
+
+class ApplicationSearchSchema(ApplicationListSchema):
+    q: str = Field(min_length=1, max_length=200)
+
+
+class ApplicationExportSchema(ApplicationFilterSchema):
+    format: Literal["ndjson", "csv"] = "ndjson"
+
+
+class ImportSchema(BaseModel):
+    format: Literal["ndjson", "csv"] = "ndjson"
+
+
+class BulkStatusChangeSchema(StatusChangeSchema):
+    application_ids: Optional[list[int]] = Field(None, min_length=1)
+    filters: Optional[ApplicationFilterSchema] = None
+
+    @model_validator(mode="after")
+    def validate_target(self):
+        if (self.application_ids is None) == (self.filters is None):
+            raise ValueError("Provide exactly one of application_ids or filters")
+        return self
+
+
 # Define two namespaces for grouping endpoints.
 user_ns = Namespace("user", description="User operations")
 admin_ns = Namespace("admin", description="Admin operations")
@@ -110,6 +122,20 @@ def user_required(f):
     return decorated
 
 
+def acceptance_required(f):
+    """Reject submissions outside the acceptance window, before the body is read."""
+
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if not is_accepting():
+            abort(  # type: ignore
+                403, "Applications are not being accepted at this time."
+            )
+        return f(*args, **kwargs)
+
+    return decorated
+
+
 # --- Swagger Models (for documentation) ---
 
 application_model = user_ns.model(
@@ -175,9 +201,26 @@ application_setting_model = admin_ns.model(
     },
 )
 
+upload_session_model = user_ns.model(
+    "UploadSession",
+    {
+        "document_type_id": fields.Integer(required=True),
+        "filename": fields.String(required=True),
+    },
+)
+
+upload_complete_model = user_ns.model(
+    "UploadSessionComplete",
+    {"sha256": fields.String(description="Expected SHA-256 of the whole file")},
+)
+
 document_name_model = admin_ns.model(
     "DocumentType",
-    {"id": fields.Integer(readonly=True), "document_type_name": fields.String()},
+    {
+        "id": fields.Integer(readonly=True),
+        "document_type_name": fields.String(),
+        "max_size": fields.Integer(description="Maximum upload size in bytes"),
+    },
 )
 # --- USER ENDPOINTS ---
 
@@ -188,22 +231,14 @@ class CourseList(Resource):
     @user_ns.doc("list_courses")
     def get(self):
         """List all available courses"""
-        courses = PreferredCourse.query.all()
-        result = [
-            {
-                "id": course.id,
-                "course_name": course.course_name,
-            }
-            for course in courses
-            if course.is_available()
-        ]
-        return result, 200
+        return available_courses(), 200
 
 
 @user_ns.route("/applications")
 class UserApplication(Resource):
     @login_required
     @user_required
+    @acceptance_required
     @user_ns.doc("create_application")
     @user_ns.expect(application_create_model)
     def post(self):
@@ -213,34 +248,58 @@ class UserApplication(Resource):
 
         if existing_app:
             return {"message": "Application already exists for this user."}, 400
-        print(request.json)
         try:
-            data = ApplicationCreateSchema.model_validate(request.json)
+            data = parse_json(ApplicationCreateSchema)
         except ValidationError as e:
-            return json.loads(e.json()), 400
+            return error_list(e), 400
 
-        course = PreferredCourse.query.get_or_404(data.preferred_course_id)
-        if not course or not course.is_available():
+        course = db.get_or_404(PreferredCourse, data.preferred_course_id)
+        # Cheap early exit; the conditional UPDATE in reserve_seat is what
+        # actually guarantees the course is not oversubscribed.
+        if not course.is_available():
             return {"message": "Selected course is not available."}, 400
 
-        application = Application(
-            user=current_user.id,
-            full_name=data.full_name,
-            date_of_birth=data.date_of_birth,
-            gender=data.gender,
-            email=data.email,
-            phone_number=data.phone_number,
-            address=data.address,
-            nationality=data.nationality,
-            highest_qualification=data.highest_qualification,
-            institution_name=data.institution_name,
-            graduation_year=data.graduation_year,
-            preferred_course_id=data.preferred_course_id,
-            status=ApplicationStatus.INCOMPLETE,
-        )
-        db.session.add(application)
-        course.applied_count += 1
-        db.session.commit()
+        user_id = current_user.id
+
+        def create_application():
+            if not reserve_seat(data.preferred_course_id):
+                db.session.rollback()
+                return None
+            application = Application(
+                user=user_id,
+                full_name=data.full_name,
+                date_of_birth=data.date_of_birth,
+                gender=data.gender,
+                email=data.email,
+                phone_number=data.phone_number,
+                address=data.address,
+                nationality=data.nationality,
+                highest_qualification=data.highest_qualification,
+                institution_name=data.institution_name,
+                graduation_year=data.graduation_year,
+                preferred_course_id=data.preferred_course_id,
+                status=ApplicationStatus.INCOMPLETE,
+            )
+            db.session.add(application)
+            db.session.commit()
+            return application
+
+        try:
+            application = run_with_lock_retry(create_application)
+        except IntegrityError:
+            # A concurrent request created this user's application first,
+            # or the email is already used by another application. The
+            # constraint is unnamed, so look rather than parse the message.
+            db.session.rollback()
+            if not Application.query.filter_by(user=user_id).first() and (
+                Application.query.filter_by(email=data.email).first()
+            ):
+                return {
+                    "message": "An application with this email already exists."
+                }, 400
+            return {"message": "Application already exists for this user."}, 400
+        if application is None:
+            return {"message": "Selected course is not available."}, 400
         return {
             "message": "Application created successfully.",
             "application_id": application.id,
@@ -296,10 +355,64 @@ upload_parser.add_argument(
 )
 
 
+def save_document(application, document_type, upload, filename):
+    """
+    Store a finished upload as one of the application's documents and move
+    the application to PENDING once every document type has been provided.
+
+    An application holds one document per type: uploading a type again
+    replaces the earlier file.
+
+    :param upload: A :class:`HashingUpload` holding the file contents.
+    :return: Response body and status code.
+    """
+    max_size = document_type.max_size or current_app.config["UPLOAD_MAX_SIZE"]
+    if upload.size > max_size:
+        upload.close()
+        return {"message": f"File exceeds the {max_size} byte limit."}, 413
+
+    document = Document.query.filter_by(
+        application_id=application.id, document_type_id=document_type.id
+    ).first()
+    replaced = document is not None
+    if document is None:
+        document = Document(
+            application_id=application.id, document_type_id=document_type.id
+        )
+        db.session.add(document)
+    document.file_path = blob_key(upload.sha256)
+    document.filename = secure_filename(filename)
+    document.sha256 = upload.sha256
+    document.size = upload.size
+    try:
+        # Flush first so this transaction holds the blob reference before
+        # the object is stored (or found to be a duplicate).
+        db.session.flush()
+    except IntegrityError:
+        # A concurrent upload of the same type inserted it first.
+        db.session.rollback()
+        upload.close()
+        return {"message": "This document is already being uploaded."}, 409
+    store_upload(upload)
+    promote_if_complete(application.id)
+    db.session.commit()
+
+    if replaced:
+        return {
+            "message": "Document replaced successfully.",
+            "document_id": document.id,
+        }, 200
+    return {
+        "message": "Document uploaded successfully.",
+        "document_id": document.id,
+    }, 201
+
+
 @user_ns.route("/documents/upload")
 class DocumentUpload(Resource):
     @login_required
     @user_required
+    @acceptance_required
     @user_ns.doc("upload_document")
     @user_ns.expect(upload_parser)
     def post(self):
@@ -314,9 +427,11 @@ class DocumentUpload(Resource):
         try:
             document_type_id = int(request.form["document_type_id"])
 
-        except Exception as e:
+        # Not a bare Exception: parsing the body may raise 413 for oversized
+        # uploads, which must propagate.
+        except (KeyError, ValueError) as e:
             return str(e), 400
-        DocumentType.query.get_or_404(document_type_id)
+        document_type = db.get_or_404(DocumentType, document_type_id)
 
         if "file" not in request.files:
             return {"message": "No file part in the request."}, 400
@@ -325,30 +440,157 @@ class DocumentUpload(Resource):
         if file.filename == "":
             return {"message": "No selected file."}, 400
 
-        # file_data = file.read()
-        # file_path = f"/path/to/documents/{file.filename}"
-        base_path: Path = FileConfig.UPLOAD_FILE
-        file_path = base_path / f"{current_user.id}_{file.filename}"
-        with open(file_path, "wb") as f:
-            f.write(file.read())
-        document = Document(
+        # UploadRequest has already streamed the file to a temp file in the
+        # upload directory, hashing it on the way.
+        return save_document(application, document_type, file.stream, file.filename)
+
+
+def get_upload_session(upload_id):
+    session = db.session.get(UploadSession, upload_id)
+    if session is None or session.user_id != current_user.id:
+        abort(404, "Upload session not found.")  # type: ignore
+    return session
+
+
+@user_ns.route("/documents/uploads")
+class ResumableUploadList(Resource):
+    @login_required
+    @user_required
+    @acceptance_required
+    @user_ns.doc("create_upload_session")
+    @user_ns.expect(upload_session_model)
+    def post(self):
+        """Start a resumable document upload"""
+        application = Application.query.filter_by(user=current_user.id).first()
+        if not application:
+            return {"message": "No application found."}, 404
+
+        try:
+            data = parse_json(UploadSessionCreateSchema)
+        except ValidationError as e:
+            return error_list(e), 400
+        db.get_or_404(DocumentType, data.document_type_id)
+
+        session = UploadSession(
+            id=uuid.uuid4().hex,
+            user_id=current_user.id,
             application_id=application.id,
-            document_type_id=document_type_id,
-            file_path=str(file_path),
+            document_type_id=data.document_type_id,
+            filename=data.filename,
         )
-        db.session.add(document)
+        db.session.add(session)
         db.session.commit()
-        # Adjust as needed
-        if len(application.documents) >= DocumentType.query.count():
-            application.status = ApplicationStatus.PENDING
-            db.session.commit()
-
         return {
-            "message": "Document uploaded successfully.",
-            "document_id": document.id,
+            "message": "Upload session created.",
+            "upload_id": session.id,
+            "max_part_number": MAX_PARTS,
         }, 201
 
 
+@user_ns.route("/documents/uploads/<string:upload_id>")
+class ResumableUpload(Resource):
+    @login_required
+    @user_required
+    @user_ns.doc("get_upload_session")
+    def get(self, upload_id):
+        """List the parts received so far"""
+        session = get_upload_session(upload_id)
+        parts = received_parts(upload_id)
+        return {
+            "upload_id": session.id,
+            "document_type_id": session.document_type_id,
+            "filename": session.filename,
+            "parts": [
+                {"part_number": number, "size": parts[number]}
+                for number in sorted(parts)
+            ],
+        }, 200
+
+    @login_required
+    @user_required
+    @user_ns.doc("abort_upload_session")
+    def delete(self, upload_id):
+        """Abort a resumable upload and discard its parts"""
+        session = get_upload_session(upload_id)
+        db.session.delete(session)
+        db.session.commit()
+        discard_parts(upload_id)
+        return {"message": "Upload session aborted."}, 200
+
+
+@user_ns.route("/documents/uploads/<string:upload_id>/parts/<int:part_number>")
+class ResumableUploadPart(Resource):
+    @login_required
+    @user_required
+    @acceptance_required
+    @user_ns.doc("upload_part")
+    def put(self, upload_id, part_number):
+        """Upload one part (raw request body); parts may arrive in any order"""
+        if not 1 <= part_number <= MAX_PARTS:
+            return {"message": f"Part number must be between 1 and {MAX_PARTS}."}, 400
+        session = get_upload_session(upload_id)
+
+        document_type = db.session.get(DocumentType, session.document_type_id)
+        max_size = document_type.max_size or current_app.config["UPLOAD_MAX_SIZE"]
+        # The whole file must fit the limit, so bound each part by what the
+        # other parts have left rather than letting a session fill the disk
+        # before `complete` checks the total. A resent part replaces itself.
+        received = received_parts(upload_id)
+        remaining = max_size - sum(
+            size for number, size in received.items() if number != part_number
+        )
+        if request.content_length is not None and request.content_length > remaining:
+            return {"message": f"File exceeds the {max_size} byte limit."}, 413
+        size, sha256 = write_part(upload_id, part_number, request.stream, remaining)
+        return {"part_number": part_number, "size": size, "sha256": sha256}, 200
+
+
+@user_ns.route("/documents/uploads/<string:upload_id>/complete")
+class ResumableUploadComplete(Resource):
+    @login_required
+    @user_required
+    @acceptance_required
+    @user_ns.doc("complete_upload_session")
+    @user_ns.expect(upload_complete_model)
+    def post(self, upload_id):
+        """Assemble the parts into a document"""
+        session = get_upload_session(upload_id)
+        try:
+            data = UploadSessionCompleteSchema.model_validate(
+                request.get_json(silent=True) or {}
+            )
+        except ValidationError as e:
+            return error_list(e), 400
+
+        parts = received_parts(upload_id)
+        if not parts:
+            return {"message": "No parts uploaded."}, 400
+        missing = sorted(set(range(1, max(parts) + 1)) - parts.keys())
+        if missing:
+            return {"message": "Missing parts.", "missing_parts": missing}, 400
+
+        document_type = db.session.get(DocumentType, session.document_type_id)
+        max_size = document_type.max_size or current_app.config["UPLOAD_MAX_SIZE"]
+        if sum(parts.values()) > max_size:
+            return {"message": f"File exceeds the {max_size} byte limit."}, 413
+
+        upload = assemble_parts(upload_id, sorted(parts), max_size)
+        if data.sha256 and upload.sha256 != data.sha256:
+            upload.close()
+            return {"message": "Checksum mismatch.", "sha256": upload.sha256}, 400
+
+        application = db.session.get(Application, session.application_id)
+        body, status = save_document(
+            application, document_type, upload, session.filename
+        )
+        if 200 <= status < 300:
+            # Kept on failure so the client can retry without resending.
+            db.session.delete(session)
+            db.session.commit()
+            discard_parts(upload_id)
+        return body, status
+
+
 @user_ns.route("/status")
 class ApplicationStatusCheck(Resource):
     @login_required
@@ -361,6 +603,9 @@ class ApplicationStatusCheck(Resource):
         return {
             "application_id": application.id,
             "status": application.status.value,
+            "letter_status": (
+                application.letter_status.value if application.letter_status else None
+            ),
         }, 200
 
 
@@ -374,20 +619,28 @@ class DownloadLetter(Resource):
         if not application:
             return {"message": "No application found."}, 404
 
+        if application.status == ApplicationStatus.APPROVED and (
+            application.letter_status in (LetterStatus.PENDING, LetterStatus.RENDERING)
+        ):
+            return {"message": "Admission letter is being generated."}, 400
         if (
             application.status != ApplicationStatus.APPROVED
             or not application.admission_letter_path
         ):
             return {"message": "Admission letter not available."}, 400
 
-        fake_file = BytesIO(b"This is your admission letter content.")
-        fake_file.seek(0)
-        return send_file(
-            fake_file,
-            as_attachment=True,
+        # Answers If-None-Match / If-Modified-Since / Range requests; local
+        # letters still go out through wsgi.file_wrapper (or X-Sendfile).
+        response = send_stored_file(
+            get_storage("letters"),
+            application.admission_letter_path,
             download_name="admission_letter.pdf",
             mimetype="application/pdf",
+            max_age=current_app.config["LETTER_CACHE_MAX_AGE"],
         )
+        if response is None:
+            return {"message": "Admission letter not available."}, 404
+        return response
 
 
 # --- ADMIN ENDPOINTS ---
@@ -418,9 +671,9 @@ class AdminCourseList(Resource):
     def post(self):
         """Add a new course"""
         try:
-            data = CourseCreateSchema.model_validate(request.get_json())
+            data = parse_json(CourseCreateSchema)
         except ValidationError as e:
-            return e.errors(), 400
+            return error_list(e), 400
 
         course = PreferredCourse(
             course_name=data.course_name,
@@ -432,6 +685,46 @@ class AdminCourseList(Resource):
         return {"message": "Course created successfully.", "course_id": course.id}, 201
 
 
+import_parser = reqparse.RequestParser()
+import_parser.add_argument(
+    "format",
+    type=str,
+    default="ndjson",
+    choices=list(IMPORT_FORMATS),
+    help="Format of the request body",
+    location="args",
+)
+
+
+def run_import(importer):
+    """
+    Feed the request body to ``importer`` line by line, so large files are
+    never held in memory, and return the import report.
+    """
+    try:
+        params = ImportSchema.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return error_list(e), 400
+    lines = io.TextIOWrapper(request.stream, encoding="utf-8", newline="")
+    try:
+        report = importer(lines, params.format)
+    except UnicodeDecodeError:
+        # Batches before the undecodable line have already been committed.
+        return {"message": "Import files must be UTF-8 encoded."}, 400
+    return report.to_dict(), 200
+
+
+@admin_ns.route("/courses/import")
+class AdminCourseImport(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.doc("import_courses")
+    @admin_ns.expect(import_parser)
+    def post(self):
+        """Create courses from a CSV or NDJSON request body"""
+        return run_import(import_courses)
+
+
 @admin_ns.route("/documents")
 class AdminDocumentList(Resource):
     @login_required
@@ -444,6 +737,7 @@ class AdminDocumentList(Resource):
             {
                 "id": doc.id,
                 "document_type_name": doc.document_type_name,
+                "max_size": doc.max_size,
             }
             for doc in docs
         ], 200
@@ -455,6 +749,9 @@ class AdminDocumentList(Resource):
     def post(self):
         data = request.get_json()
         document_type_name = data.get("document_type_name")
+        max_size = data.get("max_size")
+        if max_size is not None and (not isinstance(max_size, int) or max_size <= 0):
+            return {"message": "max_size must be a positive number of bytes."}, 400
 
         # Check if the document type already exists
         existing_doc = DocumentType.query.filter_by(
@@ -466,7 +763,7 @@ class AdminDocumentList(Resource):
             }, 400  # Return an error response
 
         try:
-            doc = DocumentType(document_type_name=document_type_name)
+            doc = DocumentType(document_type_name=document_type_name, max_size=max_size)
             db.session.add(doc)
             db.session.commit()
             return {
@@ -478,24 +775,191 @@ class AdminDocumentList(Resource):
             return {"message": "A document with this name already exists."}, 400
 
 
+application_list_parser = reqparse.RequestParser()
+application_list_parser.add_argument(
+    "cursor", type=str, help="Opaque cursor from a previous page", location="args"
+)
+application_list_parser.add_argument(
+    "limit", type=int, default=50, help="Page size (max 500)", location="args"
+)
+application_list_parser.add_argument(
+    "status",
+    type=str,
+    choices=[i.value for i in ApplicationStatus],
+    help="Filter by status",
+    location="args",
+)
+application_list_parser.add_argument(
+    "preferred_course_id", type=int, help="Filter by course", location="args"
+)
+application_list_parser.add_argument(
+    "created_from", type=str, help="Created on or after (YYYY-MM-DD)", location="args"
+)
+application_list_parser.add_argument(
+    "created_to", type=str, help="Created on or before (YYYY-MM-DD)", location="args"
+)
+
+
 @admin_ns.route("/applications")
 class AdminApplicationList(Resource):
     @login_required
     @admin_required
     @admin_ns.doc("list_applications")
+    @admin_ns.expect(application_list_parser)
     def get(self):
-        """Get list of all applications"""
-        applications = Application.query.all()
-        result = [
-            {
-                "id": app.id,
-                "full_name": app.full_name,
-                "email": app.email,
-                "status": app.status.value,
-            }
-            for app in applications
-        ]
-        return result, 200
+        """Get a page of applications, ordered by id"""
+        try:
+            params = ApplicationListSchema.model_validate(request.args.to_dict())
+            after_id = decode_cursor(params.cursor) if params.cursor else 0
+        except ValidationError as e:
+            return error_list(e), 400
+        except ValueError as e:
+            return {"message": str(e)}, 400
+
+        query = db.session.query(
+            Application.id, Application.full_name, Application.email, Application.status
+        )
+        query = filter_applications(query, params)
+        # Fetch one extra row to know whether another page exists.
+        rows = (
+            query.filter(Application.id > after_id)
+            .order_by(Application.id)
+            .limit(params.limit + 1)
+            .all()
+        )
+        has_more = len(rows) > params.limit
+        rows = rows[: params.limit]
+        return {
+            "applications": [
+                {
+                    "id": row.id,
+                    "full_name": row.full_name,
+                    "email": row.email,
+                    "status": row.status.value,
+                }
+                for row in rows
+            ],
+            "next_cursor": encode_cursor(rows[-1].id) if has_more else None,
+        }, 200
+
+
+application_search_parser = application_list_parser.copy()
+application_search_parser.add_argument(
+    "q",
+    type=str,
+    required=True,
+    help="Name, email, phone or institution (each term 3+ characters)",
+    location="args",
+)
+
+
+@admin_ns.route("/applications/search")
+class AdminApplicationSearch(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.doc("search_applications")
+    @admin_ns.expect(application_search_parser)
+    def get(self):
+        """Search applications by applicant, best matches first"""
+        try:
+            params = ApplicationSearchSchema.model_validate(request.args.to_dict())
+            offset = decode_cursor(params.cursor, kind="s") if params.cursor else 0
+            terms = search_terms(params.q)
+        except ValidationError as e:
+            return error_list(e), 400
+        except ValueError as e:
+            return {"message": str(e)}, 400
+
+        query = select(
+            Application.id,
+            Application.full_name,
+            Application.email,
+            Application.phone_number,
+            Application.institution_name,
+            Application.status,
+        )
+        query = filter_applications(query, params)
+        query = search_applications(query, terms, db.session.get_bind().dialect.name)
+        # Fetch one extra row to know whether another page exists.
+        rows = db.session.execute(
+            query.offset(offset).limit(params.limit + 1)
+        ).all()
+        has_more = len(rows) > params.limit
+        rows = rows[: params.limit]
+        return {
+            "applications": [
+                {
+                    "id": row.id,
+                    "full_name": row.full_name,
+                    "email": row.email,
+                    "phone_number": row.phone_number,
+                    "institution_name": row.institution_name,
+                    "status": row.status.value,
+                }
+                for row in rows
+            ],
+            "next_cursor": (
+                encode_cursor(offset + len(rows), kind="s") if has_more else None
+            ),
+        }, 200
+
+
+@admin_ns.route("/applications/import")
+class AdminApplicationImport(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.doc("import_applications")
+    @admin_ns.expect(import_parser)
+    def post(self):
+        """Create applications from a CSV or NDJSON request body"""
+        return run_import(import_applications)
+
+
+application_export_parser = application_list_parser.copy()
+application_export_parser.remove_argument("cursor")
+application_export_parser.remove_argument("limit")
+application_export_parser.add_argument(
+    "format",
+    type=str,
+    default="ndjson",
+    choices=["ndjson", "csv"],
+    help="Output format",
+    location="args",
+)
+
+
+@admin_ns.route("/applications/export")
+class AdminApplicationExport(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.doc("export_applications")
+    @admin_ns.expect(application_export_parser)
+    def get(self):
+        """Stream every matching application as NDJSON or CSV"""
+        try:
+            params = ApplicationExportSchema.model_validate(request.args.to_dict())
+        except ValidationError as e:
+            return error_list(e), 400
+
+        def generate():
+            rows = db.session.execute(export_statement(params))
+            try:
+                if params.format == "csv":
+                    yield from iter_csv(rows)
+                else:
+                    yield from iter_ndjson(rows)
+            finally:
+                rows.close()
+
+        if params.format == "csv":
+            mimetype, filename = "text/csv", "applications.csv"
+        else:
+            mimetype, filename = "application/x-ndjson", "applications.ndjson"
+        return Response(
+            stream_with_context(generate()),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
 
 
 application_status = reqparse.RequestParser()
@@ -509,6 +973,43 @@ application_status.add_argument(
 )
 
 
+bulk_status_model = admin_ns.model(
+    "BulkStatusChange",
+    {
+        "status": fields.String(
+            required=True, enum=[i.value for i in ApplicationStatus]
+        ),
+        "application_ids": fields.List(fields.Integer()),
+        "filters": fields.Raw(
+            description="status, preferred_course_id, created_from, created_to"
+        ),
+    },
+)
+
+
+@admin_ns.route("/applications/status")
+class AdminBulkApplicationStatus(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.expect(bulk_status_model)
+    @admin_ns.doc("bulk_change_application_status")
+    def put(self):
+        """Change the status of many applications at once"""
+        try:
+            data = parse_json(BulkStatusChangeSchema)
+        except ValidationError as e:
+            return error_list(e), 400
+
+        updated = bulk_change_status(
+            data.status, application_ids=data.application_ids, filters=data.filters
+        )
+        return {
+            "message": "Application statuses updated.",
+            "status": data.status.value,
+            "updated": updated,
+        }, 200
+
+
 @admin_ns.route("/applications/<int:application_id>/status")
 class AdminApplicationStatus(Resource):
     @login_required
@@ -521,9 +1022,9 @@ class AdminApplicationStatus(Resource):
         try:
             data = StatusChangeSchema(**request.form)
         except ValueError as e:
-            return json.loads(e.json()), 400
+            return error_list(e), 400
 
-        application = Application.query.get(application_id)
+        application = db.session.get(Application, application_id)
         if not application:
             return {"message": "Application not found."}, 404
 
@@ -536,7 +1037,9 @@ class AdminApplicationStatus(Resource):
                 "status": application.status.value,
             }, 200
         if data.status == ApplicationStatus.APPROVED:
-            application.admission_letter_path = generate_letter(application)
+            # The letter is rendered by the `flask letters work` worker.
+            application.letter_status = LetterStatus.PENDING
+            get_letter_queue().enqueue([application.id])
 
         application.status = data.status
         db.session.commit()
@@ -544,9 +1047,37 @@ class AdminApplicationStatus(Resource):
             "message": "Application status updated.",
             "application_id": application.id,
             "status": application.status.value,
+            "letter_status": (
+                application.letter_status.value if application.letter_status else None
+            ),
         }, 200
 
 
+@admin_ns.route("/metrics")
+class AdminMetrics(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.doc("metrics")
+    def get(self):
+        """Per-endpoint request, SQL and latency metrics (Prometheus format)"""
+        metrics = current_app.extensions.get("metrics")
+        if metrics is None:
+            return {"message": "Metrics are disabled."}, 404
+        return Response(
+            metrics.render_prometheus(), mimetype="text/plain; version=0.0.4"
+        )
+
+
+@admin_ns.route("/analytics")
+class AdminAnalytics(Resource):
+    @login_required
+    @admin_required
+    @admin_ns.doc("analytics")
+    def get(self):
+        """Application counts by status, course, nationality and qualification"""
+        return dashboard(), 200
+
+
 @admin_ns.route("/acceptance")
 class AdminApplicationAcceptance(Resource):
     @login_required
@@ -559,9 +1090,9 @@ class AdminApplicationAcceptance(Resource):
         Optionally, update start_date and end_date.
         """
         try:
-            data = ApplicationAcceptanceSchema.model_validate(request.get_json())
+            data = parse_json(ApplicationAcceptanceSchema)
         except ValidationError as e:
-            return e.errors(), 400
+            return error_list(e), 400
 
         settings = ApplicationAcceptanceSettings.query.first()
         if not settings:
@@ -571,7 +1102,12 @@ class AdminApplicationAcceptance(Resource):
         settings.is_enabled = data.is_enabled
         settings.start_date = data.start_date
         settings.end_date = data.end_date
-        db.session.commit()
+        try:
+            db.session.commit()
+        except StaleDataError:
+            # Another admin updated the settings since they were read.
+            db.session.rollback()
+            return {"message": "Settings were changed concurrently; retry."}, 409
         return {
             "message": "Application acceptance settings updated.",
             "is_enabled": settings.is_enabled,
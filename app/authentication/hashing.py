@@ -0,0 +1,99 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+def _hash(password: str, method: str) -> str:
+    return generate_password_hash(password, method=method)
+
+
+def _verify(pwhash: str, password: str) -> bool:
+    return check_password_hash(pwhash, password)
+
+
+class PasswordHasher:
+    """
+    Runs password hashing on a bounded process pool.
+
+    Hashing is deliberately slow, so doing it on the request thread lets a
+    burst of registrations or logins starve every other endpoint. Here at
+    most ``max_pending`` hashes may be running or queued; further callers
+    get :class:`HasherBusy` immediately instead of waiting. With
+    ``workers=0`` hashing runs in the calling thread, still bounded.
+
+    :raises ValueError: if ``max_pending`` is less than 1.
+    """
+
+    def __init__(self, method: str, workers: int, max_pending: int):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.method = method
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            method=config["PASSWORD_HASH_METHOD"],
+            workers=config["PASSWORD_HASH_WORKERS"],
+            max_pending=config["PASSWORD_HASH_MAX_PENDING"],
+        )
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            if not self.workers:
+                return fn(*args)
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.method)
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        return self._run(_verify, pwhash, password)
+
+    @cached_property
+    def _prefix(self) -> str:
+        # Expands shorthands such as "scrypt" to the full parameter string.
+        # This is a full hash, so it takes a slot like any other.
+        return self.hash("").split("$", 1)[0]
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """
+        Whether ``pwhash`` was made with other parameters than ``method``.
+
+        :raises HasherBusy: on the first call, while the pool is full.
+        """
+        return pwhash.split("$", 1)[0] != self._prefix
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    if "password_hasher" not in current_app.extensions:
+        current_app.extensions["password_hasher"] = PasswordHasher.from_config(
+            current_app.config
+        )
+    return current_app.extensions["password_hasher"]
@@ -0,0 +1,168 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from flask import current_app, has_app_context, session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, object_session
+
+from app.authentication.models import RoleEnum, User
+from app.extensions import db
+
+# Session key holding the identifier the principal cache is keyed by.
+SESSION_ID_KEY = "_sid"
+_EVICT_KEY = "principal_evict"
+
+
+class Principal:
+    """
+    The part of a user that authentication and authorization need.
+
+    Loaded for every authenticated request in place of a full ``User``.
+    """
+
+    __slots__ = ("id", "role")
+
+    is_authenticated = True
+    is_active = True
+    is_anonymous = False
+
+    def __init__(self, id: int, role: RoleEnum):
+        self.id = id
+        self.role = role
+
+    def get_id(self) -> str:
+        return str(self.id)
+
+    def is_admin(self) -> bool:
+        return self.role == RoleEnum.ADMIN
+
+    def __repr__(self) -> str:
+        return f"<Principal {self.id} ({self.role.value})>"
+
+
+class PrincipalCache:
+    """Thread-safe LRU of principals by session id, with a TTL per entry."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return principal
+
+    def put(self, session_id: str, principal: Principal) -> None:
+        with self._lock:
+            self._entries[session_id] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def discard_user(self, user_id: int) -> None:
+        """Drop every cached session of ``user_id``."""
+        with self._lock:
+            stale = [
+                key
+                for key, (_, principal) in self._entries.items()
+                if principal.id == user_id
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_principal_cache() -> PrincipalCache:
+    if "principal_cache" not in current_app.extensions:
+        current_app.extensions["principal_cache"] = PrincipalCache(
+            max_size=current_app.config["AUTH_CACHE_SIZE"],
+            ttl=current_app.config["AUTH_CACHE_TTL"],
+        )
+    return current_app.extensions["principal_cache"]
+
+
+def start_session() -> None:
+    """Give the current session a fresh id; call right after ``login_user``."""
+    session[SESSION_ID_KEY] = secrets.token_urlsafe(16)
+
+
+def end_session() -> None:
+    """Forget the current session's principal; call before ``logout_user``."""
+    session_id = session.pop(SESSION_ID_KEY, None)
+    if session_id is not None:
+        get_principal_cache().discard(session_id)
+
+
+def load_principal(user_id) -> Optional[Principal]:
+    """
+    Flask-Login ``user_loader``: return the principal for ``user_id``,
+    from the cache when this session has already been seen.
+    """
+    user_id = int(user_id)
+    cache = get_principal_cache()
+    session_id = session.get(SESSION_ID_KEY)
+    if session_id is not None:
+        principal = cache.get(session_id)
+        if principal is not None and principal.id == user_id:
+            return principal
+
+    row = db.session.execute(
+        select(User.id, User.role).where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None
+    principal = Principal(row.id, row.role)
+    if session_id is None:
+        # Sessions created before session ids existed get one now.
+        session_id = secrets.token_urlsafe(16)
+        session[SESSION_ID_KEY] = session_id
+    cache.put(session_id, principal)
+    return principal
+
+
+@event.listens_for(User, "after_update")
+def _role_changed(mapper, connection, target):
+    if inspect(target).attrs.role.history.has_changes():
+        _evict_after_commit(object_session(target), target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target):
+    _evict_after_commit(object_session(target), target.id)
+
+
+def _evict_after_commit(db_session, user_id) -> None:
+    if db_session is not None:
+        db_session.info.setdefault(_EVICT_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_principals(db_session):
+    user_ids = db_session.info.pop(_EVICT_KEY, None)
+    if user_ids and has_app_context():
+        cache = get_principal_cache()
+        for user_id in user_ids:
+            cache.discard_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_evictions(db_session):
+    db_session.info.pop(_EVICT_KEY, None)
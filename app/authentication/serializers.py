@@ -29,3 +29,11 @@ login_model = auth_ns.model(
         "password": fields.String(required=True, description="User password"),
     },
 )
+
+
+refresh_model = auth_ns.model(
+    "TokenRefresh",
+    {
+        "refresh_token": fields.String(required=True, description="Refresh token"),
+    },
+)
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+from app.authentication.models import RoleEnum
+from app.authentication.principal import Principal
+
+ACCESS_SALT = "auth.access"
+REFRESH_SALT = "auth.refresh"
+
+
+def _serializer(salt: str) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(current_app.config["SECRET_KEY"], salt=salt)
+
+
+def issue_tokens(user_id: int, role: RoleEnum) -> dict:
+    """
+    Signed access and refresh tokens for a user.
+
+    The access token carries the id and role, so it can be checked on any
+    node without a database lookup; the refresh token only carries the id.
+    """
+    config = current_app.config
+    return {
+        "access_token": _serializer(ACCESS_SALT).dumps(
+            {"sub": user_id, "role": role.value}
+        ),
+        "refresh_token": _serializer(REFRESH_SALT).dumps({"sub": user_id}),
+        "token_type": "Bearer",
+        "expires_in": config["ACCESS_TOKEN_TTL"],
+    }
+
+
+def verify_access_token(token: str) -> Optional[Principal]:
+    """The principal in a valid, unexpired access token, or None."""
+    try:
+        claims = _serializer(ACCESS_SALT).loads(
+            token, max_age=current_app.config["ACCESS_TOKEN_TTL"]
+        )
+        return Principal(int(claims["sub"]), RoleEnum(claims["role"]))
+    except (BadSignature, KeyError, TypeError, ValueError):
+        return None
+
+
+def verify_refresh_token(token: str) -> Optional[int]:
+    """The user id in a valid, unexpired refresh token, or None."""
+    try:
+        claims = _serializer(REFRESH_SALT).loads(
+            token, max_age=current_app.config["REFRESH_TOKEN_TTL"]
+        )
+        return int(claims["sub"])
+    except (BadSignature, KeyError, TypeError, ValueError):
+        return None
+
+
+def load_principal_from_request(request) -> Optional[Principal]:
+    """
+    Flask-Login ``request_loader``: authenticate a request carrying
+    ``Authorization: Bearer <access token>`` when token mode is enabled.
+    """
+    if not current_app.config["AUTH_TOKENS_ENABLED"]:
+        return None
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return verify_access_token(token.strip())
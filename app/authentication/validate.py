@@ -14,3 +14,7 @@ class UserDTO(BaseModel):
 class UserLoginDTO(BaseModel):
     email: EmailStr
     password: str
+
+
+class RefreshDTO(BaseModel):
+    refresh_token: str
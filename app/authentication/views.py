@@ -1,26 +1,37 @@
-from flask import request
+from flask import current_app, request
 from flask_login import current_user, login_required, login_user, logout_user
 from flask_restx import Resource
 from pydantic import ValidationError
+from sqlalchemy import select
 
+from app.authentication.hashing import HasherBusy, get_password_hasher
 from app.authentication.models import RoleEnum, User
-from app.authentication.validate import UserDTO, UserLoginDTO
+from app.authentication.principal import end_session, start_session
+from app.authentication.tokens import issue_tokens, verify_refresh_token
+from app.authentication.validate import RefreshDTO, UserDTO, UserLoginDTO
 from app.extensions import db
+from app.validation import parse_json
 
-from .serializers import auth_ns, login_model, user_model
+from .serializers import auth_ns, login_model, refresh_model, user_model
+
+# Returned when the password hashing queue is full.
+BUSY_RESPONSE = (
+    {"message": "Too many requests, please retry shortly."},
+    429,
+    {"Retry-After": "1"},
+)
 
 
 @auth_ns.route("/register")
 class Register(Resource):
     @auth_ns.expect(user_model)
     def post(self):
-        data = request.json
-        if not data:
+        if not request.get_data():
             return {"message": "No input data provided"}, 400
 
         try:
-            validated_data = UserDTO(**data)
-        except (ValueError, ValidationError) as e:
+            validated_data = parse_json(UserDTO)
+        except ValidationError as e:
             return {"error": str(e)}, 400
 
         if User.query.filter_by(email=validated_data.email).first():
@@ -32,7 +43,10 @@ class Register(Resource):
             return {"message": "Cannot create admin user"}, 403
 
         user = User(**validated_data.model_dump())
-        user.set_password(validated_data.password)
+        try:
+            user.password = get_password_hasher().hash(validated_data.password)
+        except HasherBusy:
+            return BUSY_RESPONSE
         db.session.add(user)
         db.session.commit()
         return {"message": "User created successfully"}, 201
@@ -45,23 +59,66 @@ class Login(Resource):
         """
         Log in a user.
         """
-        if request.json is None:
+        if not request.get_data():
             return {"message": "No input data provided."}, 400
         try:
-            data = UserLoginDTO(**request.json)
-        except (ValueError, ValidationError) as e:
+            data = parse_json(UserLoginDTO)
+        except ValidationError as e:
             return {"error": str(e)}, 400
 
         user = User.query.filter_by(email=data.email).first()
-        if user is None or not user.check_password(data.password):
+        if user is None:
             return {"message": "Invalid credentials."}, 401
+        hasher = get_password_hasher()
+        try:
+            if not hasher.verify(user.password, data.password):
+                return {"message": "Invalid credentials."}, 401
+            # Upgrade hashes made with older parameters while the plain
+            # password is at hand.
+            if hasher.needs_rehash(user.password):
+                user.password = hasher.hash(data.password)
+                db.session.commit()
+        except HasherBusy:
+            return BUSY_RESPONSE
 
         login_user(user)
-        return {
+        start_session()
+        response = {
             "message": "Logged in successfully.",
             "name": user.name,
             "is_admin": user.role == RoleEnum.ADMIN,
         }
+        if current_app.config["AUTH_TOKENS_ENABLED"]:
+            response.update(issue_tokens(user.id, user.role))
+        return response
+
+
+@auth_ns.route("/refresh")
+class Refresh(Resource):
+    @auth_ns.expect(refresh_model)
+    def post(self):
+        """
+        Exchange a refresh token for a new access and refresh token pair.
+        """
+        if not current_app.config["AUTH_TOKENS_ENABLED"]:
+            return {"message": "Token authentication is disabled."}, 404
+        if not request.get_data():
+            return {"message": "No input data provided."}, 400
+        try:
+            data = parse_json(RefreshDTO)
+        except ValidationError as e:
+            return {"error": str(e)}, 400
+
+        user_id = verify_refresh_token(data.refresh_token)
+        user = None
+        if user_id is not None:
+            # Re-read the role so a change reaches new access tokens.
+            user = db.session.execute(
+                select(User.id, User.role).where(User.id == user_id)
+            ).first()
+        if user is None:
+            return {"message": "Invalid or expired refresh token."}, 401
+        return issue_tokens(user.id, user.role)
 
 
 @auth_ns.route("/logout")
@@ -71,5 +128,6 @@ class Logout(Resource):
         """
         Log out the currently logged-in user.
         """
+        end_session()
         logout_user()
         return {"message": "Logged out successfully."}, 200
@@ -0,0 +1,164 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from flask import current_app
+
+
+class SharedCache(ABC):
+    """
+    Key/value store shared by every process serving the app, used to
+    publish cached values and their versions between processes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the value stored under ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: int) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment the counter ``key`` and return its new value."""
+
+
+class LocalSharedCache(SharedCache):
+    """
+    In-process stand-in for a shared cache, for development and tests.
+
+    It is only shared between the threads of one process.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls()
+
+    def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            return None
+        return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self.get(key) or 0) + 1
+            self._data[key] = (str(value), None)
+            return value
+
+
+class RedisSharedCache(SharedCache):
+    """Shared cache in Redis. Requires ``redis``."""
+
+    def __init__(self, url, prefix="applytrack:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis shared cache requires redis (pip install redis)."
+            ) from e
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config["REDIS_URL"])
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(self.prefix + key)
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._client.set(self.prefix + key, value, ex=max(int(ttl), 1))
+
+    def incr(self, key: str) -> int:
+        return self._client.incr(self.prefix + key)
+
+
+SHARED_CACHE_BACKENDS = {"local": LocalSharedCache, "redis": RedisSharedCache}
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """The shared cache named by ``SHARED_CACHE_BACKEND``, or None if unset."""
+    backend = current_app.config["SHARED_CACHE_BACKEND"]
+    if backend is None:
+        return None
+    if "shared_cache" not in current_app.extensions:
+        current_app.extensions["shared_cache"] = SHARED_CACHE_BACKENDS[
+            backend
+        ].from_config(current_app.config)
+    return current_app.extensions["shared_cache"]
+
+
+class VersionedCache:
+    """
+    In-process cache of one JSON-serializable value.
+
+    Reads are served from memory until ``ttl`` seconds have passed or
+    :meth:`invalidate` is called in this process. With a ``shared`` cache,
+    invalidation also bumps a version there, and a process whose copy has
+    expired reloads from the shared cache under the current version before
+    falling back to ``loader``. Other processes therefore see a change
+    within ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable,
+        ttl: float,
+        shared: Optional[SharedCache] = None,
+    ):
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.shared = shared
+        self._entry = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self):
+        entry = self._entry
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        with self._lock:
+            # Another thread may have refreshed while this one waited.
+            entry = self._entry
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            return self._refresh()
+
+    def _refresh(self):
+        generation = self._generation
+        if self.shared is None:
+            value = self.loader()
+        else:
+            key = f"{self.name}:{self.shared.get(f'{self.name}:version') or 0}"
+            payload = self.shared.get(key)
+            if payload is not None:
+                value = json.loads(payload)
+            else:
+                value = self.loader()
+                self.shared.set(key, json.dumps(value), self.ttl)
+        # Do not keep a value loaded before a concurrent invalidation.
+        if generation == self._generation:
+            self._entry = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._entry = None
+        if self.shared is not None:
+            self.shared.incr(f"{self.name}:version")
@@ -1,13 +1,14 @@
-from dataclasses import dataclass
+import os
+import typing
+from dataclasses import MISSING, dataclass, fields
 from pathlib import Path
+from typing import Optional
 
 
 class FileConfig:
     BASE_DIR = Path(__file__).parent.parent
     UPLOAD_FILE = BASE_DIR / "UPLOADS"
     ADMISSION_LETTER = BASE_DIR / "ADMISSION_LETTER"
-    UPLOAD_FILE.mkdir(parents=True, exist_ok=True)
-    ADMISSION_LETTER.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass
@@ -16,11 +17,118 @@ class AppConfig:
     SQLALCHEMY_DATABASE_URI: str
     DEBUG: bool = False
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
+    # Seconds before a pooled connection is replaced; -1 keeps it forever.
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    # Milliseconds a writer waits for the database lock.
+    SQLITE_BUSY_TIMEOUT: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
     TESTING: bool = False
+    LETTER_QUEUE_BACKEND: str = "database"
+    LETTER_WORKER_PROCESSES: int = 2
+    LETTER_MAX_ATTEMPTS: int = 3
+    LETTER_RETRY_DELAY: int = 30
+    LETTER_CLAIM_TIMEOUT: int = 600
+    LETTER_CACHE_MAX_AGE: int = 86400
+    UPLOAD_MAX_SIZE: int = 20 * 1024 * 1024
+    UPLOAD_SESSION_TTL: int = 86400
+    STORAGE_BACKEND: str = "local"
+    S3_BUCKET: Optional[str] = None
+    S3_ENDPOINT_URL: Optional[str] = None
+    S3_REGION: Optional[str] = None
+    S3_PREFIX: str = ""
+    COURSE_CATALOG_TTL: int = 30
+    # Seconds between checks for acceptance settings changed by other processes.
+    ACCEPTANCE_CHECK_INTERVAL: int = 5
+    DOCUMENT_TYPE_CACHE_TTL: int = 300
+    SHARED_CACHE_BACKEND: Optional[str] = None
+    REDIS_URL: Optional[str] = None
+    AUTH_CACHE_SIZE: int = 10000
+    AUTH_CACHE_TTL: int = 60
+    PASSWORD_HASH_METHOD: str = "scrypt:32768:8:1"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    AUTH_TOKENS_ENABLED: bool = False
+    ACCESS_TOKEN_TTL: int = 900
+    REFRESH_TOKEN_TTL: int = 14 * 24 * 3600
+    METRICS_ENABLED: bool = True
+    METRICS_N_PLUS_ONE_THRESHOLD: int = 5
 
 
-dev_config = AppConfig(
-    SECRET_KEY="this-is-secret",
-    SQLALCHEMY_DATABASE_URI="sqlite:///app.db",
-    DEBUG=True,
-)
+PROFILES = {
+    "development": {
+        "SECRET_KEY": "this-is-secret",
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///app.db",
+        "DEBUG": True,
+    },
+    "testing": {
+        "SECRET_KEY": "this-is-secret",
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "TESTING": True,
+    },
+    # SECRET_KEY and the database URL must come from the environment.
+    "production": {
+        "DATABASE_POOL_SIZE": 10,
+        "DATABASE_MAX_OVERFLOW": 20,
+    },
+}
+
+ENV_PREFIX = "APP_"
+
+
+def _parse_env_value(raw: str, annotation):
+    if typing.get_origin(annotation) is typing.Union:
+        if raw == "":
+            return None
+        annotation = next(a for a in typing.get_args(annotation) if a is not type(None))
+    if annotation is bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if annotation is int:
+        return int(raw)
+    return raw
+
+
+def _database_url(url: str) -> str:
+    # Hosting platforms hand out postgres:// URLs without a driver; the
+    # postgres extra installs psycopg 3.
+    for scheme in ("postgres://", "postgresql://"):
+        if url.startswith(scheme):
+            return "postgresql+psycopg://" + url[len(scheme) :]
+    return url
+
+
+def config_from_env(environ=None) -> AppConfig:
+    """
+    Build the config for the ``APP_ENV`` profile (``development`` by
+    default), with any field overridden by an ``APP_<FIELD>`` environment
+    variable, e.g. ``APP_DATABASE_POOL_SIZE=20``. ``DATABASE_URL`` is
+    accepted for ``SQLALCHEMY_DATABASE_URI``.
+
+    :raises ValueError: for an unknown profile or a missing required field.
+    """
+    environ = os.environ if environ is None else environ
+    profile = environ.get("APP_ENV", "development")
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown APP_ENV {profile!r}; expected one of {', '.join(PROFILES)}."
+        )
+    values = dict(PROFILES[profile])
+    if environ.get("DATABASE_URL"):
+        values["SQLALCHEMY_DATABASE_URI"] = _database_url(environ["DATABASE_URL"])
+    for field in fields(AppConfig):
+        raw = environ.get(ENV_PREFIX + field.name)
+        if raw is not None:
+            values[field.name] = _parse_env_value(raw, field.type)
+    missing = [
+        ENV_PREFIX + field.name
+        for field in fields(AppConfig)
+        if field.default is MISSING and field.name not in values
+    ]
+    if missing:
+        raise ValueError(f"Set {', '.join(missing)} for the {profile} profile.")
+    return AppConfig(**values)
@@ -0,0 +1,74 @@
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def is_memory_sqlite(url) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(config) -> dict:
+    """
+    ``SQLALCHEMY_ENGINE_OPTIONS`` built from the ``DATABASE_POOL_*``
+    settings.
+
+    In-memory SQLite runs on a single static connection, so it gets no
+    pool sizing.
+    """
+    options = {
+        "pool_pre_ping": config["DATABASE_POOL_PRE_PING"],
+        "pool_recycle": config["DATABASE_POOL_RECYCLE"],
+    }
+    if not is_memory_sqlite(config["SQLALCHEMY_DATABASE_URI"]):
+        options.update(
+            pool_size=config["DATABASE_POOL_SIZE"],
+            max_overflow=config["DATABASE_MAX_OVERFLOW"],
+            pool_timeout=config["DATABASE_POOL_TIMEOUT"],
+        )
+    return options
+
+
+def sqlite_pragmas(config) -> list:
+    """
+    The PRAGMA statements run on every new SQLite connection.
+
+    :raises ValueError: on an unknown journal or synchronous mode.
+    """
+    journal_mode = config["SQLITE_JOURNAL_MODE"].upper()
+    synchronous = config["SQLITE_SYNCHRONOUS"].upper()
+    if journal_mode not in _JOURNAL_MODES:
+        raise ValueError(f"Unknown SQLITE_JOURNAL_MODE {journal_mode!r}.")
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(f"Unknown SQLITE_SYNCHRONOUS {synchronous!r}.")
+    return [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA busy_timeout={int(config['SQLITE_BUSY_TIMEOUT'])}",
+        f"PRAGMA mmap_size={int(config['SQLITE_MMAP_SIZE'])}",
+    ]
+
+
+def configure_engine(engine, config) -> None:
+    """
+    Apply the SQLite connection pragmas to ``engine``; other databases are
+    left as they are. Call before the engine opens its first connection.
+
+    WAL lets readers proceed while one writer commits, and ``busy_timeout``
+    makes a second writer wait for the lock instead of failing at once
+    with "database is locked".
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas(config)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
@@ -1,5 +1,13 @@
+import logging
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
 from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
 
 db = SQLAlchemy()
 
@@ -26,5 +34,47 @@ def create_admin():
     )
     admin_user.set_password("admin")  # Set default password
     db.session.add(admin_user)
-    db.session.commit()
-    print("Admin user created successfully.")
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another bootstrap created it first.
+        db.session.rollback()
+        return
+    # Logged, not printed: stdout of processes that create the app may be
+    # machine-readable (e.g. ``python -m benchmarks``).
+    logger.info("Admin user created successfully.")
+
+
+def bootstrap():
+    """Create any missing tables and the default admin user."""
+    db.create_all()
+    create_admin()
+
+
+@click.command("bootstrap")
+@with_appcontext
+def bootstrap_command():
+    """Create missing tables and the admin user. Run once per deployment."""
+    bootstrap()
+    click.echo("Bootstrap complete.")
+
+
+class MigrateGroup(click.Group):
+    """
+    ``flask db``, with Flask-Migrate (and alembic) imported only when one
+    of its commands runs instead of in every process that creates the app.
+    """
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_group
+
+        app = current_app._get_current_object()
+        if "migrate" not in app.extensions:
+            Migrate(app, db)
+        # Click invokes the command of the returned context, so the real
+        # group parses its own options and dispatches its subcommands.
+        return db_group.make_context(info_name, args, parent=parent, **extra)
+
+
+migrate_cli = MigrateGroup("db", help="Perform database migrations.")
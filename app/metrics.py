@@ -0,0 +1,200 @@
+import bisect
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from flask import g, has_app_context, request, request_finished, request_started
+from sqlalchemy import event
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+        yield "+Inf", self.count
+
+
+class EndpointStats:
+    __slots__ = (
+        "responses",
+        "statements",
+        "db_seconds",
+        "n_plus_one",
+        "latency",
+        "statements_per_request",
+    )
+
+    def __init__(self):
+        self.responses = Counter()
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.n_plus_one = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.statements_per_request = Histogram(STATEMENT_BUCKETS)
+
+
+class RequestStats:
+    """SQL activity of the request being served."""
+
+    __slots__ = ("started", "statements", "db_seconds", "by_statement")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.by_statement = Counter()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """
+    Per-endpoint request metrics for this process.
+
+    Engine events count and time every SQL statement issued while a request
+    is being served; request signals record latency and the response
+    status. A request repeating one statement ``n_plus_one_threshold`` or
+    more times is logged and counted as a likely N+1 query.
+    """
+
+    def __init__(self, n_plus_one_threshold: int):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.endpoints = defaultdict(EndpointStats)
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        request_started.connect(self._request_started, app, weak=False)
+        request_finished.connect(self._request_finished, app, weak=False)
+        app.teardown_request(self._teardown_request)
+        app.extensions["metrics"] = self
+
+    @staticmethod
+    def _current():
+        return g.get("_request_stats") if has_app_context() else None
+
+    def _before_cursor_execute(self, conn, cursor, statement, *args):
+        if self._current() is not None:
+            conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, *args):
+        stats = self._current()
+        starts = conn.info.get("_query_start")
+        if stats is None or not starts:
+            return
+        stats.statements += 1
+        stats.db_seconds += time.perf_counter() - starts.pop()
+        stats.by_statement[statement] += 1
+
+    def _request_started(self, sender, **extra):
+        g._request_stats = RequestStats()
+
+    def _teardown_request(self, exception):
+        # Only still pending when the request ended without a response.
+        self._record(500)
+
+    def _request_finished(self, sender, response, **extra):
+        self._record(response.status_code)
+
+    def _record(self, status_code) -> None:
+        stats = g.pop("_request_stats", None)
+        if stats is None:
+            return
+        endpoint = request.endpoint or "unmatched"
+        elapsed = time.perf_counter() - stats.started
+        repeated = [
+            (statement, count)
+            for statement, count in stats.by_statement.items()
+            if count >= self.n_plus_one_threshold
+        ]
+        for statement, count in repeated:
+            logger.warning(
+                "Possible N+1 query in %s: statement ran %d times: %s",
+                endpoint,
+                count,
+                " ".join(statement.split())[:200],
+            )
+        with self._lock:
+            endpoint_stats = self.endpoints[endpoint]
+            endpoint_stats.responses[(request.method, status_code)] += 1
+            endpoint_stats.statements += stats.statements
+            endpoint_stats.db_seconds += stats.db_seconds
+            endpoint_stats.n_plus_one += len(repeated)
+            endpoint_stats.latency.observe(elapsed)
+            endpoint_stats.statements_per_request.observe(stats.statements)
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            lines = [
+                "# HELP http_requests_total Requests served, by endpoint and status.",
+                "# TYPE http_requests_total counter",
+            ]
+            for name, stats in endpoints:
+                for (method, status), count in sorted(stats.responses.items()):
+                    lines.append(
+                        f'http_requests_total{{endpoint="{_escape(name)}",'
+                        f'method="{method}",status="{status}"}} {count}'
+                    )
+            for metric, help_text, attr in (
+                ("db_statements_total", "SQL statements issued.", "statements"),
+                ("db_seconds_total", "Time spent executing SQL.", "db_seconds"),
+                ("db_n_plus_one_total", "Likely N+1 statements seen.", "n_plus_one"),
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for name, stats in endpoints:
+                    lines.append(
+                        f'{metric}{{endpoint="{_escape(name)}"}} {getattr(stats, attr)}'
+                    )
+            for metric, help_text, attr in (
+                ("http_request_duration_seconds", "Request latency.", "latency"),
+                (
+                    "db_statements_per_request",
+                    "SQL statements per request.",
+                    "statements_per_request",
+                ),
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for name, stats in endpoints:
+                    label = f'endpoint="{_escape(name)}"'
+                    histogram = getattr(stats, attr)
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {count}')
+                    lines.append(f"{metric}_sum{{{label}}} {histogram.sum}")
+                    lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,39 @@
+from datetime import date
+
+from flask import g, has_request_context, request
+from pydantic import ValidationError
+
+
+def today() -> date:
+    """
+    Today's date, read once per request so every validator (and the
+    acceptance window check) sees the same day at the cost of one call.
+    """
+    if not has_request_context():
+        return date.today()
+    if "today" not in g:
+        g.today = date.today()
+    return g.today
+
+
+def parse_json(schema):
+    """
+    Validate the raw request body against ``schema`` in one pass, without
+    building an intermediate dict with ``json.loads`` first.
+
+    :raises ValidationError: on invalid JSON or invalid fields.
+    """
+    return schema.model_validate_json(request.get_data())
+
+
+def error_list(error: ValidationError) -> list:
+    """
+    JSON-ready details of a validation error: type, location, message and
+    input of each problem.
+    """
+    errors = error.errors(include_url=False, include_context=False)
+    for details in errors:
+        # A body that is not valid JSON comes back as raw bytes.
+        if isinstance(details.get("input"), bytes):
+            del details["input"]
+    return errors
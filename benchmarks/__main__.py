@@ -0,0 +1,190 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+from benchmarks.compare import compare_reports, format_changes
+from benchmarks.dataset import DatasetConfig
+from benchmarks.runner import (DATABASES, ROOT, RunConfig, run_databases,
+                               run_suite)
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.startup import measure_startup
+from benchmarks.validation import measure_validation
+
+
+@click.group()
+def cli():
+    """Benchmark the API endpoints."""
+
+
+def dataset_options(fn):
+    """Options shared by the commands that seed a dataset and run it."""
+    options = [
+        click.option("--users", type=int, default=200, help="Applicants to seed."),
+        click.option("--courses", type=int, default=10, help="Courses to seed."),
+        click.option(
+            "--document-types", type=int, default=3, help="Document types to seed."
+        ),
+        click.option(
+            "--documents-per-application",
+            type=int,
+            default=2,
+            help="Documents per applicant.",
+        ),
+        click.option(
+            "--letters", type=int, default=20, help="Approved applicants with letters."
+        ),
+        click.option(
+            "--seed", type=int, default=1, help="Random seed for the dataset."
+        ),
+        click.option(
+            "--requests", type=int, default=200, help="Timed requests per endpoint."
+        ),
+        click.option(
+            "--warmup", type=int, default=10, help="Untimed requests per endpoint."
+        ),
+        click.option(
+            "--concurrency", type=int, default=8, help="Client threads (server mode)."
+        ),
+        click.option(
+            "--workers", type=int, default=4, help="gunicorn workers (server mode)."
+        ),
+    ]
+    for option in reversed(options):
+        fn = option(fn)
+    return fn
+
+
+def build_configs(
+    users,
+    courses,
+    document_types,
+    documents_per_application,
+    letters,
+    seed,
+    requests,
+    warmup,
+    concurrency,
+    workers,
+):
+    dataset_config = DatasetConfig(
+        users=users,
+        courses=courses,
+        document_types=document_types,
+        documents_per_application=documents_per_application,
+        letters=min(letters, users),
+        seed=seed,
+    )
+    run_config = RunConfig(
+        requests=requests, warmup=warmup, concurrency=concurrency, workers=workers
+    )
+    return dataset_config, run_config
+
+
+def write_report(report, output):
+    text = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(text + "\n")
+    else:
+        click.echo(text)
+
+
+@cli.command("run")
+@dataset_options
+@click.option(
+    "--mode",
+    type=click.Choice(["client", "server", "both"]),
+    default="both",
+    help="Flask test client, a multi-worker gunicorn server, or both.",
+)
+@click.option(
+    "--scenario",
+    "names",
+    multiple=True,
+    type=click.Choice([s.name for s in SCENARIOS]),
+    help="Only run these scenarios (repeatable).",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def run(mode, names, output, **options):
+    """Seed a synthetic dataset and benchmark every endpoint."""
+    dataset_config, run_config = build_configs(**options)
+    modes = ["client", "server"] if mode == "both" else [mode]
+    with tempfile.TemporaryDirectory(prefix="applytrack-bench-") as directory:
+        report = run_suite(
+            Path(directory), dataset_config, run_config, modes, set(names) or None
+        )
+    write_report(report, output)
+
+
+@cli.command("databases")
+@dataset_options
+@click.option(
+    "--postgres-url",
+    envvar="BENCH_POSTGRES_URL",
+    help="Also run against this PostgreSQL database (its tables are dropped).",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def databases(postgres_url, output, **options):
+    """Compare write throughput of SQLite journal modes and PostgreSQL."""
+    dataset_config, run_config = build_configs(**options)
+    configs = dict(DATABASES)
+    if postgres_url:
+        configs["postgresql"] = {"SQLALCHEMY_DATABASE_URI": postgres_url}
+    with tempfile.TemporaryDirectory(prefix="applytrack-bench-") as directory:
+        report = run_databases(Path(directory), dataset_config, run_config, configs)
+    write_report(report, output)
+
+
+@cli.command("startup")
+@click.option("--samples", type=int, default=10, help="Fresh worker processes.")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False),
+    help="Source tree to measure (defaults to this one).",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def startup(samples, root, output):
+    """Measure per-worker import, app creation and first request time."""
+    with tempfile.TemporaryDirectory(prefix="applytrack-bench-") as directory:
+        report = measure_startup(
+            Path(directory), samples, Path(root).resolve() if root else ROOT
+        )
+    write_report(report, output)
+
+
+@cli.command("validation")
+@click.option("--iterations", type=int, default=10000, help="Requests per payload.")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False),
+    help="Source tree to measure (defaults to this one).",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def validation(iterations, root, output):
+    """Measure per-request validation of the application form."""
+    report = measure_validation(iterations, Path(root).resolve() if root else ROOT)
+    write_report(report, output)
+
+
+@cli.command("compare")
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False))
+@click.argument("current", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--threshold", type=float, default=0.10, help="Relative change to report."
+)
+def compare(baseline, current, threshold):
+    """Compare two reports; exit with status 1 on any regression."""
+    changes = compare_reports(
+        json.loads(Path(baseline).read_text()),
+        json.loads(Path(current).read_text()),
+        threshold,
+    )
+    click.echo(format_changes(changes))
+    if any(change.regressed for change in changes):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,62 @@
+from typing import NamedTuple
+
+# Metrics where a higher value is worse, and where a lower value is worse.
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+THROUGHPUT_METRICS = ("rps",)
+
+
+class Change(NamedTuple):
+    mode: str
+    scenario: str
+    metric: str
+    before: float
+    after: float
+
+    @property
+    def ratio(self) -> float:
+        return self.after / self.before - 1 if self.before else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.metric == "errors" or (self.metric in THROUGHPUT_METRICS) == (
+            self.ratio < 0
+        )
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float = 0.10) -> list:
+    """
+    Changes between two benchmark reports larger than ``threshold``
+    (a fraction, e.g. 0.10 for 10%), plus any new errors.
+
+    :return: :class:`Change` list; check ``regressed`` on each.
+    """
+    changes = []
+    for mode, scenarios in current["results"].items():
+        for name, after in scenarios.items():
+            before = baseline["results"].get(mode, {}).get(name)
+            if before is None:
+                continue
+            if after["errors"] > before["errors"]:
+                changes.append(
+                    Change(mode, name, "errors", before["errors"], after["errors"])
+                )
+            for metric in LATENCY_METRICS + THROUGHPUT_METRICS:
+                if before.get(metric) is None or after.get(metric) is None:
+                    continue
+                change = Change(mode, name, metric, before[metric], after[metric])
+                if abs(change.ratio) > threshold:
+                    changes.append(change)
+    return changes
+
+
+def format_changes(changes) -> str:
+    if not changes:
+        return "No significant changes."
+    lines = []
+    for change in changes:
+        label = "REGRESSION" if change.regressed else "improvement"
+        lines.append(
+            f"{label:<11} {change.mode}/{change.scenario} {change.metric}: "
+            f"{change.before} -> {change.after} ({change.ratio:+.1%})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,190 @@
+import hashlib
+import io
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import date
+
+from app.application.blobs import blob_key
+from app.application.bulk import bulk_change_status
+from app.application.letters import process_letter_jobs
+from app.application.models import (Application, ApplicationStatus, Document,
+                                    DocumentType, PreferredCourse,
+                                    UploadSession)
+from app.application.uploads import write_part
+from app.authentication.models import RoleEnum, User
+from app.authentication.tokens import issue_tokens
+from app.extensions import db
+
+# Hashing a password per synthetic user would dominate seeding time; no
+# benchmark logs in with a password.
+UNUSABLE_PASSWORD = "!"
+SEED_BATCH_SIZE = 500
+
+
+@dataclass
+class DatasetConfig:
+    users: int = 200
+    courses: int = 10
+    document_types: int = 3
+    documents_per_application: int = 2
+    letters: int = 20
+    # Users without an application, consumed by the create-application run.
+    fresh_users: int = 0
+    # Resumable uploads with part 1 received, consumed by the complete run.
+    upload_sessions: int = 0
+    seed: int = 1
+
+
+@dataclass
+class Dataset:
+    """Ids and access tokens of the seeded rows."""
+
+    config: DatasetConfig
+    admin_token: str
+    user_tokens: list = field(default_factory=list)
+    fresh_tokens: list = field(default_factory=list)
+    application_ids: list = field(default_factory=list)
+    course_ids: list = field(default_factory=list)
+    document_type_ids: list = field(default_factory=list)
+    # Upload session ``i`` belongs to the owner of ``user_tokens[i % users]``.
+    upload_ids: list = field(default_factory=list)
+
+
+def _add_users(prefix, count):
+    users = []
+    for start in range(0, count, SEED_BATCH_SIZE):
+        batch = [
+            User(
+                name=f"{prefix} {i}",
+                email=f"{prefix}{i}@bench.example.com",
+                password=UNUSABLE_PASSWORD,
+                role=RoleEnum.USER,
+            )
+            for i in range(start, min(start + SEED_BATCH_SIZE, count))
+        ]
+        db.session.add_all(batch)
+        db.session.commit()
+        users.extend(batch)
+    return users
+
+
+def part_content(i: int) -> bytes:
+    """Distinct content per upload, so every completed upload stores a blob."""
+    return f"resumable document {i}\n".encode() * 512
+
+
+def _add_upload_sessions(rng, applications, document_type, count):
+    sessions = [
+        UploadSession(
+            id=uuid.UUID(int=rng.getrandbits(128)).hex,
+            user_id=applications[i % len(applications)].user,
+            application_id=applications[i % len(applications)].id,
+            document_type_id=document_type.id,
+            filename="document.pdf",
+        )
+        for i in range(count)
+    ]
+    for start in range(0, count, SEED_BATCH_SIZE):
+        db.session.add_all(sessions[start : start + SEED_BATCH_SIZE])
+        db.session.commit()
+    for i, session in enumerate(sessions):
+        content = part_content(i)
+        write_part(session.id, 1, io.BytesIO(content), len(content))
+    return sessions
+
+
+def seed_dataset(config: DatasetConfig) -> Dataset:
+    """
+    Insert a synthetic dataset through the models. Must run in an app
+    context with token authentication enabled; the same config and seed
+    always produce the same rows.
+    """
+    rng = random.Random(config.seed)
+
+    courses = [
+        PreferredCourse(
+            course_name=f"Course {i}",
+            max_applications_count=config.users + config.fresh_users,
+            applied_count=0,
+        )
+        for i in range(config.courses)
+    ]
+    document_types = [
+        DocumentType(document_type_name=f"Document {i}")
+        for i in range(config.document_types)
+    ]
+    db.session.add_all(courses + document_types)
+    db.session.commit()
+
+    users = _add_users("applicant", config.users)
+    statuses = [
+        ApplicationStatus.INCOMPLETE,
+        ApplicationStatus.PENDING,
+        ApplicationStatus.REJECTED,
+    ]
+    applications = []
+    for i, user in enumerate(users):
+        course = rng.choice(courses)
+        course.applied_count += 1
+        applications.append(
+            Application(
+                user=user.id,
+                full_name=f"Applicant {i}",
+                date_of_birth=date(2000, 1, 1) if i % 2 else date(2001, 6, 15),
+                gender=rng.choice(["Male", "Female", "Other"]),
+                email=f"application{i}@bench.example.com",
+                phone_number=f"+91{9000000000 + i}",
+                address=f"{i} Bench Street",
+                nationality="Indian",
+                highest_qualification="HSC",
+                institution_name=f"School {i % 50}",
+                graduation_year=2015 + i % 10,
+                preferred_course_id=course.id,
+                status=rng.choice(statuses),
+            )
+        )
+    for start in range(0, len(applications), SEED_BATCH_SIZE):
+        db.session.add_all(applications[start : start + SEED_BATCH_SIZE])
+        db.session.commit()
+
+    documents = []
+    for application in applications:
+        for document_type in document_types[: config.documents_per_application]:
+            content = f"{application.id}:{document_type.id}".encode()
+            sha256 = hashlib.sha256(content).hexdigest()
+            documents.append(
+                Document(
+                    application_id=application.id,
+                    document_type_id=document_type.id,
+                    file_path=blob_key(sha256),
+                    filename="document.pdf",
+                    sha256=sha256,
+                    size=len(content),
+                )
+            )
+    for start in range(0, len(documents), SEED_BATCH_SIZE):
+        db.session.add_all(documents[start : start + SEED_BATCH_SIZE])
+        db.session.commit()
+
+    # The first applications get rendered letters for the download runs.
+    letter_ids = [a.id for a in applications[: config.letters]]
+    bulk_change_status(ApplicationStatus.APPROVED, application_ids=letter_ids)
+    while process_letter_jobs():
+        pass
+
+    fresh = _add_users("fresh", config.fresh_users)
+    uploads = _add_upload_sessions(
+        rng, applications, document_types[0], config.upload_sessions
+    )
+    admin = User.query.filter_by(role=RoleEnum.ADMIN).first()
+    return Dataset(
+        config=config,
+        admin_token=issue_tokens(admin.id, admin.role)["access_token"],
+        user_tokens=[issue_tokens(u.id, u.role)["access_token"] for u in users],
+        fresh_tokens=[issue_tokens(u.id, u.role)["access_token"] for u in fresh],
+        application_ids=[a.id for a in applications],
+        course_ids=[c.id for c in courses],
+        document_type_ids=[t.id for t in document_types],
+        upload_ids=[s.id for s in uploads],
+    )
@@ -0,0 +1,345 @@
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.engine import make_url
+
+from app import create_app
+from app.config import AppConfig, FileConfig
+from app.extensions import bootstrap, db
+from benchmarks.dataset import DatasetConfig, seed_dataset
+from benchmarks.scenarios import SCENARIOS
+
+ROOT = Path(__file__).resolve().parent.parent
+# Fixed so that tokens minted while seeding are valid in server workers.
+BENCH_SECRET_KEY = "benchmark-secret-key"
+
+# Config overrides compared by ``benchmarks databases``. The rollback
+# journal profile is SQLite's behaviour without the connection pragmas.
+DATABASES = {
+    "sqlite-rollback": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_MMAP_SIZE": 0,
+    },
+    "sqlite-wal": {},
+}
+WRITE_SCENARIOS = (
+    "user_create_application",
+    "user_create_application_one_course",
+    "user_upload_document",
+    "admin_change_status",
+)
+
+
+@dataclass
+class RunConfig:
+    requests: int = 200
+    warmup: int = 10
+    # Client threads driving the WSGI server.
+    concurrency: int = 8
+    # Server worker processes.
+    workers: int = 4
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, round(q / 100 * len(sorted_values) + 0.5))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies, statuses, elapsed) -> dict:
+    ordered = sorted(latencies)
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "requests": len(ordered),
+        "errors": sum(1 for status in statuses if status >= 400),
+        "status_codes": {str(k): v for k, v in sorted(Counter(statuses).items())},
+        "rps": round(len(ordered) / elapsed, 2) if elapsed else None,
+        "mean_ms": ms(sum(ordered) / len(ordered)) if ordered else None,
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "max_ms": ms(ordered[-1] if ordered else None),
+    }
+
+
+def bench_config(directory: Path, overrides=None) -> AppConfig:
+    """
+    App config for a benchmark database and storage under ``directory``.
+
+    :param overrides: AppConfig fields to change, e.g. another
+                      ``SQLALCHEMY_DATABASE_URI``.
+    """
+    FileConfig.UPLOAD_FILE = directory / "uploads"
+    FileConfig.ADMISSION_LETTER = directory / "letters"
+    FileConfig.UPLOAD_FILE.mkdir(parents=True, exist_ok=True)
+    FileConfig.ADMISSION_LETTER.mkdir(parents=True, exist_ok=True)
+    values = {
+        "SECRET_KEY": BENCH_SECRET_KEY,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{directory / 'bench.db'}",
+        "AUTH_TOKENS_ENABLED": True,
+    }
+    values.update(overrides or {})
+    return AppConfig(**values)
+
+
+def prepare(directory: Path, dataset_config: DatasetConfig, overrides=None):
+    app = create_app(bench_config(directory, overrides))
+    with app.app_context():
+        if db.engine.dialect.name != "sqlite":
+            # A server database outlives the run directory; start empty.
+            db.drop_all()
+        bootstrap()
+        dataset = seed_dataset(dataset_config)
+    return app, dataset
+
+
+def _indices(run_config):
+    warmup = range(run_config.warmup)
+    timed = range(run_config.warmup, run_config.warmup + run_config.requests)
+    return warmup, timed
+
+
+def run_client(app, dataset, scenarios, run_config) -> dict:
+    """Drive each scenario sequentially through the Flask test client."""
+    results = {}
+    client = app.test_client()
+    warmup, timed = _indices(run_config)
+    for scenario in scenarios:
+
+        def send(i):
+            request = scenario.build(dataset, i)
+            response = client.open(
+                request.path,
+                method=request.method,
+                data=request.body,
+                headers=request.headers,
+            )
+            response.get_data()
+            return response.status_code
+
+        for i in warmup:
+            send(i)
+        latencies, statuses = [], []
+        started = time.perf_counter()
+        for i in timed:
+            begin = time.perf_counter()
+            statuses.append(send(i))
+            latencies.append(time.perf_counter() - begin)
+        results[scenario.name] = summarize(
+            latencies, statuses, time.perf_counter() - started
+        )
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_server(port, process, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("The benchmark server exited during startup.")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("The benchmark server did not start in time.")
+
+
+def start_server(directory: Path, workers: int, overrides=None):
+    """Start gunicorn with ``workers`` processes serving the benchmark app."""
+    port = _free_port()
+    env = dict(
+        os.environ, BENCH_DIR=str(directory), BENCH_CONFIG=json.dumps(overrides or {})
+    )
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--workers",
+            str(workers),
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--log-level",
+            "warning",
+            "benchmarks.wsgi:create_bench_app()",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        _wait_for_server(port, process)
+    except BaseException:
+        process.kill()
+        raise
+    return process, port
+
+
+def run_server(port, dataset, scenarios, run_config) -> dict:
+    """Drive each scenario concurrently against a running server."""
+    local = threading.local()
+
+    def send(scenario, i):
+        request = scenario.build(dataset, i)
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            connection = local.connection = http.client.HTTPConnection(
+                "127.0.0.1", port, timeout=60
+            )
+        begin = time.perf_counter()
+        try:
+            connection.request(
+                request.method, request.path, body=request.body, headers=request.headers
+            )
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            local.connection = None
+            status = 599
+        else:
+            if response.will_close:
+                connection.close()
+                local.connection = None
+        return status, time.perf_counter() - begin
+
+    results = {}
+    warmup, timed = _indices(run_config)
+    with ThreadPoolExecutor(max_workers=run_config.concurrency) as pool:
+        for scenario in scenarios:
+            list(pool.map(lambda i: send(scenario, i), warmup))
+            started = time.perf_counter()
+            outcomes = list(pool.map(lambda i: send(scenario, i), timed))
+            elapsed = time.perf_counter() - started
+            results[scenario.name] = summarize(
+                [latency for _, latency in outcomes],
+                [status for status, _ in outcomes],
+                elapsed,
+            )
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _redact(overrides) -> dict:
+    redacted = dict(overrides)
+    if "SQLALCHEMY_DATABASE_URI" in redacted:
+        redacted["SQLALCHEMY_DATABASE_URI"] = make_url(
+            redacted["SQLALCHEMY_DATABASE_URI"]
+        ).render_as_string(hide_password=True)
+    return redacted
+
+
+def run_suite(
+    directory: Path, dataset_config, run_config, modes, names=None, overrides=None
+) -> dict:
+    """
+    Run the selected scenarios in each mode (``client`` and/or ``server``)
+    against a freshly seeded dataset per mode.
+
+    :param overrides: AppConfig fields to change, see :func:`bench_config`.
+    :return: JSON-serializable report.
+    """
+    scenarios = [s for s in SCENARIOS if names is None or s.name in names]
+    writes = sum(s.writes for s in scenarios)
+    if writes:
+        # One fresh user per create-application request, warmup included.
+        dataset_config = replace(
+            dataset_config,
+            fresh_users=writes * (run_config.warmup + run_config.requests),
+        )
+    if any(s.uploads for s in scenarios):
+        # One seeded upload session per resumable request, warmup included.
+        dataset_config = replace(
+            dataset_config, upload_sessions=run_config.warmup + run_config.requests
+        )
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": asdict(dataset_config),
+            "run": asdict(run_config),
+            "config": _redact(overrides or {}),
+        },
+        "results": {},
+    }
+    for mode in modes:
+        mode_dir = directory / mode
+        mode_dir.mkdir(parents=True, exist_ok=True)
+        app, dataset = prepare(mode_dir, dataset_config, overrides)
+        if mode == "client":
+            results = run_client(app, dataset, scenarios, run_config)
+        else:
+            with app.app_context():
+                db.engine.dispose()
+            process, port = start_server(mode_dir, run_config.workers, overrides)
+            try:
+                results = run_server(port, dataset, scenarios, run_config)
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+        report["results"][mode] = results
+    return report
+
+
+def run_databases(directory: Path, dataset_config, run_config, databases) -> dict:
+    """
+    Run the write scenarios against a gunicorn server once per database
+    configuration.
+
+    :param databases: Mapping of a label to AppConfig overrides.
+    :return: Report whose ``results`` are keyed by database label.
+    """
+    report = {"meta": None, "results": {}}
+    for label, overrides in databases.items():
+        suite = run_suite(
+            directory / label,
+            dataset_config,
+            run_config,
+            ["server"],
+            set(WRITE_SCENARIOS),
+            overrides,
+        )
+        if report["meta"] is None:
+            report["meta"] = dict(suite["meta"], config={})
+        report["meta"]["config"][label] = suite["meta"]["config"]
+        report["results"][label] = suite["results"]["server"]
+    return report
@@ -0,0 +1,230 @@
+import io
+import json
+from typing import Callable, NamedTuple, Optional
+from urllib.parse import urlencode
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import encode_multipart
+
+from benchmarks.dataset import Dataset, part_content
+
+
+class BenchRequest(NamedTuple):
+    method: str
+    path: str
+    token: str
+    body: Optional[bytes] = None
+    content_type: Optional[str] = None
+
+    @property
+    def headers(self) -> dict:
+        headers = {"Authorization": f"Bearer {self.token}"}
+        if self.content_type:
+            headers["Content-Type"] = self.content_type
+        return headers
+
+
+class Scenario(NamedTuple):
+    name: str
+    build: Callable[[Dataset, int], BenchRequest]
+    # Scenarios that create rows consume one fresh user per request.
+    writes: bool = False
+    # Resumable upload scenarios use one seeded upload session per request.
+    uploads: bool = False
+
+
+def _user(dataset, i):
+    return dataset.user_tokens[i % len(dataset.user_tokens)]
+
+
+def _json(method, path, token, payload):
+    return BenchRequest(
+        method, path, token, json.dumps(payload).encode(), "application/json"
+    )
+
+
+def _get(path, admin=False):
+    def build(dataset, i):
+        token = dataset.admin_token if admin else _user(dataset, i)
+        return BenchRequest("GET", path, token)
+
+    return build
+
+
+def _create_application(dataset, i, user=None, course_id=None):
+    # ``user`` indexes the fresh user who applies, ``i`` by default.
+    user = i if user is None else user
+    payload = {
+        "full_name": f"Fresh Applicant {user}",
+        "date_of_birth": "2001-01-01",
+        "gender": "male",
+        "email": f"fresh.application{user}@bench.example.com",
+        "phone_number": "+919876543210",
+        "address": f"{i} Fresh Street",
+        "nationality": "Indian",
+        "highest_qualification": "HSC",
+        "institution_name": "School",
+        "graduation_year": 2020,
+        "preferred_course_id": course_id
+        or dataset.course_ids[i % len(dataset.course_ids)],
+    }
+    return BenchRequest(
+        "POST",
+        "/user/applications",
+        dataset.fresh_tokens[user],
+        json.dumps(payload).encode(),
+        "application/json",
+    )
+
+
+def _create_application_one_course(dataset, i):
+    # Every request reserves a seat on the same course. Fresh users are
+    # taken from the end, so both create scenarios can run in one suite.
+    users = len(dataset.fresh_tokens)
+    return _create_application(dataset, i, users - 1 - i, dataset.course_ids[0])
+
+
+def _upload_document(dataset, i):
+    boundary, body = encode_multipart(
+        {
+            "document_type_id": str(
+                dataset.document_type_ids[i % len(dataset.document_type_ids)]
+            ),
+            # Distinct content per request, so every upload stores a blob.
+            "file": FileStorage(
+                io.BytesIO(f"benchmark document {i}\n".encode() * 512),
+                filename="document.pdf",
+                content_type="application/pdf",
+            ),
+        }
+    )
+    return BenchRequest(
+        "POST",
+        "/user/documents/upload",
+        _user(dataset, i),
+        body,
+        f"multipart/form-data; boundary={boundary}",
+    )
+
+
+def _create_upload(dataset, i):
+    return _json(
+        "POST",
+        "/user/documents/uploads",
+        _user(dataset, i),
+        {
+            "document_type_id": dataset.document_type_ids[
+                i % len(dataset.document_type_ids)
+            ],
+            "filename": "document.pdf",
+        },
+    )
+
+
+def _upload_part(dataset, i):
+    # Resends part 1 of a seeded session, replacing the received part.
+    return BenchRequest(
+        "PUT",
+        f"/user/documents/uploads/{dataset.upload_ids[i]}/parts/1",
+        _user(dataset, i),
+        part_content(i),
+        "application/octet-stream",
+    )
+
+
+def _complete_upload(dataset, i):
+    return _json(
+        "POST",
+        f"/user/documents/uploads/{dataset.upload_ids[i]}/complete",
+        _user(dataset, i),
+        {},
+    )
+
+
+def _letter(dataset, i):
+    return BenchRequest(
+        "GET", "/user/letter", dataset.user_tokens[i % dataset.config.letters]
+    )
+
+
+def _change_status(dataset, i):
+    # Skip the approved (terminal) applications that hold letters.
+    candidates = dataset.application_ids[dataset.config.letters :]
+    application_id = candidates[i % len(candidates)]
+    return BenchRequest(
+        "PUT",
+        f"/admin/applications/{application_id}/status",
+        dataset.admin_token,
+        urlencode({"status": "Rejected" if i % 2 else "Pending"}).encode(),
+        "application/x-www-form-urlencoded",
+    )
+
+
+def _change_statuses(dataset, i):
+    candidates = dataset.application_ids[dataset.config.letters :]
+    start = i * 50 % len(candidates)
+    return _json(
+        "PUT",
+        "/admin/applications/status",
+        dataset.admin_token,
+        {
+            "status": "Rejected" if i % 2 else "Pending",
+            "application_ids": candidates[start : start + 50],
+        },
+    )
+
+
+def _create_course(dataset, i):
+    return _json(
+        "POST",
+        "/admin/courses",
+        dataset.admin_token,
+        {"course_name": f"Bench Course {i}", "max_applications_count": 100},
+    )
+
+
+def _create_document_type(dataset, i):
+    return _json(
+        "POST",
+        "/admin/documents",
+        dataset.admin_token,
+        {"document_type_name": f"Bench Document {i}"},
+    )
+
+
+def _acceptance(dataset, i):
+    # Keeps acceptance open; the user scenarios depend on it.
+    return _json("PUT", "/admin/acceptance", dataset.admin_token, {"is_enabled": True})
+
+
+SCENARIOS = [
+    Scenario("user_courses", _get("/user/courses")),
+    Scenario("user_application", _get("/user/applications")),
+    Scenario("user_status", _get("/user/status")),
+    Scenario("user_letter", _letter),
+    Scenario("user_create_application", _create_application, writes=True),
+    Scenario(
+        "user_create_application_one_course",
+        _create_application_one_course,
+        writes=True,
+    ),
+    Scenario("user_upload_document", _upload_document),
+    Scenario("user_documents", _get("/user/documents")),
+    Scenario("user_create_upload", _create_upload),
+    Scenario("user_upload_part", _upload_part, uploads=True),
+    Scenario("user_complete_upload", _complete_upload, uploads=True),
+    Scenario("admin_courses", _get("/admin/courses", admin=True)),
+    Scenario("admin_create_course", _create_course),
+    Scenario("admin_documents", _get("/admin/documents", admin=True)),
+    Scenario("admin_create_document_type", _create_document_type),
+    Scenario("admin_applications", _get("/admin/applications?limit=50", admin=True)),
+    Scenario(
+        "admin_search", _get("/admin/applications/search?q=School", admin=True)
+    ),
+    Scenario("admin_export", _get("/admin/applications/export", admin=True)),
+    Scenario("admin_change_status", _change_status),
+    Scenario("admin_change_statuses", _change_statuses),
+    Scenario("admin_metrics", _get("/admin/metrics", admin=True)),
+    Scenario("admin_analytics", _get("/admin/analytics", admin=True)),
+    Scenario("admin_acceptance", _acceptance),
+]
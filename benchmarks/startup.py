@@ -0,0 +1,103 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.runner import ROOT, _git_commit, percentile
+
+# Runs in a fresh interpreter, as a new gunicorn worker would; prints the
+# phase timings as JSON.
+_WORKER = r"""
+import json
+import resource
+import sys
+import time
+
+begin = time.perf_counter()
+from app import create_app
+from app.config import AppConfig
+imported = time.perf_counter()
+app = create_app(AppConfig(SECRET_KEY="startup", SQLALCHEMY_DATABASE_URI=sys.argv[1]))
+created = time.perf_counter()
+app.test_client().get("/hello")
+served = time.perf_counter()
+print(json.dumps({
+    "import": imported - begin,
+    "create_app": created - imported,
+    "first_request": served - created,
+    "modules": len(sys.modules),
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+PHASES = ("process", "import", "create_app", "first_request")
+
+
+def _summary(seconds) -> dict:
+    ordered = sorted(seconds)
+
+    def ms(value):
+        return round(value * 1000, 3)
+
+    return {
+        "samples": len(ordered),
+        "errors": 0,
+        "mean_ms": ms(sum(ordered) / len(ordered)),
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "max_ms": ms(ordered[-1]),
+    }
+
+
+def measure_startup(directory: Path, samples: int = 10, root: Path = ROOT) -> dict:
+    """
+    Start ``samples`` fresh interpreters that import the app, create it and
+    serve one request, timing each phase.
+
+    ``process`` is the wall time of the whole worker as seen from outside,
+    interpreter startup included.
+
+    :param root: Source tree to measure, e.g. a worktree of another commit.
+    :return: JSON-serializable report comparable with ``benchmarks compare``.
+    """
+    database = f"sqlite:///{directory / 'startup.db'}"
+    timings = {phase: [] for phase in PHASES}
+    modules, max_rss = [], []
+    for _ in range(samples):
+        begin = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", _WORKER, database],
+            cwd=root,
+            env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        elapsed = time.perf_counter() - begin
+        # Anything the app prints while starting precedes the JSON line.
+        worker = json.loads(output.strip().splitlines()[-1])
+        timings["process"].append(elapsed)
+        for phase in PHASES[1:]:
+            timings[phase].append(worker[phase])
+        modules.append(worker["modules"])
+        max_rss.append(worker["max_rss_kb"])
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "samples": samples,
+            "modules": max(modules),
+            "max_rss_kb": max(max_rss),
+        },
+        "results": {
+            "startup": {phase: _summary(values) for phase, values in timings.items()}
+        },
+    }
@@ -0,0 +1,132 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.runner import ROOT, _git_commit
+from benchmarks.startup import _summary
+
+# Application form bodies validated per request, as the create endpoint
+# receives them.
+PAYLOADS = {
+    "valid": {
+        "full_name": "Applicant 1",
+        "date_of_birth": "2000-01-01",
+        "gender": "male",
+        "email": "applicant1@example.com",
+        "phone_number": "+1234567890",
+        "address": "Street 1",
+        "nationality": "Indian",
+        "highest_qualification": "HSC",
+        "institution_name": "School",
+        "graduation_year": 2020,
+        "preferred_course_id": 1,
+    },
+    "invalid": {
+        "full_name": "Applicant 2",
+        "date_of_birth": "2020-01-01",
+        "gender": "unknown",
+        "email": "applicant2@example.com",
+        "phone_number": "12345",
+        "address": "Street 1",
+        "nationality": "Indian",
+        "highest_qualification": "HSC",
+        "institution_name": "School",
+        "graduation_year": 2099,
+        "preferred_course_id": 1,
+    },
+}
+
+# Runs in a fresh interpreter inside the measured tree, so older commits
+# are measured with the validation path they shipped; prints the
+# per-request timings as JSON.
+_WORKER = r"""
+import json
+import sys
+import time
+
+from pydantic import ValidationError
+
+from app import create_app
+from app.config import AppConfig
+
+try:
+    from app.validation import error_list, parse_json
+
+    def validate(schema):
+        try:
+            return parse_json(schema)
+        except ValidationError as e:
+            return error_list(e)
+
+except ImportError:
+    # Before app.validation: decode the body, then validate the dict.
+    from flask import request
+
+    def validate(schema):
+        try:
+            return schema.model_validate(request.json)
+        except ValidationError as e:
+            return json.loads(e.json())
+
+try:
+    from app.application.schemas import ApplicationCreateSchema
+except ImportError:
+    from app.application.views import ApplicationCreateSchema
+
+payloads, iterations = json.loads(sys.argv[1]), int(sys.argv[2])
+app = create_app(
+    AppConfig(SECRET_KEY="validation", SQLALCHEMY_DATABASE_URI="sqlite://")
+)
+timings = {}
+for name, payload in payloads.items():
+    body = json.dumps(payload).encode()
+    timings[name] = []
+    for _ in range(iterations):
+        with app.test_request_context(
+            "/", method="POST", data=body, content_type="application/json"
+        ):
+            begin = time.perf_counter()
+            validate(ApplicationCreateSchema)
+            timings[name].append(time.perf_counter() - begin)
+print(json.dumps(timings))
+"""
+
+
+def measure_validation(iterations: int = 10000, root: Path = ROOT) -> dict:
+    """
+    Time validating an application form body, once per request context,
+    for a valid and an invalid payload.
+
+    Each sample covers parsing the raw body, validating it and, for the
+    invalid payload, rendering the error response; request setup is
+    excluded.
+
+    :param root: Source tree to measure, e.g. a worktree of another commit.
+    :return: JSON-serializable report comparable with ``benchmarks compare``.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _WORKER, json.dumps(PAYLOADS), str(iterations)],
+        cwd=root,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    # Anything the app prints while starting precedes the JSON line.
+    timings = json.loads(output.strip().splitlines()[-1])
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+        },
+        "results": {
+            "validation": {name: _summary(values) for name, values in timings.items()}
+        },
+    }
@@ -0,0 +1,15 @@
+import json
+import os
+from pathlib import Path
+
+from app import create_app
+from benchmarks.runner import bench_config
+
+
+def create_bench_app():
+    """
+    WSGI entry point for server runs; ``BENCH_DIR`` holds the dataset and
+    ``BENCH_CONFIG`` any config overrides as JSON.
+    """
+    overrides = json.loads(os.environ.get("BENCH_CONFIG", "{}"))
+    return create_app(bench_config(Path(os.environ["BENCH_DIR"]), overrides))
@@ -0,0 +1,42 @@
+"""add letter_jobs queue and applications.letter_status
+
+Revision ID: 8b27e4d0c5a1
+Revises: 3f1a9c2d7b10
+Create Date: 2026-10-17 11:40:51.502716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b27e4d0c5a1'
+down_revision = '3f1a9c2d7b10'
+branch_labels = None
+depends_on = None
+
+letter_status = sa.Enum('PENDING', 'RENDERING', 'READY', 'FAILED', name='letterstatus')
+
+
+def upgrade():
+    op.create_table('letter_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('status', letter_status, nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.String(length=500), nullable=True),
+    sa.Column('available_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('claimed_by', sa.String(length=36), nullable=True),
+    sa.Column('claimed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('letter_status', letter_status, nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_column('letter_status')
+
+    op.drop_table('letter_jobs')
@@ -0,0 +1,34 @@
+"""add documents.sha256/size and document_type_names.max_size
+
+Revision ID: a54c1e9f2d3b
+Revises: 8b27e4d0c5a1
+Create Date: 2026-10-17 14:05:33.280119
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a54c1e9f2d3b'
+down_revision = '8b27e4d0c5a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sha256', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('size', sa.Integer(), nullable=True))
+
+    with op.batch_alter_table('document_type_names', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('max_size', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('document_type_names', schema=None) as batch_op:
+        batch_op.drop_column('max_size')
+
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.drop_column('size')
+        batch_op.drop_column('sha256')
@@ -0,0 +1,41 @@
+"""index hot lookup columns on applications
+
+Revision ID: b9d3e5f1a7c2
+Revises: f2a8d4c61e37
+Create Date: 2026-10-17 22:14:08.540917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9d3e5f1a7c2'
+down_revision = 'f2a8d4c61e37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    duplicates = op.get_bind().execute(sa.text(
+        'SELECT "user" FROM applications GROUP BY "user" HAVING COUNT(*) > 1'
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Users with more than one application must be resolved before "
+            f"ix_applications_user can be created: {duplicates}"
+        )
+
+    # Documents by application and type are already covered by the index
+    # behind uq_documents_application_type.
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_applications_user'), ['user'], unique=True)
+        batch_op.create_index(batch_op.f('ix_applications_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_applications_preferred_course_id'), ['preferred_course_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_applications_preferred_course_id'))
+        batch_op.drop_index(batch_op.f('ix_applications_status'))
+        batch_op.drop_index(batch_op.f('ix_applications_user'))
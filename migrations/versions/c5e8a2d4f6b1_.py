@@ -0,0 +1,26 @@
+"""version the application acceptance settings
+
+Revision ID: c5e8a2d4f6b1
+Revises: b9d3e5f1a7c2
+Create Date: 2026-10-17 23:02:51.774310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e8a2d4f6b1'
+down_revision = 'b9d3e5f1a7c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('application_acceptance_settings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('application_acceptance_settings', schema=None) as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,43 @@
+"""application_counts analytics aggregates
+
+Revision ID: d7f1b3c5e9a4
+Revises: c5e8a2d4f6b1
+Create Date: 2026-10-17 23:41:19.226093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f1b3c5e9a4'
+down_revision = 'c5e8a2d4f6b1'
+branch_labels = None
+depends_on = None
+
+# Must match app.application.analytics.DIMENSIONS.
+DIMENSIONS = {
+    'status': 'status',
+    'course': 'CAST(preferred_course_id AS VARCHAR(255))',
+    'nationality': 'nationality',
+    'qualification': 'highest_qualification',
+}
+
+
+def upgrade():
+    op.create_table('application_counts',
+    sa.Column('dimension', sa.String(length=32), nullable=False),
+    sa.Column('bucket', sa.String(length=255), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'bucket')
+    )
+    for dimension, expression in DIMENSIONS.items():
+        op.execute(
+            "INSERT INTO application_counts (dimension, bucket, count) "
+            f"SELECT '{dimension}', {expression}, COUNT(*) FROM applications "
+            f"GROUP BY {expression}"
+        )
+
+
+def downgrade():
+    op.drop_table('application_counts')
@@ -0,0 +1,72 @@
+"""applicant search index
+
+Revision ID: e9c4a7b2d1f8
+Revises: d7f1b3c5e9a4
+Create Date: 2026-10-17 23:58:02.417356
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9c4a7b2d1f8'
+down_revision = 'd7f1b3c5e9a4'
+branch_labels = None
+depends_on = None
+
+# Must match app.application.search.SEARCH_COLUMNS and its DDL.
+COLUMNS = ('full_name', 'email', 'phone_number', 'institution_name')
+TRIGGERS = ('insert', 'delete', 'update')
+_columns = ', '.join(COLUMNS)
+_new = ', '.join(f'new.{name}' for name in COLUMNS)
+_old = ', '.join(f'old.{name}' for name in COLUMNS)
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5("
+    f"{_columns}, content='applications', content_rowid='id', "
+    f"tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS applications_fts_insert "
+    f"AFTER INSERT ON applications BEGIN "
+    f"INSERT INTO applications_fts(rowid, {_columns}) VALUES (new.id, {_new}); "
+    f"END",
+    f"CREATE TRIGGER IF NOT EXISTS applications_fts_delete "
+    f"AFTER DELETE ON applications BEGIN "
+    f"INSERT INTO applications_fts(applications_fts, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old}); "
+    f"END",
+    f"CREATE TRIGGER IF NOT EXISTS applications_fts_update "
+    f"AFTER UPDATE OF {_columns} ON applications BEGIN "
+    f"INSERT INTO applications_fts(applications_fts, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old}); "
+    f"INSERT INTO applications_fts(rowid, {_columns}) VALUES (new.id, {_new}); "
+    f"END",
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+        # Index the applications that already exist.
+        op.execute(
+            "INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')"
+        )
+    elif dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name in COLUMNS:
+            op.execute(
+                f'CREATE INDEX IF NOT EXISTS ix_applications_{name}_trgm '
+                f'ON applications USING gin ({name} gin_trgm_ops)'
+            )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in TRIGGERS:
+            op.execute(f'DROP TRIGGER IF EXISTS applications_fts_{trigger}')
+        op.execute('DROP TABLE IF EXISTS applications_fts')
+    elif dialect == 'postgresql':
+        for name in COLUMNS:
+            op.execute(f'DROP INDEX IF EXISTS ix_applications_{name}_trgm')
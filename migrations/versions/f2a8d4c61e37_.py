@@ -0,0 +1,50 @@
+"""one document per (application, document type) and satisfied type count
+
+Revision ID: f2a8d4c61e37
+Revises: e7c3f5a18b04
+Create Date: 2026-10-17 21:05:42.318206
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a8d4c61e37'
+down_revision = 'e7c3f5a18b04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the newest document of each type per application, releasing
+    # the blob references of the ones dropped.
+    op.execute(
+        "UPDATE blobs SET ref_count = ref_count - ("
+        "SELECT COUNT(*) FROM documents WHERE documents.sha256 = blobs.sha256 "
+        "AND documents.id NOT IN ("
+        "SELECT MAX(id) FROM documents GROUP BY application_id, document_type_id))"
+    )
+    op.execute(
+        "DELETE FROM documents WHERE id NOT IN ("
+        "SELECT MAX(id) FROM documents GROUP BY application_id, document_type_id)"
+    )
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_documents_application_type', ['application_id', 'document_type_id'])
+
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('satisfied_document_types', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        "UPDATE applications SET satisfied_document_types = ("
+        "SELECT COUNT(*) FROM documents "
+        "WHERE documents.application_id = applications.id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_column('satisfied_document_types')
+
+    with op.batch_alter_table('documents', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_documents_application_type', type_='unique')
@@ -1,28 +1,62 @@
 import pytest
 
 from app import create_app
-from app.config import AppConfig
-from app.extensions import db
-
-# Create a configuration for testing
-test_config = AppConfig(
-    SECRET_KEY="this-is-secret",
-    SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
-    TESTING=True,
-)
+from app.config import FileConfig
+from app.extensions import bootstrap, db
+from tests.config import test_config
 
 
 @pytest.fixture
 def app():
     app = create_app(test_config)
     with app.app_context():
-        db.create_all()
+        bootstrap()
     yield app
     with app.app_context():
         db.session.remove()
         db.drop_all()
 
 
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    """Keep uploaded documents out of the real UPLOADS directory."""
+    path = tmp_path / "uploads"
+    path.mkdir()
+    monkeypatch.setattr(FileConfig, "UPLOAD_FILE", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def letter_dir(tmp_path, monkeypatch):
+    """Keep rendered letters out of the real ADMISSION_LETTER directory."""
+    path = tmp_path / "letters"
+    path.mkdir()
+    monkeypatch.setattr(FileConfig, "ADMISSION_LETTER", path)
+    return path
+
+
 @pytest.fixture
 def client(app):
     return app.test_client()
+
+
+@pytest.fixture
+def admin_client(client):
+    response = client.post(
+        "/auth/login", json={"email": "admin@gmail.com", "password": "admin"}
+    )
+    assert response.status_code == 200
+    return client
+
+
+@pytest.fixture
+def login_as(app):
+    """Return a factory for test clients already logged in as a user id."""
+
+    def login(user_id):
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["_user_id"] = str(user_id)
+        return client
+
+    return login
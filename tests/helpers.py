@@ -0,0 +1,103 @@
+import io
+from contextlib import contextmanager
+from datetime import date
+
+from sqlalchemy import event
+
+from app.application.models import Application, ApplicationStatus, PreferredCourse
+from app.authentication.models import User
+from app.extensions import db
+
+
+def seed_applications(app, count, course_count=1, **overrides):
+    """Insert ``count`` applications spread across ``course_count`` courses."""
+    with app.app_context():
+        courses = [
+            PreferredCourse(
+                course_name=f"Course {i}", max_applications_count=count, applied_count=0
+            )
+            for i in range(course_count)
+        ]
+        db.session.add_all(courses)
+        db.session.flush()
+        for i in range(count):
+            user = User(name=f"user{i}", email=f"user{i}@example.com", password="x")
+            db.session.add(user)
+            db.session.flush()
+            fields = {
+                "user": user.id,
+                "full_name": f"Applicant {i}",
+                "date_of_birth": date(2000, 1, 1),
+                "gender": "Other",
+                "email": f"applicant{i}@example.com",
+                "phone_number": "+1234567890",
+                "address": "Street 1",
+                "nationality": "Indian",
+                "highest_qualification": "HSC",
+                "institution_name": "School",
+                "graduation_year": 2020,
+                "preferred_course_id": courses[i % course_count].id,
+                "status": ApplicationStatus.INCOMPLETE,
+            }
+            fields.update(overrides)
+            db.session.add(Application(**fields))
+        db.session.commit()
+        return [course.id for course in courses]
+
+
+def application_payload(i, course_id):
+    return {
+        "full_name": f"Applicant {i}",
+        "date_of_birth": "2000-01-01",
+        "gender": "male",
+        "email": f"applicant{i}@example.com",
+        "phone_number": "+1234567890",
+        "address": "Street 1",
+        "nationality": "Indian",
+        "highest_qualification": "HSC",
+        "institution_name": "School",
+        "graduation_year": 2020,
+        "preferred_course_id": course_id,
+    }
+
+
+def upload(client, document_type_id, content, filename="scan.pdf"):
+    return client.post(
+        "/user/documents/upload",
+        data={
+            "document_type_id": document_type_id,
+            "file": (io.BytesIO(content), filename),
+        },
+        content_type="multipart/form-data",
+    )
+
+
+def approve(client, application_id):
+    return client.put(
+        f"/admin/applications/{application_id}/status", data={"status": "Approved"}
+    )
+
+
+@contextmanager
+def recorded_queries(app):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def query_plan(statement) -> str:
+    """SQLite's EXPLAIN QUERY PLAN for ``statement``, one step per line."""
+    sql = statement.compile(
+        dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return "\n".join(row[-1] for row in rows)
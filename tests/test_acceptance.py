@@ -0,0 +1,109 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.application.acceptance import AcceptanceWindow, get_acceptance_cache
+from app.application.models import PreferredCourse
+from app.authentication.models import User
+from app.extensions import db
+from tests.helpers import application_payload, recorded_queries, upload
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def applicant(app, login_as):
+    with app.app_context():
+        course = PreferredCourse(
+            course_name="Open", max_applications_count=5, applied_count=0
+        )
+        db.session.add_all(
+            [course, User(name="u", email="u@example.com", password="x")]
+        )
+        db.session.commit()
+    return login_as(2)
+
+
+def set_window(admin_client, is_enabled=True, start=None, end=None):
+    response = admin_client.put(
+        "/admin/acceptance",
+        json={
+            "is_enabled": is_enabled,
+            "start_date": start and start.isoformat(),
+            "end_date": end and end.isoformat(),
+        },
+    )
+    assert response.status_code == 200
+
+
+def create(client):
+    return client.post("/user/applications", json=application_payload(1, 1))
+
+
+@pytest.mark.parametrize(
+    "window, today, accepting",
+    [
+        (AcceptanceWindow(), TODAY, True),
+        (AcceptanceWindow(is_enabled=False), TODAY, False),
+        (AcceptanceWindow(start_date=TODAY, end_date=TODAY), TODAY, True),
+        (AcceptanceWindow(start_date=TODAY), TODAY - timedelta(days=1), False),
+        (AcceptanceWindow(end_date=TODAY), TODAY + timedelta(days=1), False),
+    ],
+)
+def test_window_bounds_are_inclusive(window, today, accepting):
+    assert window.is_open(today) is accepting
+
+
+def test_disabled_acceptance_rejects_every_write(app, admin_client, applicant):
+    set_window(admin_client, is_enabled=False)
+
+    assert create(applicant).status_code == 403
+    assert upload(applicant, 1, b"a").status_code == 403
+    response = applicant.post(
+        "/user/documents/uploads", json={"document_type_id": 1, "filename": "a.pdf"}
+    )
+    assert response.status_code == 403
+    # Reads are unaffected.
+    assert applicant.get("/user/courses").status_code == 200
+
+    set_window(admin_client, start=TODAY, end=TODAY + timedelta(days=7))
+    assert create(applicant).status_code == 201
+
+
+def test_submission_outside_dates_is_rejected(app, admin_client, applicant):
+    set_window(admin_client, start=TODAY + timedelta(days=1))
+    assert create(applicant).status_code == 403
+    set_window(admin_client, end=TODAY - timedelta(days=1))
+    assert create(applicant).status_code == 403
+
+
+def test_window_check_is_served_from_snapshot(app, admin_client, applicant):
+    set_window(admin_client, is_enabled=False)
+    assert create(applicant).status_code == 403
+
+    with recorded_queries(app) as statements:
+        for _ in range(3):
+            assert create(applicant).status_code == 403
+    assert not [s for s in statements if "application_acceptance_settings" in s]
+
+
+def test_change_by_another_process_is_picked_up(app, admin_client, applicant):
+    app.config["ACCEPTANCE_CHECK_INTERVAL"] = 0
+    set_window(admin_client)
+    with app.app_context():
+        snapshot = get_acceptance_cache().get()
+        # Written behind this process's back, as another worker would.
+        db.session.execute(
+            text(
+                "UPDATE application_acceptance_settings "
+                "SET is_enabled = 0, version = version + 1"
+            )
+        )
+        db.session.commit()
+        cache = get_acceptance_cache()
+        assert cache.get() is not snapshot
+        # Unchanged rows keep the same snapshot.
+        assert cache.get() is cache.get()
+
+    assert create(applicant).status_code == 403
@@ -0,0 +1,94 @@
+from sqlalchemy import delete
+
+from app.application.analytics import dashboard, rebuild_counts
+from app.application.models import Application, ApplicationCount, DocumentType
+from app.extensions import db
+from tests.helpers import approve, recorded_queries, seed_applications, upload
+
+
+def counts(app):
+    with app.app_context():
+        return dashboard()
+
+
+def test_counts_follow_inserts_and_status_changes(app, admin_client):
+    seed_applications(app, 4, course_count=2, nationality="Nepali")
+    approve(admin_client, 1)
+    admin_client.put(
+        "/admin/applications/status",
+        json={"status": "Rejected", "application_ids": [1, 2, 3]},
+    )
+
+    data = admin_client.get("/admin/analytics").get_json()
+    assert data["total"] == 4
+    assert data["status"] == {
+        "Incomplete": 1,
+        "Pending": 0,
+        "Approved": 1,
+        "Rejected": 2,
+    }
+    assert data["course"] == [
+        {"course_id": 1, "course_name": "Course 0", "count": 2},
+        {"course_id": 2, "course_name": "Course 1", "count": 2},
+    ]
+    assert data["nationality"] == {"Nepali": 4}
+    assert data["qualification"] == {"HSC": 4}
+
+
+def test_edits_and_deletes_move_buckets(app):
+    seed_applications(app, 2, course_count=2)
+    with app.app_context():
+        application = db.session.get(Application, 1)
+        application.nationality = "Nepali"
+        application.preferred_course_id = 2
+        db.session.commit()
+        db.session.delete(db.session.get(Application, 2))
+        db.session.commit()
+
+    data = counts(app)
+    assert data["total"] == 1
+    assert data["nationality"] == {"Nepali": 1}
+    assert [c["course_id"] for c in data["course"]] == [2]
+
+
+def test_promotion_moves_to_pending(app, login_as):
+    seed_applications(app, 1)
+    with app.app_context():
+        db.session.add(DocumentType(document_type_name="Transcript"))
+        db.session.commit()
+    client = login_as(2)
+
+    assert upload(client, 1, b"a").status_code == 201
+    assert counts(app)["status"]["Pending"] == 1
+    assert counts(app)["status"]["Incomplete"] == 0
+
+
+def test_rebuild_matches_incremental_counts(app, admin_client):
+    seed_applications(app, 5, course_count=3)
+    approve(admin_client, 2)
+    incremental = counts(app)
+
+    with app.app_context():
+        db.session.execute(delete(ApplicationCount))
+        db.session.commit()
+        assert dashboard()["total"] == 0
+    result = app.test_cli_runner().invoke(args=["analytics", "rebuild"])
+    assert "Rebuilt" in result.output
+    assert counts(app) == incremental
+
+    with app.app_context():
+        rebuild_counts()
+        assert dashboard() == incremental
+
+
+def test_dashboard_queries_do_not_grow_with_applications(app, admin_client):
+    # Warm the admin's cached principal first.
+    admin_client.get("/admin/analytics")
+    with recorded_queries(app) as few:
+        admin_client.get("/admin/analytics")
+    seed_applications(app, 30)
+    with recorded_queries(app) as many:
+        admin_client.get("/admin/analytics")
+
+    assert len(few) == len(many)
+    assert not [s for s in many if "FROM applications" in s]
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+
+from flask.testing import FlaskClient
+
+from app.application.models import (Application, ApplicationStatus, Document,
+                                    DocumentType)
+from app.extensions import db
+from app.validation import today
+from tests.helpers import seed_applications
+
+
+def test_admin_list_paginates_with_cursor(app, admin_client: FlaskClient):
+    seed_applications(app, 5)
+
+    first = admin_client.get("/admin/applications?limit=2").get_json()
+    assert [a["id"] for a in first["applications"]] == [1, 2]
+    assert set(first["applications"][0]) == {"id", "full_name", "email", "status"}
+    assert first["next_cursor"]
+
+    seen = [a["id"] for a in first["applications"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = admin_client.get(f"/admin/applications?limit=2&cursor={cursor}")
+        data = page.get_json()
+        seen += [a["id"] for a in data["applications"]]
+        cursor = data["next_cursor"]
+    assert seen == [1, 2, 3, 4, 5]
+
+
+def test_admin_list_filters(app, admin_client: FlaskClient):
+    course_ids = seed_applications(app, 6, course_count=2)
+    with app.app_context():
+        db.session.get(Application, 2).status = ApplicationStatus.PENDING
+        db.session.get(Application, 1).created_at = datetime(2024, 1, 10, 8, 30)
+        db.session.commit()
+
+    data = admin_client.get("/admin/applications?status=Pending").get_json()
+    assert [a["id"] for a in data["applications"]] == [2]
+
+    data = admin_client.get(
+        f"/admin/applications?preferred_course_id={course_ids[1]}"
+    ).get_json()
+    assert [a["id"] for a in data["applications"]] == [2, 4, 6]
+
+    data = admin_client.get(
+        "/admin/applications?created_from=2024-01-10&created_to=2024-01-10"
+    ).get_json()
+    assert [a["id"] for a in data["applications"]] == [1]
+    assert data["next_cursor"] is None
+
+
+def test_admin_list_rejects_bad_cursor(admin_client: FlaskClient):
+    response = admin_client.get("/admin/applications?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_admin_export_ndjson_and_csv(app, admin_client: FlaskClient):
+    course_ids = seed_applications(app, 3, course_count=2)
+    with app.app_context():
+        db.session.add_all(
+            [
+                DocumentType(document_type_name="Transcript"),
+                DocumentType(document_type_name="Photo", max_size=10),
+            ]
+        )
+        db.session.flush()
+        db.session.add(Document(application_id=1, document_type_id=1, file_path="x"))
+        db.session.add(Document(application_id=1, document_type_id=2, file_path="y"))
+        db.session.commit()
+
+    response = admin_client.get("/admin/applications/export")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    records = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [r["id"] for r in records] == [1, 2, 3]
+    assert records[0]["course_name"] == "Course 0"
+    assert records[0]["document_count"] == 2
+    assert records[1]["document_count"] == 0
+    assert records[0]["status"] == "Incomplete"
+
+    response = admin_client.get(
+        f"/admin/applications/export?format=csv&preferred_course_id={course_ids[0]}"
+    )
+    assert response.mimetype == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(response.data.decode())))
+    assert [row["id"] for row in rows] == ["1", "3"]
+    assert rows[0]["document_count"] == "2"
+
+
+def test_validation_errors_are_reported_per_field(admin_client: FlaskClient):
+    response = admin_client.post(
+        "/admin/courses",
+        data=b'{"course_name": "", "max_applications_count": 0}',
+        content_type="application/json",
+    )
+    assert response.status_code == 400
+    errors = response.get_json()
+    assert [e["loc"] for e in errors] == [["course_name"], ["max_applications_count"]]
+    assert "url" not in errors[0]
+
+    response = admin_client.post(
+        "/admin/courses", data=b"{not json", content_type="application/json"
+    )
+    assert response.status_code == 400
+    assert response.get_json()[0]["type"] == "json_invalid"
+
+
+def test_today_is_read_once_per_request(app, monkeypatch):
+    calls = []
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            calls.append(1)
+            return date(2030, 1, 1)
+
+    monkeypatch.setattr("app.validation.date", FakeDate)
+    with app.test_request_context():
+        assert today() == today() == date(2030, 1, 1)
+    assert len(calls) == 1
@@ -0,0 +1,179 @@
+import pytest
+from flask.testing import FlaskClient
+from werkzeug.security import generate_password_hash
+
+from app.authentication.hashing import HasherBusy, PasswordHasher
+from app.authentication.models import RoleEnum, User
+from app.authentication.principal import SESSION_ID_KEY, get_principal_cache
+from app.extensions import db
+from tests.helpers import recorded_queries, seed_applications
+
+
+def test_cached_principal_skips_user_query(app, login_as):
+    seed_applications(app, 1)
+    client = login_as(2)
+    assert client.get("/user/status").status_code == 200
+
+    with recorded_queries(app) as statements:
+        assert client.get("/user/status").status_code == 200
+    assert len(statements) == 1
+    assert "FROM user" not in statements[0]
+
+
+def test_logout_forgets_session(app, client: FlaskClient):
+    response = client.post(
+        "/auth/login", json={"email": "admin@gmail.com", "password": "admin"}
+    )
+    assert response.status_code == 200
+    assert client.get("/admin/courses").status_code == 200
+    with client.session_transaction() as sess:
+        session_id = sess[SESSION_ID_KEY]
+    with app.app_context():
+        assert get_principal_cache().get(session_id) is not None
+
+    client.post("/auth/logout")
+    with app.app_context():
+        assert get_principal_cache().get(session_id) is None
+    assert client.get("/admin/courses").status_code == 401
+
+
+def test_role_change_evicts_principal(app, login_as):
+    client = login_as(1)
+    assert client.post(
+        "/admin/courses", json={"course_name": "A", "max_applications_count": 1}
+    ).status_code == 201
+
+    with app.app_context():
+        admin = db.session.get(User, 1)
+        admin.role = RoleEnum.USER
+        db.session.commit()
+    response = client.post(
+        "/admin/courses", json={"course_name": "B", "max_applications_count": 1}
+    )
+    assert response.status_code == 403
+
+
+def test_register_and_login_hash_on_process_pool(app, client: FlaskClient):
+    hasher = PasswordHasher(
+        app.config["PASSWORD_HASH_METHOD"], workers=1, max_pending=4
+    )
+    app.extensions["password_hasher"] = hasher
+    try:
+        response = client.post(
+            "/auth/register",
+            json={"name": "A", "email": "a@example.com", "password": "secret"},
+        )
+        assert response.status_code == 201
+        response = client.post(
+            "/auth/login", json={"email": "a@example.com", "password": "secret"}
+        )
+        assert response.status_code == 200
+        assert hasher._executor is not None
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_hasher_returns_429(app, client: FlaskClient):
+    hasher = PasswordHasher(
+        app.config["PASSWORD_HASH_METHOD"], workers=0, max_pending=2
+    )
+    app.extensions["password_hasher"] = hasher
+    login = {"email": "admin@gmail.com", "password": "admin"}
+
+    # Hold every slot, as two hashes still running would.
+    for _ in range(2):
+        assert hasher._slots.acquire(blocking=False)
+    response = client.post("/auth/login", json=login)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    # Expanding the method's parameters is a hash too, so it waits its turn.
+    with pytest.raises(HasherBusy):
+        hasher.needs_rehash("scrypt:1:1:1$salt$hash")
+
+    hasher._slots.release()
+    assert client.post("/auth/login", json=login).status_code == 200
+
+
+def test_hasher_needs_a_slot(app):
+    with pytest.raises(ValueError):
+        PasswordHasher(app.config["PASSWORD_HASH_METHOD"], workers=0, max_pending=0)
+
+
+def test_login_rehashes_outdated_password(app, client: FlaskClient):
+    with app.app_context():
+        user = User(
+            name="old",
+            email="old@example.com",
+            password=generate_password_hash("secret", method="pbkdf2:sha256:1000"),
+        )
+        db.session.add(user)
+        db.session.commit()
+
+    response = client.post(
+        "/auth/login", json={"email": "old@example.com", "password": "wrong"}
+    )
+    assert response.status_code == 401
+    response = client.post(
+        "/auth/login", json={"email": "old@example.com", "password": "secret"}
+    )
+    assert response.status_code == 200
+
+    with app.app_context():
+        user = User.query.filter_by(email="old@example.com").one()
+        assert user.password.startswith(app.config["PASSWORD_HASH_METHOD"] + "$")
+        assert user.check_password("secret")
+
+
+def token_login(client, email="admin@gmail.com", password="admin"):
+    response = client.post("/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_access_token_authenticates_without_queries(app):
+    app.config["AUTH_TOKENS_ENABLED"] = True
+    tokens = token_login(app.test_client())
+    assert tokens["token_type"] == "Bearer"
+
+    # A fresh client has no session cookie: only the token identifies it.
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    with recorded_queries(app) as statements:
+        response = client.get("/admin/courses", headers=headers)
+    assert response.status_code == 200
+    assert not any("FROM user" in s for s in statements)
+    assert "Set-Cookie" not in response.headers
+
+    bad = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+    assert client.get("/admin/courses", headers=bad).status_code == 401
+
+
+def test_refresh_issues_new_tokens_with_current_role(app):
+    app.config["AUTH_TOKENS_ENABLED"] = True
+    client = app.test_client()
+    tokens = token_login(client)
+    with app.app_context():
+        db.session.get(User, 1).role = RoleEnum.USER
+        db.session.commit()
+
+    response = client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+    response = app.test_client().post(
+        "/admin/courses",
+        headers=headers,
+        json={"course_name": "A", "max_applications_count": 1},
+    )
+    assert response.status_code == 403
+
+    response = client.post(
+        "/auth/refresh", json={"refresh_token": tokens["access_token"]}
+    )
+    assert response.status_code == 401
+
+
+def test_tokens_disabled_by_default(app, client: FlaskClient):
+    assert "access_token" not in token_login(client)
+    assert client.post("/auth/refresh", json={"refresh_token": "x"}).status_code == 404
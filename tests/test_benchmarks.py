@@ -0,0 +1,68 @@
+from app.config import FileConfig
+from benchmarks.compare import compare_reports
+from benchmarks.dataset import DatasetConfig
+from benchmarks.runner import RunConfig, run_suite
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.validation import PAYLOADS, measure_validation
+
+
+def test_client_suite_runs_every_scenario(tmp_path, monkeypatch, capsys):
+    # bench_config points FileConfig at the benchmark directory.
+    monkeypatch.setattr(FileConfig, "UPLOAD_FILE", FileConfig.UPLOAD_FILE)
+    monkeypatch.setattr(FileConfig, "ADMISSION_LETTER", FileConfig.ADMISSION_LETTER)
+
+    report = run_suite(
+        tmp_path,
+        DatasetConfig(users=6, courses=2, letters=2),
+        RunConfig(requests=4, warmup=1),
+        ["client"],
+    )
+
+    results = report["results"]["client"]
+    assert set(results) == {s.name for s in SCENARIOS}
+    for name, stats in results.items():
+        assert stats["requests"] == 4, name
+        assert stats["errors"] == 0, (name, stats["status_codes"])
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    # One set of fresh users per create-application scenario.
+    assert report["meta"]["dataset"]["fresh_users"] == 10
+    assert report["meta"]["dataset"]["upload_sessions"] == 5
+    # `python -m benchmarks` prints the report as JSON on stdout.
+    assert capsys.readouterr().out == ""
+
+
+def test_compare_flags_regressions():
+    def report(p95, rps, errors=0):
+        stats = {
+            "p50_ms": 1.0,
+            "p95_ms": p95,
+            "p99_ms": p95,
+            "rps": rps,
+            "errors": errors,
+        }
+        return {"results": {"client": {"user_status": stats}}}
+
+    changes = compare_reports(report(10.0, 100.0), report(10.5, 97.0))
+    assert changes == []
+
+    changes = compare_reports(report(10.0, 100.0), report(15.0, 60.0, errors=2))
+    regressed = {(c.metric, c.regressed) for c in changes}
+    assert regressed == {
+        ("errors", True),
+        ("p95_ms", True),
+        ("p99_ms", True),
+        ("rps", True),
+    }
+
+    changes = compare_reports(report(10.0, 100.0), report(5.0, 200.0))
+    assert changes and not any(c.regressed for c in changes)
+
+
+def test_validation_benchmark_times_each_payload():
+    report = measure_validation(iterations=3)
+
+    results = report["results"]["validation"]
+    assert set(results) == set(PAYLOADS)
+    for stats in results.values():
+        assert stats["samples"] == 3
+        assert stats["p50_ms"] <= stats["p99_ms"]
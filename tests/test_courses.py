@@ -0,0 +1,99 @@
+from flask.testing import FlaskClient
+
+from app.application import catalog
+from app.application.models import PreferredCourse
+from app.authentication.models import User
+from app.cache import LocalSharedCache, VersionedCache
+from app.extensions import db
+from tests.helpers import application_payload
+
+
+def add_course(app, name, seats, taken=0):
+    with app.app_context():
+        course = PreferredCourse(
+            course_name=name, max_applications_count=seats, applied_count=taken
+        )
+        db.session.add(course)
+        db.session.commit()
+        return course.id
+
+
+def count_loads(app, monkeypatch):
+    calls = []
+    with app.app_context():
+        cache = catalog.get_course_catalog()
+    load = cache.loader
+
+    def counting_load():
+        calls.append(1)
+        return load()
+
+    monkeypatch.setattr(cache, "loader", counting_load)
+    return calls
+
+
+def test_course_list_excludes_full_courses_and_is_cached(
+    app, client: FlaskClient, login_as, monkeypatch
+):
+    open_id = add_course(app, "Open", 2)
+    add_course(app, "Full", 1, taken=1)
+    loads = count_loads(app, monkeypatch)
+    user = login_as(1)
+
+    for _ in range(3):
+        response = user.get("/user/courses")
+        assert response.get_json() == [{"id": open_id, "course_name": "Open"}]
+    assert len(loads) == 1
+
+
+def test_course_creation_invalidates_catalog(
+    app, admin_client: FlaskClient, login_as
+):
+    user = login_as(1)
+    assert user.get("/user/courses").get_json() == []
+
+    response = admin_client.post(
+        "/admin/courses",
+        json={"course_name": "New", "max_applications_count": 1},
+    )
+    assert response.status_code == 201
+    assert [c["course_name"] for c in user.get("/user/courses").get_json()] == ["New"]
+
+
+def test_seat_reservation_invalidates_catalog(app, login_as):
+    course_id = add_course(app, "Tiny", 1)
+    with app.app_context():
+        db.session.add(User(name="u", email="u@example.com", password="x"))
+        db.session.commit()
+    user = login_as(2)
+    assert len(user.get("/user/courses").get_json()) == 1
+
+    response = user.post(
+        "/user/applications", json=application_payload(1, course_id)
+    )
+    assert response.status_code == 201
+    assert user.get("/user/courses").get_json() == []
+
+
+def test_versioned_cache_shares_invalidation():
+    shared = LocalSharedCache()
+    value = {"n": 1}
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return dict(value)
+
+    first = VersionedCache("catalog", loader, ttl=60, shared=shared)
+    # ttl=0: every read checks the shared cache, like an expired copy.
+    second = VersionedCache("catalog", loader, ttl=0, shared=shared)
+    assert first.get() == {"n": 1}
+    assert second.get() == {"n": 1}
+    assert len(loads) == 1
+
+    value["n"] = 2
+    assert first.get() == {"n": 1}
+    first.invalidate()
+    assert first.get() == {"n": 2}
+    assert second.get() == {"n": 2}
+    assert len(loads) == 2
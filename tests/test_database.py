@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import text
+
+from app import create_app
+from app.config import AppConfig, config_from_env
+from app.database import engine_options
+from app.extensions import db
+
+
+def test_config_defaults_to_development_profile():
+    config = config_from_env({})
+    assert config.SQLALCHEMY_DATABASE_URI == "sqlite:///app.db"
+    assert config.DEBUG
+
+
+def test_config_fields_are_overridden_from_environment():
+    config = config_from_env(
+        {
+            "APP_ENV": "production",
+            "APP_SECRET_KEY": "from-env",
+            "DATABASE_URL": "postgres://app:pw@db:5432/app",
+            "APP_DATABASE_POOL_SIZE": "25",
+            "APP_DATABASE_POOL_PRE_PING": "false",
+            "APP_REDIS_URL": "",
+        }
+    )
+    assert config.SECRET_KEY == "from-env"
+    assert config.SQLALCHEMY_DATABASE_URI == "postgresql+psycopg://app:pw@db:5432/app"
+    assert config.DATABASE_POOL_SIZE == 25
+    assert config.DATABASE_MAX_OVERFLOW == 20
+    assert config.DATABASE_POOL_PRE_PING is False
+    assert config.REDIS_URL is None
+
+
+def test_production_requires_secret_key_and_database():
+    with pytest.raises(ValueError, match="APP_SECRET_KEY"):
+        config_from_env({"APP_ENV": "production"})
+    with pytest.raises(ValueError, match="APP_ENV"):
+        config_from_env({"APP_ENV": "staging"})
+
+
+def test_pool_options_skip_in_memory_sqlite():
+    memory = engine_options(
+        vars(AppConfig(SECRET_KEY="x", SQLALCHEMY_DATABASE_URI="sqlite://"))
+    )
+    assert "pool_size" not in memory
+    on_disk = engine_options(
+        vars(AppConfig(SECRET_KEY="x", SQLALCHEMY_DATABASE_URI="sqlite:///a.db"))
+    )
+    assert (on_disk["pool_size"], on_disk["max_overflow"]) == (5, 10)
+
+
+def test_sqlite_connections_use_wal(tmp_path):
+    app = create_app(
+        AppConfig(
+            SECRET_KEY="this-is-secret",
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'wal.db'}",
+            TESTING=True,
+            SQLITE_BUSY_TIMEOUT=1234,
+        )
+    )
+    with app.app_context():
+
+        def pragma(name):
+            return db.session.execute(text(f"PRAGMA {name}")).scalar()
+
+        assert pragma("journal_mode") == "wal"
+        # NORMAL
+        assert pragma("synchronous") == 1
+        assert pragma("busy_timeout") == 1234
+        assert pragma("mmap_size") == 256 * 1024 * 1024
+        db.session.remove()
+        db.engine.dispose()
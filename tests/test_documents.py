@@ -0,0 +1,249 @@
+import hashlib
+
+import pytest
+
+from app.application.blobs import blob_key, collect_garbage
+from app.application.models import (Application, ApplicationStatus, Blob,
+                                    Document, DocumentType, UploadSession)
+from app.authentication.models import User
+from app.extensions import db
+from tests.helpers import seed_applications, upload
+
+
+@pytest.fixture
+def applicant(app, login_as):
+    seed_applications(app, 1)
+    with app.app_context():
+        db.session.add_all(
+            [
+                DocumentType(document_type_name="Transcript"),
+                DocumentType(document_type_name="Photo", max_size=10),
+            ]
+        )
+        db.session.commit()
+        return login_as(db.session.get(Application, 1).user)
+
+
+def test_upload_is_hashed_and_stored(app, applicant, upload_dir):
+    content = b"x" * 200_000
+    response = upload(applicant, 1, content, filename="../../etc/scan.pdf")
+    assert response.status_code == 201
+
+    with app.app_context():
+        document = db.session.get(Document, response.get_json()["document_id"])
+        assert document.sha256 == hashlib.sha256(content).hexdigest()
+        assert document.size == len(content)
+        assert document.file_path == blob_key(document.sha256)
+        assert document.filename == "etc_scan.pdf"
+        with open(upload_dir / document.file_path, "rb") as f:
+            assert f.read() == content
+    assert not list(upload_dir.glob("*.part"))
+
+
+def test_upload_over_type_limit_is_rejected(app, applicant, upload_dir):
+    response = upload(applicant, 2, b"y" * 11)
+    assert response.status_code == 413
+    assert not list(upload_dir.iterdir())
+    with app.app_context():
+        assert Document.query.count() == 0
+
+
+# 1 KiB is refused from Content-Length alone; 150 kB only once streaming
+# crosses the limit.
+@pytest.mark.parametrize("limit", [1024, 150_000])
+def test_upload_over_global_limit_is_rejected(app, applicant, upload_dir, limit):
+    app.config["UPLOAD_MAX_SIZE"] = limit
+    response = upload(applicant, 1, b"z" * 200_000)
+    assert response.status_code == 413
+    assert not list(upload_dir.iterdir())
+
+
+def test_all_documents_move_application_to_pending(app, applicant):
+    assert upload(applicant, 1, b"a").status_code == 201
+    assert upload(applicant, 2, b"b").status_code == 201
+    with app.app_context():
+        assert db.session.get(Application, 1).status == ApplicationStatus.PENDING
+
+
+def test_reupload_replaces_document_of_same_type(app, applicant, upload_dir):
+    first = upload(applicant, 1, b"draft", filename="draft.pdf")
+    again = upload(applicant, 1, b"final", filename="final.pdf")
+    assert again.status_code == 200
+    assert again.get_json()["document_id"] == first.get_json()["document_id"]
+
+    draft, final = (hashlib.sha256(c).hexdigest() for c in (b"draft", b"final"))
+    with app.app_context():
+        document = Document.query.one()
+        assert (document.sha256, document.filename) == (final, "final.pdf")
+        assert db.session.get(Blob, draft).ref_count == 0
+        assert db.session.get(Blob, final).ref_count == 1
+        application = db.session.get(Application, 1)
+        assert application.satisfied_document_types == 1
+        # Two uploads of one type do not complete a two-type application.
+        assert application.status == ApplicationStatus.INCOMPLETE
+
+
+def test_new_document_type_raises_requirement(app, applicant):
+    assert upload(applicant, 1, b"a").status_code == 201
+    with app.app_context():
+        db.session.add(DocumentType(document_type_name="Passport"))
+        db.session.commit()
+    assert upload(applicant, 2, b"b").status_code == 201
+    with app.app_context():
+        assert db.session.get(Application, 1).status == ApplicationStatus.INCOMPLETE
+    assert upload(applicant, 3, b"c").status_code == 201
+    with app.app_context():
+        application = db.session.get(Application, 1)
+        assert application.satisfied_document_types == 3
+        assert application.status == ApplicationStatus.PENDING
+
+
+def test_deleting_document_decrements_satisfied_types(app, applicant):
+    upload(applicant, 1, b"a")
+    upload(applicant, 2, b"b")
+    with app.app_context():
+        db.session.delete(Document.query.filter_by(document_type_id=2).one())
+        db.session.commit()
+        assert db.session.get(Application, 1).satisfied_document_types == 1
+
+
+def test_duplicate_uploads_share_one_blob(app, applicant, upload_dir):
+    content = b"same scan"
+    first = upload(applicant, 1, content, filename="a.pdf").get_json()
+    second = upload(applicant, 2, content, filename="b.pdf").get_json()
+
+    sha256 = hashlib.sha256(content).hexdigest()
+    with app.app_context():
+        documents = Document.query.order_by(Document.id).all()
+        assert [d.id for d in documents] == [
+            first["document_id"],
+            second["document_id"],
+        ]
+        assert {d.file_path for d in documents} == {blob_key(sha256)}
+        assert [d.filename for d in documents] == ["a.pdf", "b.pdf"]
+        assert db.session.get(Blob, sha256).ref_count == 2
+    stored = [p for p in upload_dir.rglob("*") if p.is_file()]
+    assert stored == [upload_dir / sha256[:2] / sha256[2:4] / sha256]
+
+
+def test_garbage_collection_removes_unreferenced_blobs(app, applicant, upload_dir):
+    upload(applicant, 1, b"kept")
+    upload(applicant, 2, b"dropped")
+    kept, dropped = (hashlib.sha256(c).hexdigest() for c in (b"kept", b"dropped"))
+
+    with app.app_context():
+        db.session.delete(Document.query.filter_by(sha256=dropped).one())
+        db.session.commit()
+        assert db.session.get(Blob, dropped).ref_count == 0
+
+        # Still inside the grace period.
+        assert collect_garbage() == 0
+        assert (upload_dir / blob_key(dropped)).exists()
+
+        assert collect_garbage(grace_seconds=-60) == 1
+        assert not (upload_dir / blob_key(dropped)).exists()
+        assert db.session.get(Blob, dropped) is None
+        assert (upload_dir / blob_key(kept)).exists()
+
+
+def test_garbage_collection_removes_interrupted_writes(app, upload_dir):
+    shard = (upload_dir / blob_key("ab" * 32)).parent
+    shard.mkdir(parents=True)
+    leftovers = [upload_dir / "upload.part", shard / "tmp1234.part"]
+    for path in leftovers:
+        path.write_bytes(b"partial")
+
+    with app.app_context():
+        collect_garbage()
+        assert all(path.exists() for path in leftovers)
+        collect_garbage(grace_seconds=-60)
+    assert not any(path.exists() for path in leftovers)
+
+
+def test_resumable_upload_out_of_order(app, applicant, login_as, upload_dir):
+    content = b"0123456789" * 30_000
+    parts = [content[i : i + 100_000] for i in range(0, len(content), 100_000)]
+
+    response = applicant.post(
+        "/user/documents/uploads",
+        json={"document_type_id": 1, "filename": "transcript.pdf"},
+    )
+    assert response.status_code == 201
+    upload_id = response.get_json()["upload_id"]
+    session_url = f"/user/documents/uploads/{upload_id}"
+
+    for number in (3, 1):
+        response = applicant.put(
+            f"{session_url}/parts/{number}", data=parts[number - 1]
+        )
+        assert response.status_code == 200
+    # Another applicant cannot see the session.
+    with app.app_context():
+        other = User(name="other", email="other@example.com", password="x")
+        db.session.add(other)
+        db.session.commit()
+        other_id = other.id
+    assert login_as(other_id).get(session_url).status_code == 404
+
+    status = applicant.get(session_url).get_json()
+    assert [p["part_number"] for p in status["parts"]] == [1, 3]
+    response = applicant.post(f"{session_url}/complete")
+    assert response.status_code == 400
+    assert response.get_json()["missing_parts"] == [2]
+
+    applicant.put(f"{session_url}/parts/2", data=parts[1])
+    response = applicant.post(
+        f"{session_url}/complete",
+        json={"sha256": hashlib.sha256(content).hexdigest()},
+    )
+    assert response.status_code == 201
+
+    with app.app_context():
+        document = db.session.get(Document, response.get_json()["document_id"])
+        assert document.filename == "transcript.pdf"
+        assert document.size == len(content)
+        with open(upload_dir / document.file_path, "rb") as f:
+            assert f.read() == content
+        assert db.session.get(UploadSession, upload_id) is None
+    assert not (upload_dir / "parts" / upload_id).exists()
+    assert applicant.get(session_url).status_code == 404
+
+
+def test_resumable_upload_rejects_checksum_mismatch(app, applicant):
+    upload_id = applicant.post(
+        "/user/documents/uploads", json={"document_type_id": 1, "filename": "a.pdf"}
+    ).get_json()["upload_id"]
+    applicant.put(f"/user/documents/uploads/{upload_id}/parts/1", data=b"abc")
+
+    response = applicant.post(
+        f"/user/documents/uploads/{upload_id}/complete", json={"sha256": "0" * 64}
+    )
+    assert response.status_code == 400
+    with app.app_context():
+        assert Document.query.count() == 0
+
+
+def test_resumable_parts_are_bounded_by_type_limit(app, applicant, monkeypatch):
+    # "Photo" allows 10 bytes in total.
+    upload_id = applicant.post(
+        "/user/documents/uploads", json={"document_type_id": 2, "filename": "a.jpg"}
+    ).get_json()["upload_id"]
+    session_url = f"/user/documents/uploads/{upload_id}"
+
+    assert applicant.put(f"{session_url}/parts/1", data=b"x" * 6).status_code == 200
+    assert applicant.put(f"{session_url}/parts/2", data=b"y" * 6).status_code == 413
+    # Resending a part replaces it rather than adding to the total.
+    assert applicant.put(f"{session_url}/parts/1", data=b"x" * 8).status_code == 200
+    assert applicant.put(f"{session_url}/parts/2", data=b"y" * 2).status_code == 200
+
+    # A failed completion keeps the session and its parts for a retry.
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            "app.application.views.save_document",
+            lambda *args: ({"message": "Already being uploaded."}, 409),
+        )
+        assert applicant.post(f"{session_url}/complete").status_code == 409
+    assert len(applicant.get(session_url).get_json()["parts"]) == 2
+
+    assert applicant.post(f"{session_url}/complete").status_code == 201
+    assert applicant.get(session_url).status_code == 404
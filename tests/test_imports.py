@@ -0,0 +1,200 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.application import imports
+from app.application.analytics import dashboard
+from app.application.imports import import_applications
+from app.application.models import Application, PreferredCourse
+from app.application.schemas import ApplicationCreateSchema
+from app.authentication.models import User
+from app.extensions import db
+from tests.helpers import application_payload, recorded_queries
+
+
+def ndjson(rows) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+def as_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def import_file(client, kind, body, fmt="ndjson"):
+    return client.post(f"/admin/{kind}/import?format={fmt}", data=body)
+
+
+@pytest.fixture
+def courses(admin_client):
+    rows = [
+        {"course_name": "Physics", "max_applications_count": 3},
+        {"course_name": "Chemistry", "max_applications_count": 10},
+    ]
+    response = import_file(admin_client, "courses", as_csv(rows), fmt="csv")
+    assert response.get_json() == {"imported": 2, "failed": 0, "errors": []}
+    return [1, 2]
+
+
+def test_course_rows_are_validated(app, admin_client):
+    body = ndjson(
+        [
+            {"course_name": "Biology", "max_applications_count": 5},
+            {"course_name": "", "max_applications_count": 0},
+        ]
+    ) + b"{not json\n"
+
+    report = import_file(admin_client, "courses", body).get_json()
+    assert report["imported"] == 1
+    assert [e["line"] for e in report["errors"]] == [2, 3]
+    fields = {e["field"] for e in report["errors"][0]["errors"]}
+    assert fields == {"course_name", "max_applications_count"}
+    with app.app_context():
+        assert [c.course_name for c in PreferredCourse.query.all()] == ["Biology"]
+
+
+def test_applications_are_imported_with_seats_and_counters(
+    app, admin_client, courses
+):
+    rows = [application_payload(i, 1) for i in range(4)]
+    rows += [application_payload(i, 2) for i in range(4, 6)]
+    # The first row's email again, and an unknown course.
+    rows += [application_payload(0, 2), application_payload(9, 99)]
+    rows[5]["gender"] = "unknown"
+
+    report = import_file(admin_client, "applications", as_csv(rows), "csv").get_json()
+    assert report["imported"] == 4
+    failures = {e["line"]: e["errors"][0]["message"] for e in report["errors"]}
+    assert "Gender" in failures.pop(7)
+    assert failures == {
+        5: "Selected course is not available.",
+        8: "Application already exists for this email.",
+        9: "Selected course is not available.",
+    }
+
+    with app.app_context():
+        seats = {c.id: c.applied_count for c in PreferredCourse.query.all()}
+        assert seats == {1: 3, 2: 1}
+        assert Application.query.count() == 4
+        owner = db.session.get(User, db.session.get(Application, 1).user)
+        assert owner.email == rows[0]["email"]
+        assert not owner.check_password("")
+        assert dashboard()["status"]["Incomplete"] == 4
+
+    # The imported applications are found by search.
+    response = admin_client.get(
+        "/admin/applications/search", query_string={"q": rows[0]["email"]}
+    )
+    assert [a["id"] for a in response.get_json()["applications"]] == [1]
+
+
+def test_existing_account_owns_imported_application(app, admin_client, courses):
+    with app.app_context():
+        db.session.add(User(name="u", email="user0@example.com", password="x"))
+        db.session.commit()
+    row = application_payload(0, 2)
+    row["email"] = "user0@example.com"
+
+    report = import_file(admin_client, "applications", ndjson([row])).get_json()
+    assert report["imported"] == 1
+    with app.app_context():
+        assert db.session.get(Application, 1).user == 2
+
+
+def test_admin_email_is_rejected(app, admin_client, courses):
+    row = application_payload(0, 2)
+    row["email"] = "admin@gmail.com"
+
+    report = import_file(admin_client, "applications", ndjson([row])).get_json()
+    assert report["imported"] == 0
+    assert report["errors"][0]["errors"][0]["message"] == imports.NOT_AN_APPLICANT
+    with app.app_context():
+        assert Application.query.count() == 0
+        assert db.session.get(PreferredCourse, 2).applied_count == 0
+
+
+def test_email_taken_during_import_is_reported(
+    app, admin_client, courses, monkeypatch
+):
+    take_seats = imports._take_seats
+    raced = []
+
+    def race(candidates):
+        if not raced:
+            # Another user applies with the second row's email after the
+            # import checked it.
+            raced.append(True)
+            user = User(name="u", email="racer@example.com", password="x")
+            db.session.add(user)
+            db.session.flush()
+            data = ApplicationCreateSchema.model_validate(application_payload(1, 2))
+            db.session.add(Application(user=user.id, **data.model_dump()))
+            db.session.commit()
+        return take_seats(candidates)
+
+    monkeypatch.setattr(imports, "_take_seats", race)
+    rows = [application_payload(i, 2) for i in range(3)]
+
+    report = import_file(admin_client, "applications", ndjson(rows)).get_json()
+    assert report["imported"] == 2
+    assert report["errors"] == [
+        {
+            "line": 2,
+            "errors": [{"field": None, "message": imports.APPLICATION_EXISTS}],
+        }
+    ]
+    with app.app_context():
+        assert Application.query.count() == 3
+        assert db.session.get(PreferredCourse, 2).applied_count == 2
+
+
+def test_stale_seat_count_is_read_again(app, admin_client, courses, monkeypatch):
+    free_seats = imports._free_seats
+    stale = []
+
+    def race(course_ids):
+        free = free_seats(course_ids)
+        if not stale:
+            # Another request takes two of the three seats after the read.
+            stale.append(free)
+            db.session.execute(
+                PreferredCourse.__table__.update()
+                .where(PreferredCourse.id == 1)
+                .values(applied_count=2)
+            )
+        return free
+
+    monkeypatch.setattr(imports, "_free_seats", race)
+    rows = [application_payload(i, 1) for i in range(3)]
+
+    report = import_file(admin_client, "applications", ndjson(rows)).get_json()
+    assert stale == [{1: 3}]
+    assert report["imported"] == 1
+    assert {e["line"] for e in report["errors"]} == {2, 3}
+    with app.app_context():
+        assert db.session.get(PreferredCourse, 1).applied_count == 3
+
+
+def test_seats_are_taken_once_per_course_per_batch(app, admin_client, courses):
+    rows = [application_payload(i, 2) for i in range(8)]
+    with app.app_context():
+        with recorded_queries(app) as statements:
+            report = import_applications(
+                io.StringIO(ndjson(rows).decode()), "ndjson"
+            )
+    assert report.imported == 8
+    seat_updates = [s for s in statements if s.startswith("UPDATE preferred_course")]
+    assert len(seat_updates) == 1
+
+
+def test_cli_imports_file(app, courses, tmp_path):
+    path = tmp_path / "applications.ndjson"
+    path.write_bytes(ndjson([application_payload(i, 2) for i in range(2)]))
+
+    result = app.test_cli_runner().invoke(args=["import", "applications", str(path)])
+    assert "Imported 2 row(s), 0 failed." in result.output
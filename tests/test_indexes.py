@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.application.export import export_statement
+from app.application.models import (Application, ApplicationStatus, Document,
+                                    PreferredCourse)
+from app.application.queries import filter_applications
+from app.application.views import ApplicationListSchema
+from tests.config import test_config
+from tests.helpers import query_plan
+
+pytestmark = pytest.mark.skipif(
+    not test_config.SQLALCHEMY_DATABASE_URI.startswith("sqlite"),
+    reason="Query plans are checked on SQLite.",
+)
+
+
+def listing(**filters):
+    params = ApplicationListSchema(**filters)
+    return (
+        filter_applications(select(Application.id), params)
+        .where(Application.id > 10)
+        .order_by(Application.id)
+        .limit(50)
+    )
+
+
+@pytest.mark.parametrize(
+    "statement, index",
+    [
+        # The current user's application, looked up by nearly every endpoint.
+        (select(Application).where(Application.user == 1), "ix_applications_user"),
+        # A document of one type, looked up on every upload.
+        (
+            select(Document).where(
+                Document.application_id == 1, Document.document_type_id == 1
+            ),
+            "sqlite_autoindex_documents_1",
+        ),
+        (
+            select(func.count(Document.id)).where(Document.application_id == 1),
+            "sqlite_autoindex_documents_1",
+        ),
+        # Admin listing filtered by status or course, paged by id.
+        (listing(status=ApplicationStatus.PENDING), "ix_applications_status"),
+        (listing(preferred_course_id=1), "ix_applications_preferred_course_id"),
+        (
+            select(PreferredCourse.id, func.count(Application.id))
+            .join(Application)
+            .group_by(PreferredCourse.id),
+            "ix_applications_preferred_course_id",
+        ),
+    ],
+    ids=["user", "document-type", "documents", "status", "course", "course-join"],
+)
+def test_hot_lookups_use_an_index(app, statement, index):
+    with app.app_context():
+        plan = query_plan(statement)
+    assert f"INDEX {index}" in plan, plan
+
+
+def test_export_counts_documents_by_index(app):
+    with app.app_context():
+        plan = query_plan(export_statement(ApplicationListSchema()))
+    assert "SCAN documents" not in plan, plan
@@ -0,0 +1,162 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from flask.testing import FlaskClient
+
+from app.application import letters
+from app.application.admission_letter import LetterTemplate
+from app.application.letters import get_letter_queue, process_letter_jobs
+from app.application.models import Application, LetterJob, LetterStatus
+from app.extensions import db
+from tests.helpers import approve, seed_applications
+
+
+def test_approval_queues_letter_instead_of_rendering(
+    app, admin_client: FlaskClient, letter_dir
+):
+    seed_applications(app, 1)
+
+    response = approve(admin_client, 1)
+    assert response.status_code == 200
+    assert response.get_json()["letter_status"] == "Pending"
+    assert not list(letter_dir.iterdir())
+
+    with app.app_context():
+        assert process_letter_jobs() == 1
+        application = db.session.get(Application, 1)
+        assert application.letter_status == LetterStatus.READY
+        assert (letter_dir / application.admission_letter_path).read_bytes().startswith(b"%PDF")
+        assert LetterJob.query.one().status == LetterStatus.READY
+        assert process_letter_jobs() == 0
+
+
+def test_process_pool_renders_batch(app, admin_client: FlaskClient):
+    seed_applications(app, 3)
+    for application_id in (1, 2, 3):
+        approve(admin_client, application_id)
+
+    with app.app_context(), ProcessPoolExecutor(max_workers=2) as executor:
+        assert process_letter_jobs(executor=executor) == 3
+        statuses = {a.letter_status for a in Application.query.all()}
+    assert statuses == {LetterStatus.READY}
+
+
+def test_failed_render_is_retried_then_marked_failed(
+    app, admin_client: FlaskClient, monkeypatch
+):
+    app.config.update(LETTER_MAX_ATTEMPTS=2, LETTER_RETRY_DELAY=0)
+    seed_applications(app, 1)
+    approve(admin_client, 1)
+
+    def broken_render(self, pdf_path, student_info, admission_details):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(LetterTemplate, "render", broken_render)
+    with app.app_context():
+        process_letter_jobs()
+        assert db.session.get(Application, 1).letter_status == LetterStatus.PENDING
+
+        process_letter_jobs()
+        job = LetterJob.query.one()
+        assert job.status == LetterStatus.FAILED
+        assert job.attempts == 2
+        assert "disk full" in job.last_error
+        assert db.session.get(Application, 1).letter_status == LetterStatus.FAILED
+
+
+def test_abandoned_claims_stop_after_max_attempts(
+    app, admin_client: FlaskClient, monkeypatch
+):
+    app.config.update(LETTER_MAX_ATTEMPTS=2, LETTER_CLAIM_TIMEOUT=60)
+    seed_applications(app, 1)
+    approve(admin_client, 1)
+    clock = [letters.utcnow()]
+    monkeypatch.setattr(letters, "utcnow", lambda: clock[0])
+
+    with app.app_context():
+        queue = get_letter_queue()
+        claims = []
+        # The worker dies after every claim, so the claim expires each time.
+        for _ in range(3):
+            claims.append([job.attempts for job in queue.claim(10)])
+            clock[0] += timedelta(seconds=61)
+        assert claims == [[1], [2], []]
+
+        job = LetterJob.query.one()
+        assert job.status == LetterStatus.FAILED
+        assert job.last_error == letters.ABANDONED_ERROR
+        assert db.session.get(Application, 1).letter_status == LetterStatus.FAILED
+        assert queue.claim(10) == []
+
+
+def test_bulk_status_change(app, admin_client: FlaskClient):
+    course_ids = seed_applications(app, 6, course_count=2)
+    approve(admin_client, 1)
+
+    response = admin_client.put(
+        "/admin/applications/status",
+        json={"status": "Approved", "application_ids": [1, 2, 3, 99]},
+    )
+    assert response.status_code == 200
+    # 1 is already approved (terminal) and 99 does not exist.
+    assert response.get_json()["updated"] == 2
+
+    response = admin_client.put(
+        "/admin/applications/status",
+        json={
+            "status": "Rejected",
+            "filters": {"preferred_course_id": course_ids[1]},
+        },
+    )
+    # Course 1 holds 2, 4 and 6; 2 is now approved.
+    assert response.get_json()["updated"] == 2
+
+    with app.app_context():
+        statuses = {a.id: a.status.value for a in Application.query.all()}
+        assert statuses == {
+            1: "Approved",
+            2: "Approved",
+            3: "Approved",
+            4: "Rejected",
+            5: "Incomplete",
+            6: "Rejected",
+        }
+        assert sorted(j.application_id for j in LetterJob.query.all()) == [1, 2, 3]
+        assert process_letter_jobs() == 3
+        ready = {a.id for a in Application.query.all() if a.admission_letter_path}
+        assert ready == {1, 2, 3}
+
+
+def test_bulk_status_change_requires_one_target(admin_client: FlaskClient):
+    response = admin_client.put(
+        "/admin/applications/status", json={"status": "Rejected"}
+    )
+    assert response.status_code == 400
+
+
+def test_download_letter_supports_etag_and_range(
+    app, admin_client: FlaskClient, login_as
+):
+    seed_applications(app, 1)
+    approve(admin_client, 1)
+    with app.app_context():
+        process_letter_jobs()
+        user_id = db.session.get(Application, 1).user
+
+    client = login_as(user_id)
+
+    response = client.get("/user/letter")
+    assert response.status_code == 200
+    assert response.mimetype == "application/pdf"
+    assert response.data.startswith(b"%PDF")
+    assert "private" in response.headers["Cache-Control"]
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+
+    response = client.get("/user/letter", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    response = client.get("/user/letter", headers={"Range": "bytes=0-3"})
+    assert response.status_code == 206
+    assert response.data == b"%PDF"
@@ -0,0 +1,64 @@
+import logging
+import re
+
+from flask.testing import FlaskClient
+
+from app.application.models import PreferredCourse
+from app.extensions import db
+from tests.helpers import seed_applications
+
+
+def sample(text, metric, **labels):
+    label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    match = re.search(
+        rf"^{re.escape(metric)}{{{re.escape(label_text)}}} (\S+)$", text, re.M
+    )
+    return float(match.group(1)) if match else None
+
+
+def test_metrics_endpoint_reports_requests_and_statements(
+    app, admin_client: FlaskClient
+):
+    admin_client.get("/admin/courses")
+    admin_client.get("/admin/courses")
+
+    response = admin_client.get("/admin/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    endpoint = "admin_admin_course_list"
+    assert (
+        sample(text, "http_requests_total", endpoint=endpoint, method="GET", status=200)
+        == 2
+    )
+    # One course query each, plus loading the principal on the first.
+    assert sample(text, "db_statements_total", endpoint=endpoint) == 3
+    assert sample(text, "http_request_duration_seconds_count", endpoint=endpoint) == 2
+    assert (
+        sample(
+            text, "http_request_duration_seconds_bucket", endpoint=endpoint, le="+Inf"
+        )
+        == 2
+    )
+
+
+def test_repeated_statement_is_flagged(app, caplog):
+    @app.route("/n-plus-one")
+    def n_plus_one():
+        for course_id in range(6):
+            db.session.get(PreferredCourse, course_id + 1)
+        return "ok"
+
+    with caplog.at_level(logging.WARNING, logger="app.metrics"):
+        assert app.test_client().get("/n-plus-one").status_code == 200
+    assert "Possible N+1 query in n_plus_one" in caplog.text
+
+    metrics = app.extensions["metrics"]
+    assert metrics.endpoints["n_plus_one"].n_plus_one == 1
+    text = metrics.render_prometheus()
+    assert sample(text, "db_n_plus_one_total", endpoint="n_plus_one") == 1
+
+
+def test_metrics_require_admin(app, login_as):
+    seed_applications(app, 1)
+    assert login_as(2).get("/admin/metrics").status_code == 403
@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import select
+
+from app.application.models import Application
+from app.application.search import search_applications
+from app.extensions import db
+from tests.config import test_config
+from tests.helpers import query_plan, seed_applications
+
+pytestmark = pytest.mark.skipif(
+    not test_config.SQLALCHEMY_DATABASE_URI.startswith("sqlite"),
+    reason="checks the SQLite FTS5 index",
+)
+
+
+@pytest.fixture
+def applicants(app):
+    seed_applications(app, 4)
+    with app.app_context():
+        rows = {
+            1: ("Maria Fernandes", "maria.f@example.com", "+9779841000001", "Xavier"),
+            2: ("Mariam Khan", "mk@example.com", "+9779841000002", "Trinity College"),
+            3: ("John Marr", "john@example.com", "+15550100", "Maria College"),
+            4: ("Ana Lopez", "ana_l@example.com", "+15550200", "Trinity College"),
+        }
+        for id_, (name, email, phone, institution) in rows.items():
+            application = db.session.get(Application, id_)
+            application.full_name = name
+            application.email = email
+            application.phone_number = phone
+            application.institution_name = institution
+        db.session.commit()
+
+
+def search(admin_client, q, **params):
+    return admin_client.get(
+        "/admin/applications/search", query_string={"q": q, **params}
+    )
+
+
+def ids(response):
+    return [a["id"] for a in response.get_json()["applications"]]
+
+
+def test_partial_terms_match_any_column(admin_client, applicants):
+    assert sorted(ids(search(admin_client, "ari"))) == [1, 2, 3]
+    assert ids(search(admin_client, "9841000002")) == [2]
+    assert ids(search(admin_client, "ana_l@")) == [4]
+    assert sorted(ids(search(admin_client, "TRINITY"))) == [2, 4]
+    # Terms are ANDed.
+    assert ids(search(admin_client, "trinity khan")) == [2]
+    assert ids(search(admin_client, "nobody")) == []
+
+
+def test_name_matches_rank_above_institution(admin_client, applicants):
+    # 3 only matches through its institution, "Maria College".
+    assert ids(search(admin_client, "maria"))[-1] == 3
+
+
+def test_results_are_paginated(admin_client, applicants):
+    first = search(admin_client, "example.com", limit=3).get_json()
+    assert len(first["applications"]) == 3
+    second = search(admin_client, "example.com", limit=3, cursor=first["next_cursor"])
+    assert second.get_json()["next_cursor"] is None
+    seen = ids(second) + [a["id"] for a in first["applications"]]
+    assert sorted(seen) == [1, 2, 3, 4]
+
+
+def test_listing_filters_apply(admin_client, applicants):
+    assert ids(search(admin_client, "trinity", status="Pending")) == []
+
+
+@pytest.mark.parametrize("q", ["", "ab", "a b"])
+def test_short_queries_are_rejected(admin_client, applicants, q):
+    assert search(admin_client, q).status_code == 400
+
+
+def test_index_follows_updates_and_deletes(app, admin_client, applicants):
+    with app.app_context():
+        db.session.get(Application, 1).full_name = "Renamed Person"
+        db.session.delete(db.session.get(Application, 4))
+        db.session.commit()
+
+    assert ids(search(admin_client, "fernandes")) == []
+    assert ids(search(admin_client, "renamed")) == [1]
+    assert ids(search(admin_client, "ana_l")) == []
+
+
+def test_search_uses_fts_index(app, applicants):
+    with app.app_context():
+        query = search_applications(select(Application.id), ["maria"], "sqlite")
+        plan = query_plan(query)
+    assert "VIRTUAL TABLE INDEX" in plan
+    assert "SCAN applications" not in plan.replace("SCAN applications_fts", "")
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import create_app
+from app.application.models import Application, PreferredCourse
+from app.application.seats import reserve_seat
+from app.authentication.models import User
+from app.config import AppConfig
+from app.extensions import bootstrap, db
+from tests.helpers import application_payload
+
+# 1000 concurrent creates take about 6 s; LOAD_TEST_REQUESTS=5000 (about
+# 25 s) is the heavier run. Throughput is measured by the
+# user_create_application_one_course benchmark scenario, not here.
+REQUESTS = int(os.environ.get("LOAD_TEST_REQUESTS", 1000))
+WORKERS = int(os.environ.get("LOAD_TEST_WORKERS", 16))
+SEATS = 5
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    # An in-memory database is a single shared connection, which would hide
+    # any race; a file database gives every thread its own connection.
+    app = create_app(
+        AppConfig(
+            SECRET_KEY="this-is-secret",
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'load.db'}",
+            TESTING=True,
+        )
+    )
+    with app.app_context():
+        bootstrap()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_reserve_seat_stops_at_capacity(app):
+    with app.app_context():
+        course = PreferredCourse(
+            course_name="Tiny", max_applications_count=2, applied_count=0
+        )
+        db.session.add(course)
+        db.session.commit()
+        assert [reserve_seat(course.id) for _ in range(3)] == [True, True, False]
+        db.session.commit()
+        assert db.session.get(PreferredCourse, course.id).applied_count == 2
+
+
+def test_duplicate_email_is_reported(app, login_as):
+    with app.app_context():
+        course = PreferredCourse(
+            course_name="Open", max_applications_count=5, applied_count=0
+        )
+        users = [
+            User(name=f"u{i}", email=f"u{i}@example.com", password="x")
+            for i in (1, 2)
+        ]
+        db.session.add(course)
+        db.session.add_all(users)
+        db.session.commit()
+        course_id = course.id
+        first, second = (login_as(user.id) for user in users)
+
+    payload = application_payload(1, course_id)
+    assert first.post("/user/applications", json=payload).status_code == 201
+    response = first.post("/user/applications", json=payload)
+    assert response.get_json()["message"] == (
+        "Application already exists for this user."
+    )
+    response = second.post("/user/applications", json=payload)
+    assert response.status_code == 400
+    assert response.get_json()["message"] == (
+        "An application with this email already exists."
+    )
+    with app.app_context():
+        assert db.session.get(PreferredCourse, course_id).applied_count == 1
+
+
+def test_parallel_creates_never_oversubscribe(file_app):
+    with file_app.app_context():
+        course = PreferredCourse(
+            course_name="Popular", max_applications_count=SEATS, applied_count=0
+        )
+        users = [
+            User(name=f"u{i}", email=f"u{i}@example.com", password="x")
+            for i in range(REQUESTS)
+        ]
+        db.session.add(course)
+        db.session.add_all(users)
+        db.session.commit()
+        course_id = course.id
+        user_ids = [user.id for user in users]
+
+    def submit(i):
+        client = file_app.test_client()
+        with client.session_transaction() as sess:
+            sess["_user_id"] = str(user_ids[i])
+        return client.post(
+            "/user/applications", json=application_payload(i, course_id)
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        statuses = list(pool.map(submit, range(REQUESTS)))
+
+    assert statuses.count(201) == SEATS
+    assert statuses.count(400) == REQUESTS - SEATS
+    with file_app.app_context():
+        assert db.session.get(PreferredCourse, course_id).applied_count == SEATS
+        assert Application.query.count() == SEATS
@@ -1,4 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import inspect
+
+from app import create_app
+from app.authentication.models import User
+from app.config import AppConfig
+from app.extensions import db
+
+# Needed only by CLI commands or letter rendering, not by web workers.
+HEAVY_MODULES = ("alembic", "flask_migrate", "reportlab")
+
+
 def test_home_route(client):
     response = client.get("/hello")
     assert response.status_code == 200
     assert b"Hello Flask" in response.data
+
+
+def test_create_app_leaves_database_untouched(tmp_path):
+    app = create_app(
+        AppConfig(
+            SECRET_KEY="this-is-secret",
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'boot.db'}",
+        )
+    )
+    with app.app_context():
+        assert inspect(db.engine).get_table_names() == []
+
+        runner = app.test_cli_runner()
+        for _ in range(2):
+            result = runner.invoke(args=["bootstrap"])
+            assert result.exit_code == 0, result.output
+        assert User.query.filter_by(email="admin@gmail.com").count() == 1
+        db.engine.dispose()
+
+
+def test_heavy_modules_are_imported_lazily():
+    code = f"import sys, app; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.strip() == "[]"
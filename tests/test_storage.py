@@ -0,0 +1,101 @@
+import pickle
+
+import pytest
+from flask.testing import FlaskClient
+
+from app.application.letters import process_letter_jobs
+from app.application.models import Application
+from app.application.storage import LocalStorage, S3Storage
+from app.extensions import db
+from tests.helpers import seed_applications
+
+
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    pytest.importorskip("boto3")
+    moto_server = pytest.importorskip("moto.server")
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def s3_storage(s3_endpoint, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    storage = S3Storage(
+        "admissions", prefix="letters/", endpoint_url=s3_endpoint, region="us-east-1"
+    )
+    storage.client.create_bucket(Bucket="admissions")
+    yield storage
+    for obj in storage.client.list_objects_v2(Bucket="admissions").get("Contents", []):
+        storage.client.delete_object(Bucket="admissions", Key=obj["Key"])
+    storage.client.delete_bucket(Bucket="admissions")
+
+
+@pytest.fixture(params=["local", "s3"])
+def storage(request, tmp_path):
+    if request.param == "local":
+        return LocalStorage(tmp_path)
+    return request.getfixturevalue("s3_storage")
+
+
+def test_write_read_and_delete(storage, tmp_path):
+    with storage.open_write("ab/cd/object") as f:
+        f.write(b"0123456789")
+    assert storage.stat("ab/cd/object").size == 10
+    with storage.open_read("ab/cd/object") as f:
+        assert f.read() == b"0123456789"
+    with storage.open_read("ab/cd/object", 2, 5) as f:
+        assert f.read() == b"2345"
+
+    source = tmp_path / "upload.part"
+    source.write_bytes(b"moved")
+    storage.put_file("other", source)
+    with storage.open_read("other") as f:
+        assert f.read() == b"moved"
+
+    storage.delete("ab/cd/object")
+    storage.delete("ab/cd/object")
+    assert storage.stat("ab/cd/object") is None
+    assert not storage.exists("ab/cd/object")
+
+
+def test_failed_write_is_not_published(storage):
+    with pytest.raises(RuntimeError):
+        with storage.open_write("partial") as f:
+            f.write(b"half")
+            raise RuntimeError("render failed")
+    assert not storage.exists("partial")
+
+
+def test_s3_storage_pickles_without_client(s3_storage):
+    clone = pickle.loads(pickle.dumps(s3_storage))
+    assert clone._client is None
+    assert clone.bucket == s3_storage.bucket
+
+
+def test_letter_download_from_s3(app, admin_client: FlaskClient, login_as, s3_storage):
+    app.extensions["storage"] = {"letters": s3_storage}
+    seed_applications(app, 1)
+    admin_client.put("/admin/applications/1/status", data={"status": "Approved"})
+    with app.app_context():
+        assert process_letter_jobs() == 1
+        user_id = db.session.get(Application, 1).user
+    assert s3_storage.exists("1_admission_letter.pdf")
+
+    client = login_as(user_id)
+    response = client.get("/user/letter")
+    assert response.status_code == 200
+    body = response.get_data()
+    assert body.startswith(b"%PDF")
+    assert "private" in response.headers["Cache-Control"]
+
+    etag = response.headers["ETag"]
+    assert client.get("/user/letter", headers={"If-None-Match": etag}).status_code == 304
+
+    response = client.get("/user/letter", headers={"Range": "bytes=5-14"})
+    assert response.status_code == 206
+    assert response.get_data() == body[5:15]